@@ -0,0 +1,51 @@
+"""对比回溯搜索(DFS)与舞蹈链(DLX)在低 edge_types 拼图上枚举全部解的耗时
+
+用法: python -m benchmarks.bench_dlx [--repeat N]
+"""
+from typing import List, Optional
+import argparse
+import random
+import time
+from src.generators.puzzle_generator import PuzzleGenerator
+from src.models.puzzle import JigsawPuzzle
+from src.solvers.dlx_solver import DancingLinksSolver
+from src.solvers.puzzle_solver import PuzzleSolver
+
+CASES = [(3, 3, 1), (3, 3, 2), (4, 4, 2), (4, 4, 3), (3, 6, 2), (5, 5, 3)]
+
+
+def build_puzzle(rows: int, cols: int, edge_types: int, seed: int) -> JigsawPuzzle:
+    random.seed(seed)
+    puzzle = JigsawPuzzle(rows, cols)
+    for piece in PuzzleGenerator().generate_solvable_puzzle(rows, cols, edge_types):
+        puzzle.add_piece(piece)
+    puzzle.shuffle()
+    return puzzle
+
+
+def time_enumeration(solver_class: type, puzzle: JigsawPuzzle) -> tuple:
+    """枚举全部解，计时包含求解器的构建"""
+    start = time.perf_counter()
+    solver = solver_class(puzzle)
+    count = sum(1 for _ in solver.find_all_solutions(max_solutions=10**9))
+    return count, time.perf_counter() - start
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="DFS 与 DLX 全部解枚举耗时对比")
+    parser.add_argument('--repeat', type=int, default=3, help="每种规格使用的随机拼图数量")
+    args = parser.parse_args(argv)
+
+    print(f"{'规格':>10} {'edge_types':>10} {'解数量':>8} {'DFS(s)':>10} {'DLX(s)':>10} {'加速比':>8}")
+    for rows, cols, edge_types in CASES:
+        for seed in range(args.repeat):
+            puzzle = build_puzzle(rows, cols, edge_types, seed)
+            dfs_count, dfs_time = time_enumeration(PuzzleSolver, puzzle)
+            dlx_count, dlx_time = time_enumeration(DancingLinksSolver, puzzle)
+            assert dfs_count == dlx_count, "两种求解器的解数量不一致"
+            print(f"{rows:>4}x{cols:<5} {edge_types:>10} {dfs_count:>8} "
+                  f"{dfs_time:>10.4f} {dlx_time:>10.4f} {dfs_time / dlx_time:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""流式生成大尺寸拼图并直接写入二进制文件的吞吐量和内存峰值
+
+write_binary 逐行生成和写出，内存占用只与列数有关，10000x10000 的拼图同样适用。
+
+用法: python -m benchmarks.bench_generator [--rows N] [--cols N] [--output 文件]
+"""
+from typing import List, Optional
+import argparse
+import os
+import random
+import resource
+import time
+from src.generators.puzzle_generator import PuzzleGenerator
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="流式生成拼图的吞吐量和内存峰值")
+    parser.add_argument('--rows', type=int, default=10000, help="行数")
+    parser.add_argument('--cols', type=int, default=10000, help="列数")
+    parser.add_argument('--edge-types', type=int, default=3, help="边缘值种类数")
+    parser.add_argument('--output', default=os.devnull, help="输出文件，默认丢弃")
+    parser.add_argument('--seed', type=int, default=0, help="随机数种子")
+    args = parser.parse_args(argv)
+
+    random.seed(args.seed)
+    start = time.perf_counter()
+    with open(args.output, 'wb') as stream:
+        count = PuzzleGenerator().write_binary(stream, args.rows, args.cols, args.edge_types)
+    elapsed = time.perf_counter() - start
+    # Linux 上 ru_maxrss 的单位为KB
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{args.rows}x{args.cols}: {count} 个拼图片, {elapsed:.1f} s, "
+          f"{count / elapsed:,.0f} 片/秒, 内存峰值 {peak:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
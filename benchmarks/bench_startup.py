@@ -0,0 +1,81 @@
+"""冷启动耗时: 在新的解释器进程中 `import src` 并求解一个3x3拼图
+
+命令行调用和短生命周期的工作进程每次都要承担这部分开销。
+超出预算时以非零状态退出，可以直接用于持续集成。
+
+用法: python -m benchmarks.bench_startup [--repeat N] [--budget 秒]
+"""
+from typing import List, Optional, Tuple
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# 冷启动加上3x3求解的耗时预算(秒)，不含解释器本身的启动时间
+BUDGET = 0.25
+
+# 只求解一个拼图时不应该被导入的模块
+HEAVY_MODULES = ('multiprocessing', 'concurrent.futures', 'http.server', 'statistics',
+                 'tempfile', 'numpy', 'src.server', 'src.solvers.sat_solver')
+
+SNIPPET = """
+import json, random, sys
+import src
+random.seed(0)
+puzzle = src.JigsawPuzzle(3, 3)
+for piece in src.PuzzleGenerator().generate_solvable_puzzle(3, 3, 2):
+    puzzle.add_piece(piece)
+puzzle.shuffle()
+assert next(src.PuzzleSolver(puzzle).find_all_solutions(max_solutions=1), None)
+print(json.dumps(sorted(sys.modules)))
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code: str) -> Tuple[float, str]:
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True,
+                            text=True, check=True)
+    return time.perf_counter() - start, result.stdout
+
+
+def cold_start(repeat: int = 5) -> Tuple[float, List[str]]:
+    """测量冷启动耗时
+
+    Returns:
+        (多次测量中最短的耗时减去空解释器的启动耗时, 求解后已导入的模块)
+    """
+    baseline = min(_run('pass')[0] for _ in range(repeat))
+    runs = [_run(SNIPPET) for _ in range(repeat)]
+    elapsed = min(seconds for seconds, _ in runs) - baseline
+    return max(elapsed, 0.0), json.loads(runs[-1][1])
+
+
+def heavy_modules(modules: List[str]) -> List[str]:
+    """modules 中属于 HEAVY_MODULES(包括其子模块)的模块"""
+    return [name for name in modules
+            if any(name == heavy or name.startswith(heavy + '.') for heavy in HEAVY_MODULES)]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="import src 加3x3求解的冷启动耗时")
+    parser.add_argument('--repeat', type=int, default=5, help="测量次数，取最短耗时")
+    parser.add_argument('--budget', type=float, default=BUDGET, help="耗时预算(秒)")
+    args = parser.parse_args(argv)
+
+    elapsed, modules = cold_start(args.repeat)
+    heavy = heavy_modules(modules)
+    print(f"冷启动+3x3求解: {elapsed * 1000:.1f} ms (预算 {args.budget * 1000:.0f} ms)")
+    print(f"已导入模块: {len(modules)}")
+    if heavy:
+        print(f"不应导入的模块: {', '.join(heavy)}")
+    if elapsed > args.budget or heavy:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""对比完整求解与分块并行求解在接缝值基本唯一的大拼图上求出一个解的耗时
+
+接缝值从 [1, spread * 拼图片数量) 中有放回地随机抽取，少量重复的接缝值使贪心拼接失效，
+完整求解需要回溯，分块求解需要在子区域边界上局部修复。
+
+用法: python -m benchmarks.bench_tile [--processes N] [--repeat N]
+"""
+from typing import List, Optional
+import argparse
+import os
+import random
+import time
+from src.models.direction import Direction
+from src.models.piece import JigsawPiece
+from src.models.puzzle import JigsawPuzzle
+from src.solvers.puzzle_solver import PuzzleSolver
+from src.solvers.tile_solver import TileSolver
+
+# (行数, 列数, spread)
+CASES = [(64, 64, 20), (96, 96, 20), (128, 128, 50)]
+
+
+def build_puzzle(rows: int, cols: int, spread: int, seed: int) -> JigsawPuzzle:
+    random.seed(seed)
+
+    def seam() -> int:
+        return random.randrange(1, spread * rows * cols) * random.choice((1, -1))
+
+    right = [[seam() for _ in range(cols)] for _ in range(rows)]
+    down = [[seam() for _ in range(cols)] for _ in range(rows)]
+    puzzle = JigsawPuzzle(rows, cols)
+    for row in range(rows):
+        for col in range(cols):
+            is_corner = row in (0, rows - 1) and col in (0, cols - 1)
+            is_edge = row in (0, rows - 1) or col in (0, cols - 1)
+            puzzle.add_piece(JigsawPiece(row * cols + col, {
+                Direction.UP: 0 if row == 0 else -down[row - 1][col],
+                Direction.RIGHT: 0 if col == cols - 1 else right[row][col],
+                Direction.DOWN: 0 if row == rows - 1 else down[row][col],
+                Direction.LEFT: 0 if col == 0 else -right[row][col - 1],
+            }, is_corner=is_corner, is_edge=is_edge))
+    puzzle.shuffle()
+    return puzzle
+
+
+def time_first_solution(solver: PuzzleSolver) -> float:
+    """求出一个解的耗时，计时包含分块求解的进程启动"""
+    start = time.perf_counter()
+    solution = next(solver.find_all_solutions(max_solutions=1), None)
+    assert solution is not None, "没有求出解"
+    return time.perf_counter() - start
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="完整求解与分块并行求解的耗时对比")
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1, help="分块求解的进程数量")
+    parser.add_argument('--repeat', type=int, default=1, help="每种规格使用的随机拼图数量")
+    args = parser.parse_args(argv)
+
+    print(f"{'规格':>10} {'spread':>8} {'完整(s)':>10} {'分块x1(s)':>10} "
+          f"{f'分块x{args.processes}(s)':>12} {'加速比':>8}")
+    for rows, cols, spread in CASES:
+        for seed in range(args.repeat):
+            puzzle = build_puzzle(rows, cols, spread, seed)
+            serial = time_first_solution(PuzzleSolver(puzzle))
+            single = time_first_solution(TileSolver(puzzle, processes=1))
+            parallel = time_first_solution(TileSolver(puzzle, processes=args.processes))
+            print(f"{rows:>4}x{cols:<5} {spread:>8} {serial:>10.3f} {single:>10.3f} "
+                  f"{parallel:>12.3f} {serial / parallel:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
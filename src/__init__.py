@@ -1,6 +1,23 @@
-from .models import Direction, JigsawPiece, JigsawPuzzle
-from .generators import PuzzleGenerator
-from .solvers import PuzzleSolver
+"""拼图游戏
+
+公开的名称在首次访问时才导入对应的模块，见 _lazy.lazy_module_attrs。
+"""
+from typing import TYPE_CHECKING
+from ._lazy import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from .generators import PuzzleGenerator
+    from .models import Direction, JigsawPiece, JigsawPuzzle
+    from .solvers import PuzzleSolver
+
+# 公开名称 -> 定义它的模块
+_LAZY_ATTRIBUTES = {
+    'Direction': '.models.direction',
+    'JigsawPiece': '.models.piece',
+    'JigsawPuzzle': '.models.puzzle',
+    'PuzzleGenerator': '.generators.puzzle_generator',
+    'PuzzleSolver': '.solvers.puzzle_solver',
+}
 
 __all__ = [
     'Direction',
@@ -8,4 +25,7 @@ __all__ = [
     'JigsawPuzzle',
     'PuzzleGenerator',
     'PuzzleSolver'
-] 
\ No newline at end of file
+]
+
+
+__getattr__, __dir__ = lazy_module_attrs(_LAZY_ATTRIBUTES, globals())
@@ -0,0 +1,32 @@
+from typing import Any, Callable, Dict, List, Tuple
+import importlib
+
+
+def lazy_module_attrs(mapping: Dict[str, str], namespace: Dict[str, Any]
+                      ) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """为包生成按需导入的模块级 __getattr__ 和 __dir__(PEP 562)
+
+    公开名称在首次访问时才导入定义它的模块，之后缓存在包的命名空间中。
+    这样导入包本身几乎没有开销，短生命周期的命令行调用和工作进程只为用到的部分付出导入代价。
+
+    用法(在包的 __init__.py 中):
+        __getattr__, __dir__ = lazy_module_attrs(_LAZY_ATTRIBUTES, globals())
+
+    Args:
+        mapping: 公开名称 -> 定义它的模块(相对于包的导入路径)
+        namespace: 包的 globals()，需要已经定义 __all__
+    """
+    package = namespace['__name__']
+
+    def __getattr__(name: str) -> Any:
+        module = mapping.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(namespace['__all__']))
+
+    return __getattr__, __dir__
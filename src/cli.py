@@ -0,0 +1,240 @@
+"""命令行批量求解
+
+用法:
+    jigsaw solve puzzles.jsonl --jobs 4 --max-solutions 1 --stats
+    cat puzzles.bin | jigsaw solve --order completion --timeout 10
+
+输入为每行一个拼图的JSONL(puzzle_to_dict 格式)或连续存放的多个二进制拼图，默认自动识别。
+输出为NDJSON，格式与求解服务相同: 每个解一行 {"puzzle": i, "solution": [...]}，
+每个拼图结束时一行 {"puzzle": i, "done": true, "count": n, "error": ..., "timed_out": ...}。
+拼图逐个读取，同时在途的拼图数量有上限，因此内存占用与输入的长度无关。
+"""
+from typing import Any, BinaryIO, Callable, Dict, IO, Iterator, List, Optional, Set, Tuple, cast
+import argparse
+import io
+import json
+import queue
+import sys
+import time
+from .serialization.puzzle_codec import (
+    BINARY_MAGIC,
+    is_binary,
+    iter_decode_puzzles,
+    puzzle_from_dict,
+    puzzle_to_dict,
+)
+
+DEFAULT_MAX_SOLUTIONS = 1000
+
+# 每个求解进程最多对应的在途拼图数量
+WINDOW_PER_JOB = 4
+
+# 输入项: (puzzle_to_dict 格式的拼图, 解析错误)，两者恰好有一个为None
+InputItem = Tuple[Optional[Dict[str, Any]], Optional[str]]
+
+
+def iter_inputs(stream: BinaryIO, fmt: str = 'auto') -> Iterator[InputItem]:
+    """逐个读取输入流中的拼图
+
+    JSONL 中无法解析的行作为带错误信息的输入项返回，不影响后续的行；
+    二进制数据损坏时无法定位下一个拼图，直接抛出 ValueError。
+    """
+    if not hasattr(stream, 'peek'):
+        stream = io.BufferedReader(cast(io.RawIOBase, stream))
+    if fmt == 'auto':
+        fmt = 'binary' if is_binary(stream.peek(len(BINARY_MAGIC))) else 'jsonl'
+    if fmt == 'binary':
+        for puzzle in iter_decode_puzzles(stream):
+            yield puzzle_to_dict(puzzle), None
+        return
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+            # 提前还原一次，格式错误在提交之前就能报告
+            puzzle_from_dict(data)
+        except (ValueError, KeyError, TypeError) as exc:
+            yield None, f"无效的拼图数据: {exc}"
+            continue
+        yield data, None
+
+
+def _solve_inline(puzzle_data: Dict[str, Any], max_solutions: int,
+                  timeout: Optional[float]) -> Iterator[Tuple[bool, Any]]:
+    """在当前进程中求解，依次产生 (是否结束, 解决方案或结束信息)"""
+    from .solvers.puzzle_solver import PuzzleSolver
+
+    count = 0
+    error = None
+    timed_out = False
+    try:
+        solver = PuzzleSolver(puzzle_from_dict(puzzle_data))
+        for solution in solver.find_all_solutions(max_solutions=max_solutions, timeout=timeout):
+            yield False, solution
+            count += 1
+    except TimeoutError:
+        timed_out = True
+    except Exception as exc:  # 单个拼图失败不影响其他拼图
+        error = f"{type(exc).__name__}: {exc}"
+    yield True, {'count': count, 'error': error, 'timed_out': timed_out}
+
+
+class _ResultWriter:
+    """按输入顺序或完成顺序写出结果行
+
+    按输入顺序输出时，排在最前面的未完成拼图的结果直接写出，
+    后面的拼图的结果先缓存起来，等它前面的拼图全部结束后再写出。
+    """
+
+    def __init__(self, out: IO[str], ordered: bool):
+        self.out = out
+        self.ordered = ordered
+        self.released = 0     # 结果已经全部写出的拼图数量
+        self._pending: Dict[int, List[str]] = {}
+        self._finished: Set[int] = set()
+        self.stats: Dict[str, Any] = {'puzzles': 0, 'solutions': 0, 'timed_out': 0, 'errors': 0}
+
+    def solution(self, index: int, solution: List[Tuple[int, int, int, int]]) -> None:
+        self.stats['solutions'] += 1
+        self._emit(index, {'puzzle': index, 'solution': [list(p) for p in solution]}, False)
+
+    def done(self, index: int, payload: Dict[str, Any]) -> None:
+        self.stats['puzzles'] += 1
+        self.stats['timed_out'] += bool(payload.get('timed_out'))
+        self.stats['errors'] += payload.get('error') is not None
+        self._emit(index, {'puzzle': index, 'done': True, **payload}, True)
+
+    def _emit(self, index: int, record: Dict[str, Any], done: bool) -> None:
+        line = json.dumps(record, separators=(',', ':')) + '\n'
+        if not self.ordered or index == self.released:
+            self.out.write(line)
+            if done:
+                self.released += 1
+                self.out.flush()
+                if self.ordered:
+                    self._drain()
+            return
+        self._pending.setdefault(index, []).append(line)
+        if done:
+            self._finished.add(index)
+
+    def _drain(self) -> None:
+        """写出排到最前面的拼图已经缓存的结果"""
+        while self.released in self._pending:
+            self.out.writelines(self._pending.pop(self.released))
+            if self.released not in self._finished:
+                break
+            self._finished.discard(self.released)
+            self.released += 1
+        self.out.flush()
+
+
+def solve_stream(stream: BinaryIO, out: IO[str], jobs: int = 1, ordered: bool = True,
+                 max_solutions: int = DEFAULT_MAX_SOLUTIONS, timeout: Optional[float] = None,
+                 fmt: str = 'auto') -> Dict[str, Any]:
+    """求解输入流中的所有拼图，把结果以NDJSON写入 out
+
+    Args:
+        stream: 输入的二进制流
+        out: 输出的文本流
+        jobs: 求解进程数量，为1时在当前进程中求解
+        ordered: True 按输入顺序输出，False 按完成顺序输出
+        max_solutions: 每个拼图的最大解决方案数量
+        timeout: 每个拼图的求解超时时间(秒)
+        fmt: 输入格式，'auto'、'jsonl' 或 'binary'
+
+    Returns:
+        Dict[str, Any]: 拼图数、解数量、超时和出错的拼图数、耗时和吞吐量
+    """
+    start = time.monotonic()
+    writer = _ResultWriter(out, ordered)
+    inputs = iter_inputs(stream, fmt)
+    if jobs <= 1:
+        for index, (puzzle_data, error) in enumerate(inputs):
+            if puzzle_data is None:
+                writer.done(index, {'count': 0, 'error': error, 'timed_out': False})
+                continue
+            for finished, payload in _solve_inline(puzzle_data, max_solutions, timeout):
+                if finished:
+                    writer.done(index, payload)
+                else:
+                    writer.solution(index, payload)
+    else:
+        from .server.worker_pool import DONE, SolverWorkerPool
+
+        listener: queue.Queue = queue.Queue()
+        indices: Dict[int, int] = {}
+        submitted = 0
+        exhausted = False
+        with SolverWorkerPool(jobs) as pool:
+            while True:
+                while not exhausted and submitted - writer.released < jobs * WINDOW_PER_JOB:
+                    item = next(inputs, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    index, submitted = submitted, submitted + 1
+                    puzzle_data, error = item
+                    if puzzle_data is None:
+                        writer.done(index, {'count': 0, 'error': error, 'timed_out': False})
+                        continue
+                    job_id, _ = pool.submit(puzzle_data, max_solutions, listener, timeout)
+                    indices[job_id] = index
+                if exhausted and not indices:
+                    break
+                if not indices:
+                    continue
+                kind, job_id, payload = listener.get()
+                if kind == DONE:
+                    writer.done(indices.pop(job_id), payload)
+                else:
+                    writer.solution(indices[job_id], payload)
+
+    stats = dict(writer.stats)
+    stats['elapsed_s'] = time.monotonic() - start
+    stats['puzzles_per_s'] = stats['puzzles'] / stats['elapsed_s'] if stats['elapsed_s'] else 0.0
+    return stats
+
+
+def _solve_command(args: argparse.Namespace) -> int:
+    stream = sys.stdin.buffer if args.input == '-' else open(args.input, 'rb')
+    try:
+        stats = solve_stream(stream, sys.stdout, jobs=args.jobs, ordered=args.order == 'input',
+                             max_solutions=args.max_solutions, timeout=args.timeout,
+                             fmt=args.format)
+    except ValueError as exc:
+        print(f"jigsaw: {exc}", file=sys.stderr)
+        return 2
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+    if args.stats:
+        print(json.dumps(stats, ensure_ascii=False), file=sys.stderr)
+    return 1 if stats['errors'] else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='jigsaw', description="拼图命令行工具")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    solve = commands.add_parser('solve', help="批量求解JSONL或二进制格式的拼图")
+    solve.add_argument('input', nargs='?', default='-', help="输入文件，默认读取标准输入")
+    solve.add_argument('--format', choices=('auto', 'jsonl', 'binary'), default='auto',
+                       help="输入格式，默认自动识别")
+    solve.add_argument('--jobs', '-j', type=int, default=1, help="求解进程数量")
+    solve.add_argument('--order', choices=('input', 'completion'), default='input',
+                       help="按输入顺序或完成顺序输出")
+    solve.add_argument('--max-solutions', type=int, default=DEFAULT_MAX_SOLUTIONS,
+                       help="每个拼图的最大解决方案数量")
+    solve.add_argument('--timeout', type=float, default=None, help="每个拼图的求解超时时间(秒)")
+    solve.add_argument('--stats', action='store_true', help="结束时向标准错误输出统计信息")
+    solve.set_defaults(handler=_solve_command)
+
+    args = parser.parse_args(argv)
+    handler: Callable[[argparse.Namespace], int] = args.handler
+    return handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
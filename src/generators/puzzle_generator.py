@@ -1,10 +1,23 @@
-from typing import List, Dict, Set, Optional, Iterator
+from typing import BinaryIO, List, Dict, Set, Optional, Iterator, Tuple
 from itertools import product
+import math
 import random
 from src.models.direction import Direction
 from src.models.piece import JigsawPiece
 
+Edges = Tuple[int, int, int, int]
+
 class PuzzleGenerator:
+    # 解数量的估计为0(所有随机路径都走入死路)且估计的搜索树不超过这个节点数时，改为精确计数
+    EXACT_COUNT_NODES = 50000
+
+    # 难度目标与估计结果中对应的键
+    DIFFICULTY_TARGETS = {
+        'nodes': 'nodes',
+        'solutions': 'solutions',
+        'candidates': 'mean_candidates',
+    }
+
     @staticmethod
     def generate_edge_values(edge_types: int = 3) -> List[int]:
         """生成有效的边缘值列表"""
@@ -21,38 +34,182 @@ class PuzzleGenerator:
     
     def generate_solvable_puzzle(self, rows: int, cols: int, edge_types: int = 3) -> List[JigsawPiece]:
         """生成一个可解的拼图"""
+        return list(self.iter_pieces(rows, cols, edge_types))
+
+    @staticmethod
+    def _check_size(rows: int, cols: int) -> None:
+        """检查拼图尺寸，太小时抛出 ValueError"""
         if rows < 2 or cols < 2:
             raise ValueError("拼图必须至少是2x2的大小")
-            
-        pieces: List[JigsawPiece] = []
-        piece_id = 0
+
+    def iter_rows(self, rows: int, cols: int, edge_types: int = 3) -> Iterator[List[Edges]]:
+        """逐行生成一个可解拼图的边缘值
+
+        每个位置的上边和左边由上方和左侧的邻居决定，下边和右边随机生成。
+        只保留上一行各列的下边缘值，内存占用与行数无关，可以生成任意多行的拼图。
+        与 generate_solvable_puzzle 使用相同的随机数序列，同一个随机数种子生成同样的拼图。
+
+        Yields:
+            List[Edges]: 一行中每个位置未旋转时的 (上, 右, 下, 左) 边缘值
+        """
+        self._check_size(rows, cols)
         edge_values = self.generate_edge_values(edge_types)
-        
-        # 为每个位置创建拼图片
+        choice = random.choice
+        above = [0] * cols  # 上一行每列的下边缘值，第一行上方视为平边
         for row in range(rows):
+            last = row == rows - 1
+            current: List[Edges] = []
+            left = 0
             for col in range(cols):
-                edges = {}
+                down = 0 if last else choice(edge_values)
+                right = choice(edge_values) if col < cols - 1 else 0
+                current.append((-above[col], right, down, -left))
+                above[col] = down
+                left = right
+            yield current
+
+    def iter_pieces(self, rows: int, cols: int, edge_types: int = 3) -> Iterator[JigsawPiece]:
+        """按行优先顺序逐个生成可解拼图的拼图片，内存占用只与列数有关"""
+        piece_id = 0
+        for row, edges_row in enumerate(self.iter_rows(rows, cols, edge_types)):
+            for col, (up, right, down, left) in enumerate(edges_row):
                 is_corner = (row in (0, rows-1) and col in (0, cols-1))
                 is_edge = (row in (0, rows-1) or col in (0, cols-1)) and not is_corner
-                
-                # 上边
-                if row == 0:
-                    edges[Direction.UP] = 0  # 外边缘为平的
-                else:
-                    edges[Direction.UP] = -pieces[(row-1)*cols + col].get_edge(Direction.DOWN)
-                    
-                # 左边
-                if col == 0:
-                    edges[Direction.LEFT] = 0  # 外边缘为平的
-                else:
-                    edges[Direction.LEFT] = -pieces[row*cols + col-1].get_edge(Direction.RIGHT)
-                    
-                # 下边和右边可以随机生成
-                edges[Direction.DOWN] = random.choice(edge_values) if row < rows-1 else 0
-                edges[Direction.RIGHT] = random.choice(edge_values) if col < cols-1 else 0
-                
-                piece = self._create_puzzle_piece(piece_id, edges, is_corner, is_edge)
-                pieces.append(piece)
+                edges = {Direction.UP: up, Direction.RIGHT: right,
+                         Direction.DOWN: down, Direction.LEFT: left}
+                yield self._create_puzzle_piece(piece_id, edges, is_corner, is_edge)
                 piece_id += 1
-                
-        return pieces 
\ No newline at end of file
+
+    def write_binary(self, stream: BinaryIO, rows: int, cols: int, edge_types: int = 3) -> int:
+        """生成一个可解拼图并直接以二进制格式逐行写入 stream，不创建 JigsawPiece
+
+        写出的数据可以用 read_puzzle 或 decode_puzzle 读回。
+
+        Returns:
+            int: 写入的拼图片数量
+        """
+        from src.serialization.puzzle_codec import encode_header, encode_piece
+
+        # iter_rows 在第一次取值时才检查尺寸，写入文件头之前先检查，避免在 stream 中留下孤立的文件头
+        self._check_size(rows, cols)
+        stream.write(encode_header(rows, cols, rows * cols))
+        for row, edges_row in enumerate(self.iter_rows(rows, cols, edge_types)):
+            outer_row = row in (0, rows-1)
+            stream.write(b''.join(
+                encode_piece(row * cols + col, edges, 0,
+                             outer_row and col in (0, cols-1),
+                             outer_row or col in (0, cols-1))
+                for col, edges in enumerate(edges_row)))
+        return rows * cols
+
+    def _pieces_from_seams(self, rows: int, cols: int, right: List[List[int]],
+                           down: List[List[int]]) -> List[JigsawPiece]:
+        """按接缝值创建拼图片，right[r][c] 和 down[r][c] 是 (r, c) 右边和下边的边缘值"""
+        pieces: List[JigsawPiece] = []
+        for row in range(rows):
+            for col in range(cols):
+                edges = {
+                    Direction.UP: -down[row-1][col] if row > 0 else 0,
+                    Direction.RIGHT: right[row][col] if col < cols-1 else 0,
+                    Direction.DOWN: down[row][col] if row < rows-1 else 0,
+                    Direction.LEFT: -right[row][col-1] if col > 0 else 0,
+                }
+                is_corner = (row in (0, rows-1) and col in (0, cols-1))
+                is_edge = (row in (0, rows-1) or col in (0, cols-1)) and not is_corner
+                pieces.append(self._create_puzzle_piece(len(pieces), edges, is_corner, is_edge))
+        return pieces
+
+    def generate_with_difficulty(self, rows: int, cols: int, target_nodes: Optional[float] = None,
+                                 target_solutions: Optional[float] = None,
+                                 target_candidates: Optional[float] = None, edge_types: int = 2,
+                                 tolerance: float = 0.25, iterations: int = 12, particles: int = 64,
+                                 seed: Optional[int] = None
+                                 ) -> Tuple[List[JigsawPiece], Dict[str, float]]:
+        """生成一个可解的拼图，使其估计的求解难度接近目标
+
+        每条内部接缝以概率 p 从 edge_types 种公共边缘值中取值，否则取一个只属于这条接缝的唯一值。
+        p 越大，每个位置能接上的候选越多，解的数量和回溯搜索的代价也越大。
+        对 p 做二分查找，每一步用一组随机路径估计难度(SearchCostEstimator.population_estimate)而不实际求解；
+        所有步骤共用同一组随机数，因此估计值随 p 大致单调变化。
+
+        Args:
+            rows: 行数
+            cols: 列数
+            target_nodes: 目标回溯搜索节点数
+            target_solutions: 目标解数量
+            target_candidates: 目标平均每个位置的候选数
+            edge_types: 公共边缘值的种类数
+            tolerance: 允许的相对误差，达到后提前结束查找
+            iterations: 二分查找的最多步数
+            particles: 每次估计使用的随机路径数
+            seed: 随机数种子，None 时使用全局随机数生成器产生种子
+
+        Returns:
+            (拼图片, 估计结果): 拼图片按行优先顺序排列；估计结果为 population_estimate 的返回值，
+            另加 ambiguity 表示最终采用的接缝取公共值的概率 p
+
+        Raises:
+            ValueError: 没有指定或指定了多个难度目标，或 iterations 不为正数
+        """
+        from src.models.puzzle import JigsawPuzzle
+        from src.solvers.cost_estimator import SearchCostEstimator
+        from src.solvers.puzzle_solver import PuzzleSolver
+
+        self._check_size(rows, cols)
+        targets = {name: value for name, value in (('nodes', target_nodes),
+                                                    ('solutions', target_solutions),
+                                                    ('candidates', target_candidates))
+                   if value is not None}
+        if len(targets) != 1:
+            raise ValueError("必须且只能指定一个难度目标")
+        (name, target), = targets.items()
+        if target <= 0:
+            raise ValueError("难度目标必须为正数")
+        metric = self.DIFFICULTY_TARGETS[name]
+
+        rng = random.Random(seed if seed is not None else random.getrandbits(64))
+        # 每条接缝: (共用公共值的阈值, 公共值, 唯一值)，唯一值从 edge_types + 1 开始编号
+        seams = [(rng.random(), rng.randint(1, edge_types) * rng.choice((1, -1)),
+                  (edge_types + 1 + i) * rng.choice((1, -1)))
+                 for i in range(2 * rows * cols)]
+        estimate_seed = rng.getrandbits(32)
+
+        def build(p: float) -> List[JigsawPiece]:
+            values = iter(shared if u < p else unique for u, shared, unique in seams)
+            right = [[next(values) for _ in range(cols)] for _ in range(rows)]
+            down = [[next(values) for _ in range(cols)] for _ in range(rows)]
+            return self._pieces_from_seams(rows, cols, right, down)
+
+        def measure(pieces: List[JigsawPiece]) -> Dict[str, float]:
+            puzzle = JigsawPuzzle(rows, cols)
+            for piece in pieces:
+                puzzle.add_piece(piece)
+            solver = PuzzleSolver(puzzle)
+            estimate = SearchCostEstimator(solver).population_estimate(particles, seed=estimate_seed)
+            if metric == 'solutions' and estimate['solutions'] == 0 and \
+               estimate['nodes'] <= self.EXACT_COUNT_NODES:
+                estimate['solutions'] = float(solver.count_solutions())
+            return estimate
+
+        def error(estimate: Dict[str, float]) -> float:
+            return abs(math.log(max(estimate[metric], 1e-9) / target))
+
+        low, high = 0.0, 1.0
+        best: Optional[Tuple[List[JigsawPiece], Dict[str, float], float]] = None
+        for _ in range(iterations):
+            p = (low + high) / 2
+            pieces = build(p)
+            estimate = measure(pieces)
+            if best is None or error(estimate) < error(best[1]):
+                best = (pieces, estimate, p)
+            if error(estimate) <= math.log(1 + tolerance):
+                break
+            # 估计的解数量仍为0说明搜索树很大而解很稀疏，当作 p 过大处理
+            if 0 < estimate[metric] < target or (estimate[metric] == 0 and metric != 'solutions'):
+                low = p
+            else:
+                high = p
+        if best is None:
+            raise ValueError("二分查找的步数必须为正数")
+        pieces, estimate, p = best
+        return pieces, dict(estimate, ambiguity=p)
@@ -1,4 +1,5 @@
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
+import math
 from .direction import Direction
 
 
@@ -58,7 +59,19 @@ class JigsawPiece:
         # 根据旋转次数调整方向
         adjusted_direction = Direction((direction.value - rotations) % 4)
         return self._edges[adjusted_direction]
-    
+
+    def edges_at(self, rotation: int) -> Tuple[int, int, int, int]:
+        """获取指定旋转角度下(上, 右, 下, 左)四个方向的边缘值，不修改当前旋转
+
+        Args:
+            rotation: 旋转角度 (90的倍数)
+        """
+        if rotation % 90 != 0:
+            raise ValueError("旋转角度必须是90的倍数")
+        rotations = (rotation // 90) % 4
+        up, right, down, left = (self._edges[Direction((d - rotations) % 4)] for d in range(4))
+        return up, right, down, left
+
     def set_position(self, row: int, col: int):
         """设置拼图片在拼图中的位置"""
         self.position = (row, col)
@@ -83,6 +96,25 @@ class JigsawPiece:
         
         # 边缘值之和应为0表示匹配
         return this_edge + other_edge == 0
+
+    def match_cost(self, other: 'JigsawPiece', direction: Direction,
+                   cost: Optional[Callable[[int, int], float]] = None) -> float:
+        """计算两片在指定方向上相接的代价
+
+        Args:
+            other: 相接的另一片拼图片
+            direction: 从当前片看向另一片的方向
+            cost: 接缝代价函数，参数为两条边的边缘值；None 时按精确匹配计算，
+                  匹配为0，否则为 math.inf
+
+        Returns:
+            float: 非负代价，math.inf 表示不能相接
+        """
+        this_edge = self.get_edge(direction)
+        other_edge = other.get_edge(direction.opposite())
+        if cost is None:
+            return 0.0 if this_edge + other_edge == 0 else math.inf
+        return cost(this_edge, other_edge)
     
     def __str__(self) -> str:
         """返回拼图片的字符串表示"""
@@ -1,3 +1,4 @@
+from collections import Counter
 from typing import List, Optional
 import random
 from .direction import Direction
@@ -10,10 +11,23 @@ class JigsawPuzzle:
     def __init__(self, rows: int, cols: int):
         self.rows = rows
         self.cols = cols
-        self.board: List[List[Optional[JigsawPiece]]] = [
-            [None for _ in range(cols)] for _ in range(rows)
-        ]
+        self.board = [[None for _ in range(cols)] for _ in range(rows)]
         self.pieces: List[JigsawPiece] = []
+
+    @property
+    def board(self) -> List[List[Optional[JigsawPiece]]]:
+        """每个位置上放置的拼图片，未放置为None"""
+        return self._board
+
+    @board.setter
+    def board(self, board: List[List[Optional[JigsawPiece]]]) -> None:
+        """整体替换棋盘时重新统计棋盘上的拼图片
+
+        逐个位置的修改应通过 place_piece 和 remove_piece 进行，才能保持统计同步。
+        """
+        self._board = board
+        # 拼图片id -> 在棋盘上出现的次数
+        self._on_board = Counter(piece.id for row in board for piece in row if piece is not None)
     
     def __repr__(self) -> str:
         """返回拼图的字符串表示"""
@@ -58,7 +72,30 @@ class JigsawPuzzle:
         
         self.board[row][col] = piece
         piece.set_position(row, col)
+        self._on_board[piece.id] += 1
         return True
+
+    def remove_piece(self, row: int, col: int) -> Optional[JigsawPiece]:
+        """取下指定位置的拼图片
+
+        Returns:
+            取下的拼图片，该位置为空或越界时返回None
+        """
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return None
+        piece = self.board[row][col]
+        if piece is None:
+            return None
+        self.board[row][col] = None
+        piece.position = None
+        self._on_board[piece.id] -= 1
+        if not self._on_board[piece.id]:
+            del self._on_board[piece.id]
+        return piece
+
+    def is_on_board(self, piece_id: int) -> bool:
+        """拼图片是否已经放在棋盘上"""
+        return piece_id in self._on_board
     
     def is_complete(self) -> bool:
         """检查拼图是否完成"""
@@ -0,0 +1,17 @@
+from .puzzle_codec import (
+    decode_puzzle,
+    encode_puzzle,
+    is_binary,
+    iter_decode_puzzles,
+    puzzle_from_dict,
+    puzzle_to_dict,
+)
+
+__all__ = [
+    'decode_puzzle',
+    'encode_puzzle',
+    'is_binary',
+    'iter_decode_puzzles',
+    'puzzle_from_dict',
+    'puzzle_to_dict'
+]
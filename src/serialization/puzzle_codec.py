@@ -0,0 +1,149 @@
+from typing import Any, BinaryIO, Dict, Iterator, Sequence, cast
+import io
+import struct
+from ..models.direction import Direction
+from ..models.piece import JigsawPiece
+from ..models.puzzle import JigsawPuzzle
+
+# 二进制格式: 文件头 + 每个拼图片一条定长记录
+# 文件头: 魔数, 版本, 行数, 列数, 拼图片数量
+# 拼图片: id, 标志位(bit0=角落片, bit1=边缘片), 旋转(90度的倍数), 上/右/下/左的原始边缘值
+BINARY_MAGIC = b'JGSP'
+BINARY_VERSION = 1
+_HEADER = struct.Struct('<4sBHHI')
+_PIECE = struct.Struct('<qBB4i')
+
+_FLAG_CORNER = 1
+_FLAG_EDGE = 2
+
+
+def piece_to_dict(piece: JigsawPiece) -> Dict[str, Any]:
+    """将拼图片转换为可JSON序列化的字典"""
+    return {
+        'id': piece.id,
+        'edges': list(piece.edges_at(0)),
+        'rotation': piece.rotation,
+        'is_corner': piece.is_corner,
+        'is_edge': piece.is_edge,
+    }
+
+
+def piece_from_dict(data: Dict[str, Any]) -> JigsawPiece:
+    """从字典还原拼图片"""
+    edges = data['edges']
+    if len(edges) != 4:
+        raise ValueError("拼图片必须有4个边缘值")
+    piece = JigsawPiece(data['id'], dict(zip(Direction, edges)),
+                        is_corner=bool(data.get('is_corner', False)),
+                        is_edge=bool(data.get('is_edge', False)))
+    piece.rotation = data.get('rotation', 0)
+    return piece
+
+
+def puzzle_to_dict(puzzle: JigsawPuzzle) -> Dict[str, Any]:
+    """将拼图转换为可JSON序列化的字典"""
+    return {
+        'rows': puzzle.rows,
+        'cols': puzzle.cols,
+        'pieces': [piece_to_dict(piece) for piece in puzzle.pieces],
+    }
+
+
+def puzzle_from_dict(data: Dict[str, Any]) -> JigsawPuzzle:
+    """从字典还原拼图"""
+    puzzle = JigsawPuzzle(int(data['rows']), int(data['cols']))
+    for piece_data in data['pieces']:
+        puzzle.add_piece(piece_from_dict(piece_data))
+    return puzzle
+
+
+def is_binary(data: bytes) -> bool:
+    """判断数据是否为二进制拼图格式"""
+    return data[:len(BINARY_MAGIC)] == BINARY_MAGIC
+
+
+def encode_header(rows: int, cols: int, piece_count: int) -> bytes:
+    """编码二进制格式的文件头"""
+    return _HEADER.pack(BINARY_MAGIC, BINARY_VERSION, rows, cols, piece_count)
+
+
+def encode_piece(piece_id: int, edges: Sequence[int], rotation: int = 0,
+                 is_corner: bool = False, is_edge: bool = False) -> bytes:
+    """编码一条拼图片记录
+
+    Args:
+        piece_id: 拼图片id
+        edges: 旋转为0时(上, 右, 下, 左)的边缘值
+        rotation: 旋转角度
+        is_corner: 是否是角落片
+        is_edge: 是否是边缘片
+    """
+    flags = (_FLAG_CORNER if is_corner else 0) | (_FLAG_EDGE if is_edge or is_corner else 0)
+    try:
+        return _PIECE.pack(piece_id, flags, (rotation // 90) % 4, *edges)
+    except struct.error as exc:
+        raise ValueError(f"拼图片 {piece_id} 无法编码为二进制格式: {exc}") from exc
+
+
+def encode_puzzle(puzzle: JigsawPuzzle) -> bytes:
+    """将拼图编码为二进制格式"""
+    chunks = [encode_header(puzzle.rows, puzzle.cols, len(puzzle.pieces))]
+    for piece in puzzle.pieces:
+        chunks.append(encode_piece(piece.id, list(piece.edges_at(0)), piece.rotation,
+                                   piece.is_corner, piece.is_edge))
+    return b''.join(chunks)
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytes:
+    """从流中读取指定长度的数据"""
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError("二进制拼图数据不完整")
+    return data
+
+
+def read_puzzle(stream: BinaryIO) -> JigsawPuzzle:
+    """从二进制流中读取一个拼图"""
+    magic, version, rows, cols, piece_count = _HEADER.unpack(_read_exact(stream, _HEADER.size))
+    if magic != BINARY_MAGIC:
+        raise ValueError("不是有效的二进制拼图数据")
+    if version != BINARY_VERSION:
+        raise ValueError(f"不支持的二进制格式版本: {version}")
+
+    puzzle = JigsawPuzzle(rows, cols)
+    for _ in range(piece_count):
+        piece_id, flags, quarter_turns, *edges = _PIECE.unpack(_read_exact(stream, _PIECE.size))
+        piece = JigsawPiece(piece_id, dict(zip(Direction, edges)),
+                            is_corner=bool(flags & _FLAG_CORNER),
+                            is_edge=bool(flags & _FLAG_EDGE))
+        piece.rotation = quarter_turns * 90
+        puzzle.add_piece(piece)
+    return puzzle
+
+
+def iter_decode_puzzles(stream: BinaryIO) -> Iterator[JigsawPuzzle]:
+    """依次读取流中连续存放的多个二进制拼图，直到流结束"""
+    while True:
+        magic = stream.read(len(BINARY_MAGIC))
+        if not magic:
+            return
+        yield read_puzzle(cast(BinaryIO, _Prefixed(magic, stream)))
+
+
+def decode_puzzle(data: bytes) -> JigsawPuzzle:
+    """从二进制数据解码一个拼图"""
+    return read_puzzle(io.BytesIO(data))
+
+
+class _Prefixed:
+    """把已读取的前缀数据重新接回流的开头"""
+
+    def __init__(self, prefix: bytes, stream: BinaryIO):
+        self._prefix = prefix
+        self._stream = stream
+
+    def read(self, size: int) -> bytes:
+        head, self._prefix = self._prefix[:size], self._prefix[size:]
+        if len(head) < size:
+            head += self._stream.read(size - len(head))
+        return head
@@ -0,0 +1,31 @@
+"""本地求解服务入口
+
+用法: python -m src.serve --port 8000 --workers 4
+"""
+from typing import List, Optional
+import argparse
+from .server.solve_server import SolveServer
+from .server.worker_pool import SolverWorkerPool
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="拼图本地求解服务")
+    parser.add_argument('--host', default='127.0.0.1', help="监听地址")
+    parser.add_argument('--port', type=int, default=8000, help="监听端口")
+    parser.add_argument('--workers', type=int, default=None, help="求解进程数量，默认为CPU核数")
+    parser.add_argument('--verbose', action='store_true', help="打印请求日志")
+    args = parser.parse_args(argv)
+
+    with SolverWorkerPool(args.workers) as pool:
+        server = SolveServer((args.host, args.port), pool, verbose=args.verbose)
+        print(f"求解服务已启动: http://{args.host}:{server.server_port} ({pool.processes} 个求解进程)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,21 @@
+from typing import TYPE_CHECKING
+from .._lazy import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from .distributed import Coordinator, run_worker
+    from .solve_server import SolveRequestHandler, SolveServer
+    from .worker_pool import SolverWorkerPool
+
+# 公开名称 -> 定义它的模块。分布式工作节点不必导入 HTTP 服务和进程池
+_LAZY_ATTRIBUTES = {
+    'Coordinator': '.distributed',
+    'SolveRequestHandler': '.solve_server',
+    'SolveServer': '.solve_server',
+    'SolverWorkerPool': '.worker_pool',
+    'run_worker': '.distributed',
+}
+
+__all__ = ['Coordinator', 'SolveRequestHandler', 'SolveServer', 'SolverWorkerPool', 'run_worker']
+
+
+__getattr__, __dir__ = lazy_module_attrs(_LAZY_ATTRIBUTES, globals())
@@ -0,0 +1,369 @@
+"""跨机器的分布式回溯搜索
+
+协调者把搜索树的子树(固定摆放的前缀加上第一个待填位置的候选范围)分发给各个工作节点。
+空闲的工作节点没有任务可领时，协调者让忙碌的工作节点把自己栈中尚未尝试的分支分出一半，
+交给空闲的节点(工作窃取)。解决方案和统计信息实时发回协调者。
+
+工作节点在搜索途中断开连接时，协调者把它的子树去掉已经被窃取的部分后重新放回待处理队列。
+回溯搜索的顺序是确定的，断开的节点已经发回的解恰好是重新搜索时最先找到的那些，
+协调者丢弃这么多个解，因此不会重复或遗漏。
+
+传输层为普通TCP套接字，每条消息为4字节大端长度前缀加UTF-8编码的JSON。
+"""
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from collections import deque
+import itertools
+import json
+import select
+import socket
+import struct
+import time
+from ..models.puzzle import JigsawPuzzle
+from ..serialization.puzzle_codec import puzzle_from_dict, puzzle_to_dict
+
+Solution = List[Tuple[int, int, int, int]]
+
+_LENGTH = struct.Struct('>I')
+# 待处理的子树: (前缀, first, last, exclude, skip)
+# exclude 为去掉的部分(见 SearchState)，skip 为重新搜索时需要丢弃的、之前已经交出的解数量
+_WorkItem = Tuple[List[Any], int, Optional[int], List[Tuple[List[Any], int]], int]
+
+
+def send_message(sock: socket.socket, message: Dict[str, Any]) -> None:
+    """发送一条长度前缀的JSON消息"""
+    payload = json.dumps(message, separators=(',', ':')).encode('utf-8')
+    sock.sendall(_LENGTH.pack(len(payload)) + payload)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def recv_message(sock: socket.socket) -> Optional[Dict[str, Any]]:
+    """接收一条消息，连接关闭时返回None"""
+    header = _recv_exact(sock, _LENGTH.size)
+    if header is None:
+        return None
+    payload = _recv_exact(sock, _LENGTH.unpack(header)[0])
+    if payload is None:
+        return None
+    message: Dict[str, Any] = json.loads(payload.decode('utf-8'))
+    return message
+
+
+def run_worker(host: str, port: int, chunk_nodes: int = 1000) -> None:
+    """工作节点主循环: 连接协调者并执行分配到的子树搜索，直到收到 shutdown 或连接关闭
+
+    Args:
+        host: 协调者地址
+        port: 协调者端口
+        chunk_nodes: 两次检查协调者消息之间最多搜索的节点数
+    """
+    from ..solvers.puzzle_solver import PuzzleSolver
+    from ..solvers.search_state import CandidateIndex, SearchState
+
+    sock = socket.create_connection((host, port))
+    job = solver = index = state = None
+    try:
+        while True:
+            if state is not None:
+                for solution in state.search(max_nodes=chunk_nodes):
+                    send_message(sock, {'type': 'solution', 'job': job, 'solution': solution})
+                if state.finished:
+                    send_message(sock, {'type': 'done', 'job': job, 'nodes': state.nodes})
+                    state = None
+                    continue
+                if not select.select([sock], [], [], 0)[0]:
+                    continue
+
+            message = recv_message(sock)
+            if message is None or message['type'] == 'shutdown':
+                return
+            kind = message['type']
+            if kind == 'job':
+                job, state = message['job'], None
+                solver = PuzzleSolver(puzzle_from_dict(message['puzzle']))
+                index = CandidateIndex(solver)
+            elif kind == 'work' and solver is not None and message['job'] == job:
+                state = SearchState(solver, message['prefix'], message['first'],
+                                    message['last'], index, exclude=message['exclude'])
+            elif kind == 'steal':
+                item = state.split() if state is not None and message['job'] == job else None
+                send_message(sock, {'type': 'split', 'job': message['job'], 'item': item})
+            elif kind == 'cancel':
+                state = None
+                send_message(sock, {'type': 'cancelled', 'job': message['job']})
+    except (ConnectionError, OSError):
+        return
+    finally:
+        sock.close()
+
+
+class _Worker:
+    """协调者记录的工作节点状态"""
+
+    __slots__ = ('sock', 'busy', 'steal_pending', 'next_steal', 'nodes', 'solutions', 'items',
+                 'item', 'skip', 'received', 'stolen')
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.busy = False            # 是否正在搜索某个子树
+        self.steal_pending = False   # 是否有尚未答复的窃取请求
+        self.next_steal = 0.0        # 窃取失败后，下次可以再向它窃取的时间
+        self.nodes = 0
+        self.solutions = 0
+        self.items = 0
+        self.item: Optional[_WorkItem] = None      # 正在搜索的子树
+        self.skip = 0                              # 这个子树开头需要丢弃的解数量
+        self.received = 0                          # 这个子树已经收到的解数量(包括丢弃的)
+        self.stolen: List[Tuple[List[Any], int]] = []   # 从这个子树分出去的部分，格式同 exclude
+
+
+class Coordinator:
+    """分布式搜索的协调者
+
+    用法:
+        with Coordinator(port=9000) as coordinator:
+            # 在其他机器上运行: python -m src.worker --connect host:9000
+            for solution in coordinator.find_all_solutions(puzzle):
+                ...
+    """
+
+    # 向某个工作节点窃取失败后，等待多久再向它窃取(秒)
+    STEAL_BACKOFF = 0.01
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0):
+        self._listener = socket.create_server((host, port))
+        self.address: Tuple[str, int] = self._listener.getsockname()[:2]
+        self._workers: Dict[socket.socket, _Worker] = {}
+        self._job_ids = itertools.count(1)
+        self._job: Optional[Dict[str, Any]] = None
+        self.stats: Dict[str, Any] = {}
+
+    @property
+    def worker_count(self) -> int:
+        return len(self._workers)
+
+    def _accept(self) -> None:
+        sock, _ = self._listener.accept()
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._workers[sock] = _Worker(sock)
+        if self._job is not None:
+            send_message(sock, self._job)
+
+    def wait_for_workers(self, count: int, timeout: Optional[float] = None) -> bool:
+        """等待至少 count 个工作节点连接
+
+        Returns:
+            bool: 超时前是否已有足够的工作节点
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while len(self._workers) < count:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            if select.select([self._listener], [], [], remaining)[0]:
+                self._accept()
+        return True
+
+    def find_all_solutions(self, puzzle: JigsawPuzzle, max_solutions: int = 1000,
+                           timeout: Optional[float] = None) -> Iterator[Solution]:
+        """在所有已连接(以及求解过程中新连接)的工作节点上求解
+
+        解决方案按到达顺序产生，不保证与单机回溯搜索的顺序一致。
+
+        Args:
+            puzzle: 要求解的拼图
+            max_solutions: 最大解决方案数量
+            timeout: 超时时间(秒)，超时抛出 TimeoutError
+
+        Returns:
+            Iterator[List[Tuple[int, int, int, int]]]: 解决方案生成器
+        """
+        from ..solvers.puzzle_solver import PuzzleSolver
+
+        if max_solutions <= 0 or PuzzleSolver(puzzle).precheck() is not None:
+            return
+        job = next(self._job_ids)
+        self._job = {'type': 'job', 'job': job, 'puzzle': puzzle_to_dict(puzzle)}
+        for worker in self._workers.values():
+            send_message(worker.sock, self._job)
+            worker.busy = worker.steal_pending = False
+            worker.nodes = worker.solutions = worker.items = 0
+        self.stats = {'work_items': 0, 'steals': 0, 'failed_steals': 0, 'requeued': 0}
+        pending: deque = deque([([], 0, None, [], 0)])
+        deadline = None if timeout is None else time.monotonic() + timeout
+        count = 0
+        try:
+            while True:
+                wait = self._dispatch(job, pending)
+                if not pending and self._workers and \
+                   not any(w.busy or w.steal_pending for w in self._workers.values()):
+                    return
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("分布式求解超时")
+                    wait = remaining if wait is None else min(wait, remaining)
+
+                readable, _, _ = select.select([self._listener] + list(self._workers), [], [], wait)
+                for sock in readable:
+                    if sock is self._listener:
+                        self._accept()
+                        continue
+                    worker = self._workers[sock]
+                    message = self._receive(worker)
+                    if message is None:
+                        self._drop(worker, pending)
+                        continue
+                    if message.get('job') != job:
+                        continue
+                    kind = message['type']
+                    if kind == 'solution':
+                        worker.received += 1
+                        if worker.received <= worker.skip:
+                            # 之前断开的节点已经交出过这个解
+                            continue
+                        worker.solutions += 1
+                        count += 1
+                        yield [tuple(placement) for placement in message['solution']]
+                        if count >= max_solutions:
+                            return
+                    elif kind == 'done':
+                        worker.busy = False
+                        worker.item = None
+                        worker.nodes += message['nodes']
+                    elif kind == 'split':
+                        worker.steal_pending = False
+                        if message['item'] is not None:
+                            prefix, first, last = message['item']
+                            pending.append((prefix, first, last, [], 0))
+                            worker.stolen.append((prefix, first))
+                        else:
+                            self.stats['failed_steals'] += 1
+                            worker.next_steal = time.monotonic() + self.STEAL_BACKOFF
+        finally:
+            self._finish(job)
+
+    def _dispatch(self, job: int, pending: deque) -> Optional[float]:
+        """把待处理的子树分给空闲节点，仍有空闲节点时向忙碌节点发起窃取
+
+        Returns:
+            下一次可以发起窃取前需要等待的时间，无需等待时返回None
+        """
+        idle = [w for w in self._workers.values() if not w.busy]
+        for worker in idle:
+            if not pending:
+                break
+            item = pending.popleft()
+            prefix, first, last, exclude, _ = item
+            worker.busy = True
+            worker.item, worker.skip, worker.received, worker.stolen = item, item[4], 0, []
+            if not self._send(worker, {'type': 'work', 'job': job, 'prefix': prefix,
+                                       'first': first, 'last': last, 'exclude': exclude}, pending):
+                continue
+            worker.items += 1
+            self.stats['work_items'] += 1
+
+        hungry = sum(1 for w in self._workers.values() if not w.busy) - \
+            sum(1 for w in self._workers.values() if w.steal_pending)
+        if hungry <= 0 or pending:
+            return None
+        now = time.monotonic()
+        wait = None
+        for victim in list(self._workers.values()):
+            if hungry <= 0:
+                break
+            # 还在丢弃之前已交出的解时不能窃取，否则分出的子树中可能有已经交出的解
+            if not victim.busy or victim.steal_pending or victim.received < victim.skip:
+                continue
+            if victim.next_steal > now:
+                delay = victim.next_steal - now
+                wait = delay if wait is None else min(wait, delay)
+                continue
+            if not self._send(victim, {'type': 'steal', 'job': job}, pending):
+                continue
+            victim.steal_pending = True
+            self.stats['steals'] += 1
+            hungry -= 1
+        return wait
+
+    def _send(self, worker: _Worker, message: Dict[str, Any], pending: deque) -> bool:
+        """向工作节点发送消息，连接已断开时撤下该节点并返回False"""
+        try:
+            send_message(worker.sock, message)
+        except OSError:
+            self._drop(worker, pending)
+            return False
+        return True
+
+    @staticmethod
+    def _receive(worker: _Worker) -> Optional[Dict[str, Any]]:
+        """接收工作节点的一条消息，连接已断开时返回None"""
+        try:
+            return recv_message(worker.sock)
+        except OSError:
+            return None
+
+    def _drop(self, worker: _Worker, pending: deque) -> None:
+        """撤下断开连接的工作节点，把它正在搜索的子树放回待处理队列
+
+        放回的子树去掉已经分出去的部分，并丢弃重新搜索时最先找到的、已经交出过的解。
+        """
+        del self._workers[worker.sock]
+        worker.sock.close()
+        if worker.busy and worker.item is not None:
+            prefix, first, last, exclude, _ = worker.item
+            pending.appendleft((prefix, first, last, exclude + worker.stolen,
+                                max(worker.skip, worker.received)))
+            self.stats['requeued'] += 1
+
+    def _finish(self, job: int) -> None:
+        """通知所有节点结束当前任务，并丢弃尚未送达的消息"""
+        self._job = None
+        waiting = set()
+        for worker in list(self._workers.values()):
+            try:
+                send_message(worker.sock, {'type': 'cancel', 'job': job})
+                waiting.add(worker.sock)
+            except OSError:
+                del self._workers[worker.sock]
+        while waiting:
+            for sock in select.select(list(waiting), [], [])[0]:
+                message = self._receive(self._workers[sock])
+                if message is None:
+                    waiting.discard(sock)
+                    self._workers.pop(sock, None)
+                    sock.close()
+                elif message['type'] == 'cancelled' and message['job'] == job:
+                    waiting.discard(sock)
+        self.stats.update({
+            'workers': len(self._workers),
+            'nodes': sum(w.nodes for w in self._workers.values()),
+            'per_worker': [{'nodes': w.nodes, 'solutions': w.solutions, 'items': w.items}
+                           for w in self._workers.values()],
+        })
+
+    def close(self) -> None:
+        """通知所有工作节点退出并关闭监听套接字"""
+        for worker in self._workers.values():
+            try:
+                send_message(worker.sock, {'type': 'shutdown'})
+            except OSError:
+                pass
+            worker.sock.close()
+        self._workers.clear()
+        self._listener.close()
+
+    def __enter__(self) -> 'Coordinator':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,144 @@
+from typing import Any, Dict, List, Tuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import io
+import json
+import queue
+from ..serialization.puzzle_codec import (
+    is_binary,
+    iter_decode_puzzles,
+    puzzle_from_dict,
+    puzzle_to_dict,
+)
+from .worker_pool import DONE, SolverWorkerPool
+
+DEFAULT_MAX_SOLUTIONS = 1000
+
+# 等待结果时每隔这么多秒检查一次求解进程是否存活
+WORKER_POLL_INTERVAL = 1.0
+
+
+def parse_puzzles(body: bytes) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """解析请求体中的拼图
+
+    支持二进制格式(可连续存放多个拼图)、单个JSON对象、JSON数组、
+    带 "puzzles" 字段的JSON对象以及每行一个拼图的JSONL。
+
+    Returns:
+        (puzzle_to_dict格式的拼图列表, 请求体中附带的选项)
+    """
+    if is_binary(body):
+        return [puzzle_to_dict(p) for p in iter_decode_puzzles(io.BytesIO(body))], {}
+
+    text = body.decode('utf-8')
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        data = [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    options: Dict[str, Any] = {}
+    if isinstance(data, dict) and 'puzzles' in data:
+        options = {k: v for k, v in data.items() if k != 'puzzles'}
+        data = data['puzzles']
+    elif isinstance(data, dict):
+        options = {k: data[k] for k in ('max_solutions',) if k in data}
+        data = [data]
+    # 提前还原一次，确保格式错误在入队之前就能报告给调用方
+    for item in data:
+        puzzle_from_dict(item)
+    return data, options
+
+
+class SolveRequestHandler(BaseHTTPRequestHandler):
+    """求解服务的HTTP请求处理器
+
+    POST /solve  提交拼图，以NDJSON流的形式返回解决方案
+    GET  /stats  返回队列深度、延迟百分位数和吞吐量
+    """
+
+    protocol_version = 'HTTP/1.1'
+    server: 'SolveServer'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _write_chunk(self, payload: Dict[str, Any]) -> None:
+        line = json.dumps(payload).encode('utf-8') + b'\n'
+        self.wfile.write(f"{len(line):x}\r\n".encode('ascii') + line + b"\r\n")
+        self.wfile.flush()
+
+    def do_GET(self) -> None:
+        path = urlparse(self.path).path
+        if path == '/stats':
+            self._send_json(200, self.server.pool.stats())
+        elif path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        else:
+            self._send_json(404, {'error': f"未知路径: {path}"})
+
+    def do_POST(self) -> None:
+        url = urlparse(self.path)
+        if url.path != '/solve':
+            self._send_json(404, {'error': f"未知路径: {url.path}"})
+            return
+
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        try:
+            puzzles, options = parse_puzzles(body)
+            query = parse_qs(url.query)
+            max_solutions = int(query.get('max_solutions', [options.get(
+                'max_solutions', DEFAULT_MAX_SOLUTIONS)])[0])
+        except (ValueError, KeyError, TypeError, UnicodeDecodeError) as exc:
+            self._send_json(400, {'error': f"无效的拼图数据: {exc}"})
+            return
+
+        # 同一请求中的拼图一起入队，共用一个结果队列，按完成顺序流式返回
+        listener: queue.Queue = queue.Queue()
+        indices = {}
+        for index, puzzle_data in enumerate(puzzles):
+            job_id, _ = self.server.pool.submit(puzzle_data, max_solutions, listener)
+            indices[job_id] = index
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+        remaining = len(indices)
+        while remaining:
+            try:
+                kind, job_id, payload = listener.get(timeout=self.server.poll_interval)
+            except queue.Empty:
+                # 求解进程在任务中途退出时不会再有结果，由 check_workers 发出错误的 DONE 消息
+                self.server.pool.check_workers()
+                continue
+            if kind == DONE:
+                remaining -= 1
+                self._write_chunk({'puzzle': indices[job_id], 'done': True, **payload})
+            else:
+                self._write_chunk({'puzzle': indices[job_id],
+                                   'solution': [list(p) for p in payload]})
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+class SolveServer(ThreadingHTTPServer):
+    """本地求解服务，把请求排队交给预热的求解进程池"""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], pool: SolverWorkerPool, verbose: bool = False,
+                 poll_interval: float = WORKER_POLL_INTERVAL):
+        super().__init__(address, SolveRequestHandler)
+        self.pool = pool
+        self.verbose = verbose
+        self.poll_interval = poll_interval
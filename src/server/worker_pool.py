@@ -0,0 +1,313 @@
+from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from multiprocessing.connection import wait
+import itertools
+import math
+import multiprocessing
+import queue
+import threading
+import time
+
+# 结果消息类型
+SOLUTION = 'solution'
+DONE = 'done'
+
+
+def _worker_main(tasks: Any, results: Any) -> None:
+    """求解进程主循环: 预先导入求解器，然后不断从任务管道取拼图求解
+
+    tasks 和 results 都是本进程独占的管道，任务由父进程直接分配给空闲的进程。
+    进程在读写途中被杀死只会损坏它自己的管道，不会像共用的 multiprocessing.Queue
+    那样让队列锁永远处于占用状态，使其他进程再也取不到任务或写不出结果。
+    """
+    from ..serialization.puzzle_codec import puzzle_from_dict
+    from ..solvers.puzzle_solver import PuzzleSolver
+
+    while True:
+        try:
+            task = tasks.recv()
+        except EOFError:
+            task = None
+        if task is None:
+            results.close()
+            return
+        job_id, puzzle_data, max_solutions, timeout = task
+        count = 0
+        error = None
+        timed_out = False
+        try:
+            solver = PuzzleSolver(puzzle_from_dict(puzzle_data))
+            for solution in solver.find_all_solutions(max_solutions=max_solutions, timeout=timeout):
+                results.send((SOLUTION, job_id, solution))
+                count += 1
+        except TimeoutError:
+            timed_out = True
+        except Exception as exc:  # 单个任务失败不能拖垮整个进程
+            error = f"{type(exc).__name__}: {exc}"
+        results.send((DONE, job_id, {'count': count, 'error': error, 'timed_out': timed_out}))
+
+
+class _Worker:
+    """进程池记录的求解进程状态"""
+
+    __slots__ = ('process', 'tasks', 'results', 'job_id', 'count')
+
+    def __init__(self, process: Any, tasks: Any, results: Any):
+        self.process = process
+        self.tasks = tasks        # 任务管道的写端
+        self.results = results    # 结果管道的读端
+        self.job_id: Optional[int] = None   # 正在求解的任务，空闲时为 None
+        self.count = 0                      # 当前任务已返回的解数量
+
+
+def _percentile(sorted_values: List[float], percent: float) -> Optional[float]:
+    """最近秩法计算百分位数"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class SolverWorkerPool:
+    """预热的求解进程池
+
+    进程在创建时启动并导入求解器，之后的任务不再承担进程启动和导入的开销。
+    任务先进入父进程中的等待队列，再经各进程独占的任务管道逐个分配给空闲进程；
+    每个进程通过自己的结果管道返回结果，由分发线程送回各自的请求队列。
+
+    求解进程意外退出时(管道读到结尾，或 check_workers 发现进程已退出)，
+    分配给它的任务以错误结束，并换上一个新进程继续处理等待中的任务。
+    """
+
+    def __init__(self, processes: Optional[int] = None, latency_window: int = 1024,
+                 throughput_window: float = 60.0):
+        self._ctx = multiprocessing.get_context()
+        self._lock = threading.Lock()
+        self._closed = False
+        # 尚未分配的任务
+        self._pending: deque = deque()
+        # 结果管道读端 -> 求解进程；已撤下的进程的读端留在 _draining 中，读到结尾后关闭
+        self._readers: Dict[Any, _Worker] = {}
+        self._draining: List[Any] = []
+        for _ in range(processes or multiprocessing.cpu_count()):
+            self._start_worker()
+
+        self._job_ids = itertools.count()
+        self._listeners: Dict[int, queue.Queue] = {}
+        self._submitted_at: Dict[int, float] = {}
+        self._running = 0
+        self._completed = 0
+        self._latencies: deque = deque(maxlen=latency_window)
+        self._completions: deque = deque()
+        self._throughput_window = throughput_window
+        self._started_at = time.monotonic()
+
+        self._dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+        self._dispatcher.start()
+
+    def _start_worker(self) -> None:
+        """启动一个求解进程，调用方在初始化之后必须持有锁"""
+        task_reader, task_writer = self._ctx.Pipe(duplex=False)
+        reader, writer = self._ctx.Pipe(duplex=False)
+        process = self._ctx.Process(target=_worker_main, args=(task_reader, writer), daemon=True)
+        process.start()
+        # 关闭父进程中属于子进程的一端，进程退出时结果管道的读端才能读到结尾
+        task_reader.close()
+        writer.close()
+        self._readers[reader] = _Worker(process, task_writer, reader)
+
+    @property
+    def _workers(self) -> List[Any]:
+        return [worker.process for worker in self._readers.values()]
+
+    @property
+    def processes(self) -> int:
+        """进程数量"""
+        return len(self._readers)
+
+    def submit(self, puzzle_data: Dict[str, Any], max_solutions: int = 1000,
+               listener: Optional[queue.Queue] = None,
+               timeout: Optional[float] = None) -> Tuple[int, queue.Queue]:
+        """提交一个求解任务
+
+        Args:
+            puzzle_data: puzzle_to_dict格式的拼图
+            max_solutions: 最大解决方案数量
+            listener: 接收结果消息的队列，可由多个任务共用；为空时新建一个
+            timeout: 单个拼图的求解超时时间(秒)，超时后 DONE 消息中的 timed_out 为 True
+
+        Returns:
+            (任务id, 结果队列)，队列中依次收到 (类型, 任务id, 内容) 消息
+        """
+        listener = listener if listener is not None else queue.Queue()
+        with self._lock:
+            job_id = next(self._job_ids)
+            self._listeners[job_id] = listener
+            self._submitted_at[job_id] = time.monotonic()
+            self._pending.append((job_id, puzzle_data, max_solutions, timeout))
+            failed = self._assign()
+        self._notify(failed)
+        return job_id, listener
+
+    def _assign(self) -> List[Tuple[queue.Queue, Tuple[str, int, Any]]]:
+        """把等待中的任务分配给空闲进程，调用方必须持有锁
+
+        Returns: 因进程已退出而需要以错误结束的任务，见 _retire
+        """
+        failed = []
+        while self._pending and not self._closed:
+            worker = next((w for w in self._readers.values() if w.job_id is None), None)
+            if worker is None:
+                break
+            task = self._pending[0]
+            try:
+                worker.tasks.send(task)
+            except OSError:
+                # 进程已退出，换上新进程后重新分配这个任务
+                failed.extend(self._retire(worker.results))
+                continue
+            self._pending.popleft()
+            worker.job_id, worker.count = task[0], 0
+            self._running += 1
+        return failed
+
+    def _dispatch(self) -> None:
+        """把进程返回的结果转发到对应任务的队列，并更新统计"""
+        while True:
+            with self._lock:
+                if self._closed and not self._readers and not self._draining:
+                    return
+                readers = list(self._readers) + self._draining
+            ready: List[Any] = wait(readers, timeout=0.1)
+            for reader in ready:
+                try:
+                    message = reader.recv()
+                except (EOFError, OSError):
+                    # 进程已退出(可能在读写途中被杀死)，这个管道不会再有结果
+                    with self._lock:
+                        failed = self._retire(reader)
+                        if reader in self._draining:
+                            self._draining.remove(reader)
+                        failed.extend(self._assign())
+                    reader.close()
+                    self._notify(failed)
+                    continue
+                self._forward(reader, message)
+
+    def _forward(self, reader: Any, message: Tuple[str, int, Any]) -> None:
+        kind, job_id, _ = message
+        with self._lock:
+            worker = self._readers.get(reader)
+            if worker is None or worker.job_id != job_id:
+                # 进程已经撤下，任务已以错误结束，丢弃进程退出前留下的消息
+                return
+            if kind == DONE:
+                worker.job_id = None
+                listener = self._finish(job_id)
+                failed = self._assign()
+            else:
+                worker.count += 1
+                listener = self._listeners[job_id]
+                failed = []
+        listener.put(message)
+        self._notify(failed)
+
+    def _finish(self, job_id: int) -> queue.Queue:
+        """记录任务结束，返回它的结果队列，调用方必须持有锁"""
+        now = time.monotonic()
+        self._running -= 1
+        self._completed += 1
+        self._latencies.append(now - self._submitted_at.pop(job_id))
+        self._completions.append(now)
+        return self._listeners.pop(job_id)
+
+    def _retire(self, reader: Any) -> List[Tuple[queue.Queue, Tuple[str, int, Any]]]:
+        """撤下已退出的进程，让分配给它的任务以错误结束，未关闭时换上新进程
+
+        调用方必须持有锁。Returns: 需要发送的 (结果队列, DONE 消息)
+        """
+        worker = self._readers.pop(reader, None)
+        if worker is None:
+            return []
+        self._draining.append(reader)
+        worker.tasks.close()
+        if not self._closed:
+            self._start_worker()
+        if worker.job_id is None:
+            return []
+        worker.process.join(timeout=1)
+        error = f"求解进程意外退出(退出码 {worker.process.exitcode})"
+        return [(self._finish(worker.job_id),
+                 (DONE, worker.job_id, {'count': worker.count, 'error': error, 'timed_out': False}))]
+
+    @staticmethod
+    def _notify(failed: List[Tuple[queue.Queue, Tuple[str, int, Any]]]) -> None:
+        for listener, message in failed:
+            listener.put(message)
+
+    def check_workers(self) -> List[int]:
+        """检查求解进程是否存活，撤下已退出的进程并换上新进程
+
+        已退出的进程正在求解的任务以错误结束，DONE 消息发送到任务的结果队列，
+        等待结果的调用方不会因此永远阻塞；等待中的任务分配给新进程。
+        通常分发线程在管道读到结尾时已经处理，这里是兜底检查。
+
+        Returns:
+            以错误结束的任务id
+        """
+        with self._lock:
+            if self._closed:
+                return []
+            failed = []
+            for reader, worker in list(self._readers.items()):
+                if not worker.process.is_alive():
+                    failed.extend(self._retire(reader))
+            failed.extend(self._assign())
+        self._notify(failed)
+        return [message[1] for _, message in failed]
+
+    def stats(self) -> Dict[str, Any]:
+        """返回队列深度、延迟百分位数和吞吐量"""
+        now = time.monotonic()
+        with self._lock:
+            while self._completions and now - self._completions[0] > self._throughput_window:
+                self._completions.popleft()
+            latencies = sorted(self._latencies)
+            window = min(self._throughput_window, now - self._started_at) or 1e-9
+            return {
+                'workers': len(self._readers),
+                'queue_depth': len(self._pending),
+                'running': self._running,
+                'completed': self._completed,
+                'latency_ms': {
+                    name: None if value is None else value * 1000
+                    for name, value in (('p50', _percentile(latencies, 50)),
+                                        ('p90', _percentile(latencies, 90)),
+                                        ('p99', _percentile(latencies, 99)))
+                },
+                'throughput_per_s': len(self._completions) / window,
+                'uptime_s': now - self._started_at,
+            }
+
+    def close(self) -> None:
+        """停止所有求解进程，尚未分配的任务不再处理"""
+        with self._lock:
+            self._closed = True
+            workers = list(self._readers.values())
+        for worker in workers:
+            try:
+                worker.tasks.send(None)
+            except OSError:
+                pass
+        for worker in workers:
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():
+                worker.process.terminate()
+        # 进程全部退出后各管道读到结尾，分发线程随之结束
+        self._dispatcher.join(timeout=5)
+
+    def __enter__(self) -> 'SolverWorkerPool':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
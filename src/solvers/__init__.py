@@ -1,3 +1,60 @@
-from .puzzle_solver import PuzzleSolver
+from typing import TYPE_CHECKING
+from .._lazy import lazy_module_attrs
 
-__all__ = ['PuzzleSolver'] 
\ No newline at end of file
+if TYPE_CHECKING:
+    from .beam_search import BeamSearchAssembler
+    from .dlx_solver import DancingLinksSolver
+    from .portfolio import PortfolioSolver
+    from .puzzle_solver import PuzzleSolver
+    from .restart_search import RandomizedRestartSearch
+    from .row_chain_solver import RowChainSolver
+    from .sampling import SolutionSampler
+    from .sat_solver import SatPuzzleSolver
+    from .shape_inference import candidate_shapes, solve_any_shape
+    from .solution_cache import SolutionCache, canonical_key
+    from .symmetry import SymmetryReducedSolver
+    from .tile_solver import TileSolver
+    from .transposition import TranspositionTable
+    from .verification import verify_solutions
+
+# 公开名称 -> 定义它的模块。只用到 PuzzleSolver 的进程不必导入 multiprocessing、SAT 编码等其他求解器的依赖
+_LAZY_ATTRIBUTES = {
+    'BeamSearchAssembler': '.beam_search',
+    'DancingLinksSolver': '.dlx_solver',
+    'PortfolioSolver': '.portfolio',
+    'PuzzleSolver': '.puzzle_solver',
+    'RandomizedRestartSearch': '.restart_search',
+    'RowChainSolver': '.row_chain_solver',
+    'SatPuzzleSolver': '.sat_solver',
+    'SolutionCache': '.solution_cache',
+    'SolutionSampler': '.sampling',
+    'SymmetryReducedSolver': '.symmetry',
+    'TileSolver': '.tile_solver',
+    'TranspositionTable': '.transposition',
+    'candidate_shapes': '.shape_inference',
+    'canonical_key': '.solution_cache',
+    'solve_any_shape': '.shape_inference',
+    'verify_solutions': '.verification',
+}
+
+__all__ = [
+    'BeamSearchAssembler',
+    'DancingLinksSolver',
+    'PortfolioSolver',
+    'PuzzleSolver',
+    'RandomizedRestartSearch',
+    'RowChainSolver',
+    'SatPuzzleSolver',
+    'SolutionCache',
+    'SolutionSampler',
+    'SymmetryReducedSolver',
+    'TileSolver',
+    'TranspositionTable',
+    'candidate_shapes',
+    'canonical_key',
+    'solve_any_shape',
+    'verify_solutions'
+]
+
+
+__getattr__, __dir__ = lazy_module_attrs(_LAZY_ATTRIBUTES, globals())
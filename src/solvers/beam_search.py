@@ -0,0 +1,206 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+import heapq
+import math
+import time
+from ..models.puzzle import JigsawPuzzle
+from .search_state import Edges, Placement
+
+if TYPE_CHECKING:
+    from .puzzle_solver import PuzzleSolver
+
+# 接缝代价函数: 参数为相接的两条边的边缘值，返回非负代价，math.inf 表示不能相接
+EdgeCost = Callable[[int, int], float]
+
+
+def exact_cost(a: int, b: int) -> float:
+    """精确匹配: 边缘值之和为0时代价为0，否则不能相接(与 JigsawPiece.matches 相同)"""
+    return 0.0 if a + b == 0 else math.inf
+
+
+def absolute_cost(a: int, b: int) -> float:
+    """边缘值之和的绝对值"""
+    return float(abs(a + b))
+
+
+def squared_cost(a: int, b: int) -> float:
+    """边缘值之和的平方，偏差大的接缝代价增长更快"""
+    return float((a + b) ** 2)
+
+
+def within(tolerance: float, cost: EdgeCost = absolute_cost) -> EdgeCost:
+    """边缘值之和的绝对值超过 tolerance 时不能相接，否则按 cost 计算代价
+
+    不能相接的候选在扩展时直接剪掉，容差越小束搜索越快。
+    """
+    def bounded(a: int, b: int) -> float:
+        return cost(a, b) if abs(a + b) <= tolerance else math.inf
+    return bounded
+
+
+def _outer_sides(row: int, col: int, rows: int, cols: int) -> List[int]:
+    """(row, col) 位于拼图外边缘的边: 0上 1右 2下 3左"""
+    return [side for side, outer in enumerate((row == 0, col == cols - 1, row == rows - 1, col == 0))
+            if outer]
+
+
+EDGE_COSTS: Dict[str, EdgeCost] = {
+    'exact': exact_cost,
+    'absolute': absolute_cost,
+    'squared': squared_cost,
+}
+
+
+def solution_cost(puzzle: JigsawPuzzle, solution: Sequence[Placement], cost: EdgeCost = absolute_cost) -> float:
+    """拼装结果所有内部接缝的代价，加上外边缘与平边(边缘值0)之间的代价之和"""
+    pieces = {piece.id: piece for piece in puzzle.pieces}
+    grid: Dict[Tuple[int, int], Edges] = {
+        (row, col): pieces[piece_id].edges_at(rotation) for piece_id, row, col, rotation in solution
+    }
+    total = 0.0
+    for (row, col), edges in grid.items():
+        for side in _outer_sides(row, col, puzzle.rows, puzzle.cols):
+            total += cost(edges[side], 0)
+        right, down = grid.get((row, col + 1)), grid.get((row + 1, col))
+        if right is not None:
+            total += cost(edges[1], right[3])
+        if down is not None:
+            total += cost(edges[2], down[0])
+    return total
+
+
+# 某个位置的候选: (拼图片id, 旋转角度, 边缘值, 外边缘的代价)
+_Candidate = Tuple[int, int, Edges, float]
+
+# 束中的部分拼装: (累计代价, 序号, 最近放置的 cols 个位置的边缘值, 已使用拼图片的位掩码, 摆放链表)
+# 摆放链表为 (拼图片id, 旋转角度, 上一个节点)，多个部分拼装共享公共前缀
+_Partial = Tuple[float, int, Tuple[Optional[Edges], ...], int, Any]
+
+
+class BeamSearchAssembler:
+    """按接缝代价拼装边缘值带有噪声的拼图
+
+    扫描得到的边缘值有误差，相接的两条边之和往往不严格为0，精确匹配的回溯搜索要么无解，
+    要么在放宽条件后搜索树爆炸。这里按行优先顺序逐个位置扩展，每条新接缝的代价由可替换的
+    代价函数给出(exact_cost 即精确匹配)，每层只保留累计代价最小的 beam_width 个部分拼装。
+
+    外边缘同样带有扫描误差，因此不要求严格为平边，而是按 cost(边缘值, 0) 与接缝一起计入代价；
+    拼图片类型(角落/边缘/内部)仍然必须与位置一致。
+    """
+
+    def __init__(self, solver: 'PuzzleSolver', cost: Union[str, EdgeCost] = absolute_cost, beam_width: int = 64):
+        """
+        Args:
+            solver: 提供拼图和合法摆放检查的 PuzzleSolver
+            cost: 接缝代价函数，也可以是 EDGE_COSTS 中的名称
+            beam_width: 每层保留的部分拼装数量
+        """
+        if isinstance(cost, str):
+            if cost not in EDGE_COSTS:
+                raise ValueError(f"未知的代价函数: {cost}")
+            cost = EDGE_COSTS[cost]
+        if beam_width <= 0:
+            raise ValueError("束宽度必须为正数")
+        self.solver = solver
+        self.cost = cost
+        self.beam_width = beam_width
+        self.rows, self.cols = solver.puzzle.rows, solver.puzzle.cols
+        self._bits = {piece.id: 1 << i for i, piece in enumerate(solver.puzzle.pieces)}
+        self._options: Dict[Tuple[bool, bool, bool, bool], List[_Candidate]] = {}
+        self._truncated = False
+        self.stats: Dict[str, Any] = {'passes': 0, 'beam_width': 0, 'expanded': 0}
+
+    def _candidates(self, row: int, col: int) -> List[_Candidate]:
+        """类型与位置一致的所有 (拼图片id, 旋转角度, 边缘值, 外边缘的代价)，外边缘不能放置的旋转除外"""
+        signature = (row == 0, col == self.cols - 1, row == self.rows - 1, col == 0)
+        options = self._options.get(signature)
+        if options is None:
+            solver, cost = self.solver, self.cost
+            outer = _outer_sides(row, col, self.rows, self.cols)
+            options = []
+            for piece in solver.puzzle.pieces:
+                if not solver._check_edge_compatibility(piece, row, col, []):
+                    continue
+                for rotation in solver._get_valid_rotations():
+                    edges = piece.edges_at(rotation)
+                    border = sum((cost(edges[side], 0) for side in outer), 0.0)
+                    if border != math.inf:
+                        options.append((piece.id, rotation, edges, border))
+            self._options[signature] = options
+        return options
+
+    def _run(self, width: int, deadline: Optional[float]) -> List[Tuple[float, List[Placement]]]:
+        """宽度为 width 的一遍束搜索，返回所有完整拼装及其代价"""
+        cost, cols = self.cost, self.cols
+        beam: List[_Partial] = [(0.0, 0, (None,) * cols, 0, None)]
+        self._truncated = False
+        for index in range(self.rows * self.cols):
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError("束搜索超时")
+            row, col = divmod(index, cols)
+            expanded: List[_Partial] = []
+            for total, _, window, used, chain in beam:
+                top, last = window[0], window[-1]
+                above = top[2] if row > 0 and top is not None else None
+                left = last[1] if col > 0 and last is not None else None
+                for piece_id, rotation, edges, border in self._candidates(row, col):
+                    bit = self._bits[piece_id]
+                    if used & bit:
+                        continue
+                    value = total + border
+                    if above is not None:
+                        value += cost(above, edges[0])
+                    if left is not None:
+                        value += cost(left, edges[3])
+                    if value == math.inf:
+                        continue
+                    expanded.append((value, len(expanded), window[1:] + (edges,), used | bit,
+                                     (piece_id, rotation, chain)))
+            self.stats['expanded'] += len(expanded)
+            self._truncated = self._truncated or len(expanded) > width
+            beam = heapq.nsmallest(width, expanded)
+            if not beam:
+                return []
+
+        results = []
+        for total, _, _, _, chain in beam:
+            placements: List[Placement] = []
+            for index in range(self.rows * self.cols - 1, -1, -1):
+                piece_id, rotation, chain = chain
+                placements.append((piece_id, *divmod(index, cols), rotation))
+            results.append((total, placements[::-1]))
+        return results
+
+    def assemble(self, top: int = 1, timeout: Optional[float] = None) -> List[Tuple[float, List[Placement]]]:
+        """求代价最小的若干个拼装
+
+        不限时间时按 beam_width 搜索一遍。指定 timeout 时，在时间预算内把束宽度逐次加倍重新搜索，
+        返回所有已完成的搜索中代价最小的拼装；第一遍搜索都没有完成时抛出 TimeoutError。
+
+        Args:
+            top: 返回的拼装数量
+            timeout: 时间预算(秒)
+
+        Returns:
+            按代价从小到大排列的 (代价, 解决方案)，每个解决方案为行优先顺序的 (piece_id, row, col, rotation)
+        """
+        self.stats = {'passes': 0, 'beam_width': 0, 'expanded': 0}
+        deadline = None if timeout is None else time.monotonic() + timeout
+        best: Dict[Tuple[Placement, ...], float] = {}
+        width = self.beam_width
+        while True:
+            try:
+                results = self._run(width, deadline)
+            except TimeoutError:
+                if not self.stats['passes']:
+                    raise
+                break
+            self.stats['passes'] += 1
+            self.stats['beam_width'] = width
+            for total, placements in results:
+                best[tuple(placements)] = total
+            # 每一层都没有被截断时已经是穷举，再加宽也不会改变结果
+            if deadline is None or not self._truncated:
+                break
+            width *= 2
+        ranked = sorted(best.items(), key=lambda item: (item[1], item[0]))
+        return [(total, list(placements)) for placements, total in ranked[:top]]
@@ -0,0 +1,334 @@
+from typing import Iterable, List, Optional, Tuple, cast
+import heapq
+
+
+def luby(i: int) -> int:
+    """Luby 序列的第i项 (i从1开始): 1, 1, 2, 1, 1, 2, 4, 1, ..."""
+    while True:
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+        if i == (1 << k) - 1:
+            return 1 << (k - 1)
+        i -= (1 << (k - 1)) - 1
+
+
+class CdclSolver:
+    """纯Python实现的CDCL(冲突驱动子句学习) SAT求解器
+
+    文字使用DIMACS约定: 变量为正整数，否定为对应的负数。
+    实现了双观察文字传播、1UIP冲突分析、VSIDS变量选择、相位保存、
+    Luby重启以及学习子句的定期清理。支持在两次求解之间追加子句(例如阻塞子句)。
+    """
+
+    RESTART_UNIT = 100
+    VAR_DECAY = 0.95
+    REDUCE_INTERVAL = 2000
+
+    def __init__(self, num_vars: int = 0):
+        self.num_vars = 0
+        self._capacity = 0
+        # 按文字下标的数组: 利用Python的负数下标，lit 和 -lit 共用同一个列表
+        self._lit_value: List[int] = [0]
+        self._watches: List[List[int]] = [[]]
+        self._level: List[int] = [0]
+        self._reason: List[int] = [-1]
+        self._activity: List[float] = [0.0]
+        self._phase: List[bool] = [False]
+        self._seen: List[bool] = [False]
+        self._clauses: List[Optional[List[int]]] = []
+        self._learnts: List[int] = []
+        self._trail: List[int] = []
+        self._trail_lim: List[int] = []
+        self._qhead = 0
+        self._heap: List[Tuple[float, int]] = []
+        self._var_inc = 1.0
+        self._unsat = False
+        self._next_reduce = self.REDUCE_INTERVAL
+        self.conflicts = 0
+        self.decisions = 0
+        self.propagations = 0
+        self.ensure_vars(num_vars)
+
+    def ensure_vars(self, num_vars: int) -> None:
+        """确保变量 1..num_vars 存在"""
+        if num_vars <= self.num_vars:
+            return
+        if num_vars > self._capacity:
+            self._grow(max(num_vars, 2 * self._capacity))
+        for var in range(self.num_vars + 1, num_vars + 1):
+            self._level.append(0)
+            self._reason.append(-1)
+            self._activity.append(0.0)
+            self._phase.append(False)
+            self._seen.append(False)
+            heapq.heappush(self._heap, (0.0, var))
+        self.num_vars = num_vars
+
+    def set_phase(self, var: int, value: bool) -> None:
+        """设置变量首次被选为决策变量时尝试的取值"""
+        self.ensure_vars(var)
+        self._phase[var] = value
+
+    def _grow(self, capacity: int) -> None:
+        """扩大按文字下标的数组"""
+        size = 2 * capacity + 1
+        lit_value = [0] * size
+        watches: List[List[int]] = [[] for _ in range(size)]
+        for var in range(1, self.num_vars + 1):
+            for lit in (var, -var):
+                lit_value[lit] = self._lit_value[lit]
+                watches[lit] = self._watches[lit]
+        self._lit_value = lit_value
+        self._watches = watches
+        self._capacity = capacity
+
+    def _enqueue(self, lit: int, reason: int) -> None:
+        var = abs(lit)
+        self._lit_value[lit] = 1
+        self._lit_value[-lit] = -1
+        self._level[var] = len(self._trail_lim)
+        self._reason[var] = reason
+        self._trail.append(lit)
+
+    def add_clause(self, lits: Iterable[int]) -> bool:
+        """追加一个子句
+
+        追加前会撤销当前的赋值，因此需要先读取 model()。
+
+        Returns:
+            bool: 公式在顶层是否仍可能可满足
+        """
+        if self._unsat:
+            return False
+        self._backtrack(0)
+        clause: List[int] = []
+        for lit in lits:
+            self.ensure_vars(abs(lit))
+            value = self._lit_value[lit]
+            if value > 0 or -lit in clause:
+                return True  # 顶层已满足或是重言式
+            if value == 0 and lit not in clause:
+                clause.append(lit)
+        if not clause:
+            self._unsat = True
+            return False
+        if len(clause) == 1:
+            self._enqueue(clause[0], -1)
+            if self._propagate() >= 0:
+                self._unsat = True
+            return not self._unsat
+        self._attach(clause)
+        return True
+
+    def _attach(self, clause: List[int]) -> int:
+        index = len(self._clauses)
+        self._clauses.append(clause)
+        self._watches[clause[0]].append(index)
+        self._watches[clause[1]].append(index)
+        return index
+
+    def _propagate(self) -> int:
+        """单元传播，返回冲突子句的编号，没有冲突时返回-1"""
+        clauses, lit_value, all_watches, trail = (
+            self._clauses, self._lit_value, self._watches, self._trail)
+        while self._qhead < len(trail):
+            false_lit = -trail[self._qhead]
+            self._qhead += 1
+            self.propagations += 1
+            watchers = all_watches[false_lit]
+            i = j = 0
+            end = len(watchers)
+            while i < end:
+                ci = watchers[i]
+                i += 1
+                clause = clauses[ci]
+                if clause is None:
+                    continue  # 已被清理的学习子句
+                if clause[0] == false_lit:
+                    clause[0], clause[1] = clause[1], false_lit
+                first = clause[0]
+                if lit_value[first] > 0:
+                    watchers[j] = ci
+                    j += 1
+                    continue
+                for k in range(2, len(clause)):
+                    lit = clause[k]
+                    if lit_value[lit] >= 0:
+                        clause[1], clause[k] = lit, false_lit
+                        all_watches[lit].append(ci)
+                        break
+                else:
+                    watchers[j] = ci
+                    j += 1
+                    if lit_value[first] < 0:
+                        watchers[j:] = watchers[i:]
+                        return ci
+                    self._enqueue(first, ci)
+            del watchers[j:]
+        return -1
+
+    def _bump(self, var: int) -> None:
+        self._activity[var] += self._var_inc
+        if self._activity[var] > 1e100:
+            for v in range(1, self.num_vars + 1):
+                self._activity[v] *= 1e-100
+            self._var_inc *= 1e-100
+            self._rebuild_heap()
+        elif len(self._heap) > 8 * self.num_vars + 64:
+            # 堆中过期条目过多时重建
+            self._rebuild_heap()
+        else:
+            heapq.heappush(self._heap, (-self._activity[var], var))
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [(-self._activity[v], v) for v in range(1, self.num_vars + 1)
+                      if self._lit_value[v] == 0]
+        heapq.heapify(self._heap)
+
+    def _analyze(self, conflict: int) -> Tuple[List[int], int]:
+        """1UIP冲突分析，返回 (学习子句, 回退层级)"""
+        seen, level, trail = self._seen, self._level, self._trail
+        # 冲突子句和传播原因子句都不会被删除
+        clauses = cast(List[List[int]], self._clauses)
+        current = len(self._trail_lim)
+        learnt = [0]
+        counter = 0
+        lit = 0
+        index = len(trail) - 1
+        clause = clauses[conflict]
+        while True:
+            for q in (clause if lit == 0 else clause[1:]):
+                var = abs(q)
+                if not seen[var] and level[var] > 0:
+                    seen[var] = True
+                    self._bump(var)
+                    if level[var] >= current:
+                        counter += 1
+                    else:
+                        learnt.append(q)
+            while not seen[abs(trail[index])]:
+                index -= 1
+            lit = trail[index]
+            index -= 1
+            seen[abs(lit)] = False
+            counter -= 1
+            if counter == 0:
+                break
+            clause = clauses[self._reason[abs(lit)]]
+        learnt[0] = -lit
+        for q in learnt[1:]:
+            seen[abs(q)] = False
+
+        back_level = 0
+        if len(learnt) > 1:
+            best = max(range(1, len(learnt)), key=lambda k: level[abs(learnt[k])])
+            learnt[1], learnt[best] = learnt[best], learnt[1]
+            back_level = level[abs(learnt[1])]
+        return learnt, back_level
+
+    def _reduce_learnts(self) -> None:
+        """删除一半较长的学习子句，作为传播原因的子句保留"""
+        # _learnts 中只有尚未删除的学习子句
+        clauses = cast(List[List[int]], self._clauses)
+        keep, candidates = [], []
+        for ci in self._learnts:
+            clause = clauses[ci]
+            if len(clause) <= 2 or (self._reason[abs(clause[0])] == ci and
+                                    self._lit_value[clause[0]] > 0):
+                keep.append(ci)
+            else:
+                candidates.append(ci)
+        candidates.sort(key=lambda ci: len(clauses[ci]))
+        half = len(candidates) // 2
+        for ci in candidates[half:]:
+            self._clauses[ci] = None
+        self._learnts = keep + candidates[:half]
+
+    def _backtrack(self, target: int) -> None:
+        if len(self._trail_lim) <= target:
+            return
+        start = self._trail_lim[target]
+        lit_value, heap, activity = self._lit_value, self._heap, self._activity
+        for lit in self._trail[start:]:
+            var = abs(lit)
+            self._phase[var] = lit > 0
+            lit_value[lit] = lit_value[-lit] = 0
+            self._reason[var] = -1
+            heapq.heappush(heap, (-activity[var], var))
+        del self._trail[start:]
+        del self._trail_lim[target:]
+        self._qhead = len(self._trail)
+
+    def _pick_branch(self) -> int:
+        heap, lit_value = self._heap, self._lit_value
+        while heap:
+            _, var = heapq.heappop(heap)
+            if lit_value[var] == 0:
+                return var if self._phase[var] else -var
+        for var in range(1, self.num_vars + 1):
+            if lit_value[var] == 0:
+                return var if self._phase[var] else -var
+        return 0
+
+    def solve(self, conflict_limit: Optional[int] = None) -> Optional[bool]:
+        """求解当前公式
+
+        Args:
+            conflict_limit: 冲突次数上限，为空时不限制
+
+        Returns:
+            True表示可满足，False表示不可满足，None表示达到上限仍未确定
+        """
+        if self._unsat:
+            return False
+        self._backtrack(0)
+        if self._propagate() >= 0:
+            self._unsat = True
+            return False
+
+        restarts = 0
+        budget = luby(1) * self.RESTART_UNIT
+        conflicts_at_start = self.conflicts
+        while True:
+            conflict = self._propagate()
+            if conflict >= 0:
+                self.conflicts += 1
+                if not self._trail_lim:
+                    self._unsat = True
+                    return False
+                learnt, back_level = self._analyze(conflict)
+                self._backtrack(back_level)
+                if len(learnt) == 1:
+                    self._enqueue(learnt[0], -1)
+                else:
+                    index = self._attach(learnt)
+                    self._learnts.append(index)
+                    self._enqueue(learnt[0], index)
+                self._var_inc /= self.VAR_DECAY
+                budget -= 1
+                if conflict_limit is not None and \
+                   self.conflicts - conflicts_at_start >= conflict_limit:
+                    self._backtrack(0)
+                    return None
+                continue
+
+            if self.conflicts >= self._next_reduce:
+                self._next_reduce = self.conflicts + self.REDUCE_INTERVAL + len(self._learnts) // 2
+                self._reduce_learnts()
+            if budget <= 0:
+                restarts += 1
+                budget = luby(restarts + 1) * self.RESTART_UNIT
+                self._backtrack(0)
+                continue
+
+            lit = self._pick_branch()
+            if lit == 0:
+                return True
+            self.decisions += 1
+            self._trail_lim.append(len(self._trail))
+            self._enqueue(lit, -1)
+
+    def model(self) -> List[int]:
+        """最近一次可满足求解的赋值，按变量顺序给出取真的文字"""
+        return [var if self._lit_value[var] > 0 else -var for var in range(1, self.num_vars + 1)]
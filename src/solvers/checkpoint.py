@@ -0,0 +1,110 @@
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+import hashlib
+import json
+import os
+import tempfile
+from ..models.puzzle import JigsawPuzzle
+from .search_state import SearchState
+from .transposition import TranspositionTable
+
+if TYPE_CHECKING:
+    from .puzzle_solver import PuzzleSolver
+
+CHECKPOINT_VERSION = 1
+# 游标文件: 断点文件路径加上这个后缀
+CURSOR_SUFFIX = '.cursor'
+
+
+def puzzle_fingerprint(puzzle: JigsawPuzzle) -> str:
+    """拼图内容(大小、拼图片id、未旋转的边缘值和类型)的哈希，用于确认断点属于同一个拼图"""
+    payload = json.dumps([puzzle.rows, puzzle.cols,
+                          [[piece.id, list(piece.edges_at(0)), piece.is_corner, piece.is_edge]
+                           for piece in puzzle.pieces]])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def save_checkpoint(path: str, puzzle: JigsawPuzzle, state: SearchState, emitted: int) -> None:
+    """原子地写入断点文件
+
+    Args:
+        path: 断点文件路径
+        puzzle: 正在求解的拼图
+        state: 搜索状态，必须处于两次放置之间(例如刚产生一个解或一批节点搜索完毕)
+        emitted: 已经产生的解数量
+    """
+    data: Dict[str, Any] = {
+        'version': CHECKPOINT_VERSION,
+        'puzzle': puzzle_fingerprint(puzzle),
+        'emitted': emitted,
+        'state': state.to_dict(),
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str, solver: 'PuzzleSolver',
+                    table: Optional[TranspositionTable] = None) -> Tuple[SearchState, int]:
+    """读取断点文件
+
+    Args:
+        path: 断点文件路径
+        solver: 求解器
+        table: 恢复后的搜索使用的置换表
+
+    Returns:
+        (搜索状态, 已经产生的解数量)
+
+    Raises:
+        ValueError: 断点文件版本不支持或不属于该拼图
+    """
+    with open(path) as f:
+        data = json.load(f)
+    if data.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"不支持的断点文件版本: {data.get('version')}")
+    if data['puzzle'] != puzzle_fingerprint(solver.puzzle):
+        raise ValueError("断点文件不属于该拼图")
+    return SearchState.from_dict(solver, data['state'], table=table), data['emitted']
+
+
+class EmittedCursor:
+    """与断点文件放在一起的追加式游标文件，记录已经交出的解数量
+
+    断点只每隔一段时间完整写入一次；两次写入之间每交出一个解，只在游标文件末尾追加一行
+    交出后的解数量(一次很小的 write，不重写断点)。进程在两次写入断点之间被强制终止时，
+    从断点恢复的搜索会重新产生断点之后的解，其中前 read_cursor() - emitted 个已经交出过，应当跳过。
+    游标记录的是累计数量，旧断点遗留的行不会大于新断点的 emitted，不影响结果。
+    """
+
+    def __init__(self, path: str, fresh: bool):
+        """
+        Args:
+            path: 断点文件路径
+            fresh: 是否从头开始搜索，是则清空之前运行遗留的游标
+        """
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | (os.O_TRUNC if fresh else 0)
+        self._fd = os.open(path + CURSOR_SUFFIX, flags, 0o644)
+
+    def record(self, emitted: int) -> None:
+        """记录已经交出的解数量"""
+        os.write(self._fd, b'%d\n' % emitted)
+
+    def reset(self) -> None:
+        """断点写入之后清空游标，之前的行已经全部计入断点"""
+        os.ftruncate(self._fd, 0)
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def read_cursor(path: str) -> int:
+    """读取断点文件对应的游标记录的已交出解数量，没有游标时返回0"""
+    try:
+        with open(path + CURSOR_SUFFIX, 'rb') as f:
+            lines = f.read().split(b'\n')
+    except FileNotFoundError:
+        return 0
+    # 最后一行可能在写入途中被打断，只统计完整的行
+    return max((int(line) for line in lines[:-1] if line.isdigit()), default=0)
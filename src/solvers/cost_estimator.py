@@ -0,0 +1,159 @@
+from collections import Counter
+from statistics import NormalDist
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Tuple
+import math
+import random
+import time
+from .search_state import CandidateIndex, Edges, Placement
+
+if TYPE_CHECKING:
+    from .puzzle_solver import PuzzleSolver
+
+
+class SearchCostEstimator:
+    """用 Knuth 随机探测估计回溯搜索树的大小
+
+    搜索树与 PuzzleSolver 的回溯搜索一致: 按行优先顺序逐个位置放置，
+    每个节点的子节点是能放在下一个位置的 (拼图片, 旋转角度)。
+    每次探测从根出发，每层随机选择一个子节点走到底，
+    路径上各层分支数的前缀积之和是整棵树节点数的无偏估计。
+    """
+
+    def __init__(self, solver: 'PuzzleSolver'):
+        self.solver = solver
+        self.rows, self.cols = solver.puzzle.rows, solver.puzzle.cols
+        self.index = CandidateIndex(solver)
+
+    def probe(self, rng: random.Random) -> Tuple[float, float, List[int]]:
+        """随机走一条从根到叶的路径
+
+        Returns:
+            (节点数估计, 解数量估计, 路径上各层的分支数)
+        """
+        rows, cols = self.rows, self.cols
+        # 按行优先顺序放置，只会读取已放置的上方和左侧邻居，其余位置的占位值不会被用到
+        grid: List[List[Edges]] = [[(0, 0, 0, 0)] * cols for _ in range(rows)]
+        used: Set[int] = set()
+        nodes, weight = 1.0, 1.0
+        branching: List[int] = []
+        for index in range(rows * cols):
+            row, col = divmod(index, cols)
+            up = -grid[row-1][col][2] if row > 0 else 0
+            left = -grid[row][col-1][1] if col > 0 else 0
+            children = [option for option in self.index.options(row, col, up, left)
+                        if option[0] not in used]
+            branching.append(len(children))
+            if not children:
+                return nodes, 0.0, branching
+            weight *= len(children)
+            nodes += weight
+            piece_id, _, edges = rng.choice(children)
+            used.add(piece_id)
+            grid[row][col] = edges
+        return nodes, weight, branching
+
+    def edge_value_stats(self) -> Dict[str, float]:
+        """边缘值的分布: 不同的非零边缘值(按绝对值)数量，以及每个值平均出现在多少条边上"""
+        counts = Counter(abs(value) for piece in self.solver.puzzle.pieces
+                         for value in piece.edges_at(0) if value)
+        return {
+            'distinct_edge_values': len(counts),
+            'edges_per_value': sum(counts.values()) / len(counts) if counts else 0.0,
+        }
+
+    def estimate(self, time_budget: float = 0.05, max_probes: Optional[int] = None,
+                 confidence: float = 0.95, seed: Optional[int] = None) -> Dict[str, Any]:
+        rng = random.Random(seed)
+        start = time.perf_counter()
+        node_samples: List[float] = []
+        solution_samples: List[float] = []
+        candidate_total = candidate_count = max_candidates = dead_ends = 0
+        while not node_samples or (time.perf_counter() - start < time_budget and
+                                   (max_probes is None or len(node_samples) < max_probes)):
+            nodes, solutions, branching = self.probe(rng)
+            node_samples.append(nodes)
+            solution_samples.append(solutions)
+            candidate_total += sum(branching)
+            candidate_count += len(branching)
+            max_candidates = max(max_candidates, max(branching))
+            dead_ends += solutions == 0
+
+        probes = len(node_samples)
+        mean = sum(node_samples) / probes
+        spread = 0.0
+        if probes > 1:
+            variance = sum((x - mean) ** 2 for x in node_samples) / (probes - 1)
+            spread = NormalDist().inv_cdf(0.5 + confidence / 2) * math.sqrt(variance / probes)
+        result: Dict[str, Any] = {
+            'nodes': mean,
+            'nodes_low': max(1.0, mean - spread),
+            'nodes_high': mean + spread,
+            'solutions': sum(solution_samples) / probes,
+            'probes': probes,
+            'dead_end_rate': dead_ends / probes,
+            'mean_candidates': candidate_total / candidate_count,
+            'max_candidates': max_candidates,
+            'elapsed': time.perf_counter() - start,
+        }
+        result.update(self.edge_value_stats())
+        return result
+
+    def population_estimate(self, particles: int = 64, seed: Optional[int] = None,
+                            prefix: Sequence[Placement] = ()) -> Dict[str, float]:
+        """用一组同时前进并按权重重采样的随机路径估计搜索树大小和解数量
+
+        拼图中死路很多时，单条随机路径几乎总是走不到叶子，Knuth 估计的解数量几乎总是0。
+        这里同时维护 particles 条路径: 每层按各条路径的分支数加权重采样，
+        再为每条路径随机选一个子节点，走入死路的路径由存活的路径补上。
+        第t层的节点数估计为前t层平均分支数之积(序贯重要性采样，无偏)，解数量即最后一层的估计。
+
+        Args:
+            particles: 同时维护的随机路径数
+            seed: 随机数种子
+            prefix: 按行优先顺序固定的前若干个位置的摆放，只估计以它为根的子树
+
+        Returns:
+            Dict[str, float]: nodes, solutions 以及存活路径上每个位置的平均候选数 mean_candidates
+        """
+        rng = random.Random(seed)
+        rows, cols = self.rows, self.cols
+        bits = {piece.id: 1 << i for i, piece in enumerate(self.solver.puzzle.pieces)}
+        pieces = {piece.id: piece for piece in self.solver.puzzle.pieces}
+        # 只会读取已放置的上方和左侧邻居，占位值不会被用到
+        window: Tuple[Edges, ...] = ((0, 0, 0, 0),) * cols
+        used = 0
+        for piece_id, _, _, rotation in prefix:
+            window = window[1:] + (pieces[piece_id].edges_at(rotation),)
+            used |= bits[piece_id]
+        # 每条路径: (最近放置的 cols 个位置的边缘值, 已使用拼图片的位掩码)
+        population: List[Tuple[Tuple[Edges, ...], int]] = [(window, used)] * particles
+        level = nodes = 1.0
+        candidate_total = levels = 0
+        for index in range(len(prefix), rows * cols):
+            row, col = divmod(index, cols)
+            choices = []
+            for window, used in population:
+                up = -window[0][2] if row > 0 else 0
+                left = -window[-1][1] if col > 0 else 0
+                choices.append([option for option in self.index.options(row, col, up, left)
+                                if not used & bits[option[0]]])
+            weights = [len(children) for children in choices]
+            total = sum(weights)
+            candidate_total += total
+            levels += 1
+            level *= total / particles
+            nodes += level
+            if not total:
+                break
+            survivors = rng.choices(range(particles), weights=weights, k=particles)
+            next_population = []
+            for i in survivors:
+                piece_id, _, edges = rng.choice(choices[i])
+                window, used = population[i]
+                next_population.append((window[1:] + (edges,), used | bits[piece_id]))
+            population = next_population
+        return {
+            'nodes': nodes,
+            'solutions': level,
+            'mean_candidates': candidate_total / (levels * particles) if levels else 0.0,
+        }
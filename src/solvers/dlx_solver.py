@@ -0,0 +1,323 @@
+from typing import Dict, Generator, Iterator, List, Optional, Tuple
+import time
+from ..models.puzzle import JigsawPuzzle
+from .puzzle_solver import PuzzleSolver
+from .transposition import TranspositionTable
+
+Solution = List[Tuple[int, int, int, int]]
+
+
+class DancingLinksSolver(PuzzleSolver):
+    """基于舞蹈链(Dancing Links)的精确覆盖求解器
+
+    把拼图建模为带颜色的精确覆盖问题(Knuth 的 Algorithm C):
+    - 主列: 每个位置和每个拼图片各一列，必须恰好被覆盖一次
+    - 次列: 每条内部接缝一列，颜色为接缝的边缘值，相邻两侧的颜色必须一致
+    - 行: 每个 (拼图片, 位置, 旋转角度) 的组合，已预先排除类型和外边缘不符的组合
+
+    每一步选择剩余候选最少的主列(S启发式)。解的格式与 PuzzleSolver 相同。
+    """
+
+    def __init__(self, puzzle: JigsawPuzzle):
+        super().__init__(puzzle)
+        self._build()
+
+    def _build(self) -> None:
+        """构建舞蹈链的链表结构"""
+        rows, cols = self.puzzle.rows, self.puzzle.cols
+        pieces = self.puzzle.pieces
+        cells = rows * cols
+        piece_item = {piece.id: cells + 1 + i for i, piece in enumerate(pieces)}
+        # 拼图片数量与位置数量一致时，每个拼图片也必须恰好使用一次
+        primary = cells + len(pieces) if len(pieces) == cells else cells
+        h_seam = {(r, c): 0 for r in range(rows) for c in range(cols - 1)}
+        v_seam = {(r, c): 0 for r in range(rows - 1) for c in range(cols)}
+        item_count = cells + len(pieces)
+        for key in h_seam:
+            item_count += 1
+            h_seam[key] = item_count
+        for key in v_seam:
+            item_count += 1
+            v_seam[key] = item_count
+
+        # 主列组成以0为表头的环形链表，次列组成以 item_count+1 为表头的环形链表
+        self._llink = list(range(item_count + 2))
+        self._rlink = list(range(item_count + 2))
+        for first, last, head in ((1, primary, 0), (primary + 1, item_count, item_count + 1)):
+            chain = [head] + list(range(first, last + 1))
+            for a, b in zip(chain, chain[1:] + chain[:1]):
+                self._rlink[a] = b
+                self._llink[b] = a
+
+        # 节点数组: 0..item_count 为列头，之后依次存放各行的节点和分隔节点
+        self._top = [0] * (item_count + 1)
+        self._ulink = list(range(item_count + 1))
+        self._dlink = list(range(item_count + 1))
+        self._color = [0] * (item_count + 1)
+        self._size = [0] * (item_count + 1)
+        self._options: List[Tuple[int, int, int, int]] = []
+        self._node_option: List[int] = [-1] * (item_count + 1)
+        colors: Dict[int, int] = {}
+
+        def color_of(value: int) -> int:
+            # 颜色必须为正数，0表示没有颜色
+            return colors.setdefault(value, len(colors) + 1)
+
+        spacer = self._add_spacer(0)
+        for r in range(rows):
+            for c in range(cols):
+                for piece in pieces:
+                    for rotation, edges in self._orientations(piece, r, c):
+                        items = [(r * cols + c + 1, 0), (piece_item[piece.id], 0)]
+                        if c < cols - 1:
+                            items.append((h_seam[(r, c)], color_of(edges[1])))
+                        if c > 0:
+                            items.append((h_seam[(r, c - 1)], color_of(-edges[3])))
+                        if r < rows - 1:
+                            items.append((v_seam[(r, c)], color_of(edges[2])))
+                        if r > 0:
+                            items.append((v_seam[(r - 1, c)], color_of(-edges[0])))
+                        spacer = self._add_option(spacer, items, (piece.id, r, c, rotation))
+
+    def _add_spacer(self, first: int) -> int:
+        """追加一个分隔节点，其ULINK指向前一行的第一个节点"""
+        x = len(self._top)
+        self._top.append(-len(self._options))
+        self._ulink.append(first)
+        self._dlink.append(x)
+        self._color.append(0)
+        self._node_option.append(-1)
+        return x
+
+    def _add_option(self, spacer: int, items: List[Tuple[int, int]],
+                    option: Tuple[int, int, int, int]) -> int:
+        """追加一行，返回新的结尾分隔节点"""
+        index = len(self._options)
+        self._options.append(option)
+        first = len(self._top)
+        for item, color in items:
+            x = len(self._top)
+            self._top.append(item)
+            self._color.append(color)
+            self._node_option.append(index)
+            self._ulink.append(self._ulink[item])
+            self._dlink.append(item)
+            self._dlink[self._ulink[item]] = x
+            self._ulink[item] = x
+            self._size[item] += 1
+        # 前一个分隔节点的DLINK指向本行的最后一个节点
+        self._dlink[spacer] = len(self._top) - 1
+        return self._add_spacer(first)
+
+    def _hide(self, p: int) -> None:
+        """从除p所在列以外的列中删除p所在的行"""
+        top, ulink, dlink, color, size = self._top, self._ulink, self._dlink, self._color, self._size
+        q = p + 1
+        while q != p:
+            x = top[q]
+            if x <= 0:
+                q = ulink[q]
+            elif color[q] < 0:
+                q += 1
+            else:
+                u, d = ulink[q], dlink[q]
+                dlink[u] = d
+                ulink[d] = u
+                size[x] -= 1
+                q += 1
+
+    def _unhide(self, p: int) -> None:
+        """按相反顺序恢复 _hide 删除的节点"""
+        top, ulink, dlink, color, size = self._top, self._ulink, self._dlink, self._color, self._size
+        q = p - 1
+        while q != p:
+            x = top[q]
+            if x <= 0:
+                q = dlink[q]
+            elif color[q] < 0:
+                q -= 1
+            else:
+                u, d = ulink[q], dlink[q]
+                dlink[u] = q
+                ulink[d] = q
+                size[x] += 1
+                q -= 1
+
+    def _cover(self, i: int) -> None:
+        p = self._dlink[i]
+        while p != i:
+            self._hide(p)
+            p = self._dlink[p]
+        left, right = self._llink[i], self._rlink[i]
+        self._rlink[left] = right
+        self._llink[right] = left
+
+    def _uncover(self, i: int) -> None:
+        left, right = self._llink[i], self._rlink[i]
+        self._rlink[left] = i
+        self._llink[right] = i
+        p = self._ulink[i]
+        while p != i:
+            self._unhide(p)
+            p = self._ulink[p]
+
+    def _purify(self, p: int) -> None:
+        """删除接缝列中与p颜色不同的行，颜色相同的行标记为已满足"""
+        c, i = self._color[p], self._top[p]
+        q = self._dlink[i]
+        while q != i:
+            if self._color[q] != c:
+                self._hide(q)
+            elif q != p:
+                self._color[q] = -1
+            q = self._dlink[q]
+
+    def _unpurify(self, p: int) -> None:
+        c, i = self._color[p], self._top[p]
+        q = self._ulink[i]
+        while q != i:
+            if self._color[q] < 0:
+                self._color[q] = c
+            elif q != p:
+                self._unhide(q)
+            q = self._ulink[q]
+
+    def _commit(self, p: int, j: int) -> None:
+        if self._color[p] == 0:
+            self._cover(j)
+        elif self._color[p] > 0:
+            self._purify(p)
+
+    def _uncommit(self, p: int, j: int) -> None:
+        if self._color[p] == 0:
+            self._uncover(j)
+        elif self._color[p] > 0:
+            self._unpurify(p)
+
+    def _choose_item(self) -> int:
+        """S启发式: 选择剩余候选最少的主列"""
+        rlink, size = self._rlink, self._size
+        best = i = rlink[0]
+        while i != 0:
+            if size[i] < size[best]:
+                best = i
+                if size[i] == 0:
+                    break
+            i = rlink[i]
+        return best
+
+    def _commit_option(self, x: int) -> None:
+        """选择节点x所在的行: 提交该行的其余列"""
+        top = self._top
+        p = x + 1
+        while p != x:
+            j = top[p]
+            if j <= 0:
+                p = self._ulink[p]
+            else:
+                self._commit(p, j)
+                p += 1
+
+    def _uncommit_option(self, x: int) -> None:
+        """按相反顺序撤销 _commit_option"""
+        top = self._top
+        p = x - 1
+        while p != x:
+            j = top[p]
+            if j <= 0:
+                p = self._dlink[p]
+            else:
+                self._uncommit(p, j)
+                p -= 1
+
+    def _search(self, deadline: Optional[float] = None) -> Generator[List[int], None, None]:
+        """Algorithm C 的搜索，用显式栈代替递归，大拼图不受递归深度限制
+
+        items[k] 为第k层覆盖的主列，chosen[k] 为该列当前尝试的行节点。
+        无论正常结束、超时还是调用方提前关闭生成器，退出时都按相反顺序撤销所有选择，链表恢复原状。
+
+        Args:
+            deadline: time.monotonic() 的截止时间，超过时抛出 TimeoutError
+        """
+        items: List[int] = []
+        chosen: List[int] = []
+        nodes = 0
+        try:
+            while True:
+                descend = False
+                if self._rlink[0] == 0:
+                    yield chosen
+                else:
+                    i = self._choose_item()
+                    if self._size[i] > 0:
+                        self._cover(i)
+                        items.append(i)
+                        x = self._dlink[i]
+                        chosen.append(x)
+                        self._commit_option(x)
+                        descend = True
+                if descend:
+                    nodes += 1
+                    if deadline is not None and nodes % self.CHECKPOINT_NODES == 0 and \
+                       time.monotonic() > deadline:
+                        raise TimeoutError("求解超时")
+                    continue
+                # 回溯: 换到最近一层的下一行，该层的行都试过时撤销该层
+                while items:
+                    i = items[-1]
+                    x = chosen.pop()
+                    self._uncommit_option(x)
+                    x = self._dlink[x]
+                    if x != i:
+                        chosen.append(x)
+                        self._commit_option(x)
+                        break
+                    items.pop()
+                    self._uncover(i)
+                else:
+                    return
+        finally:
+            while items:
+                self._uncommit_option(chosen.pop())
+                self._uncover(items.pop())
+
+    def find_all_solutions(self, max_solutions: int = 1000, greedy: Optional[bool] = None,
+                           checkpoint: Optional[str] = None, resume_from: Optional[str] = None,
+                           checkpoint_interval: float = 60.0,
+                           transposition: Optional[TranspositionTable] = None,
+                           timeout: Optional[float] = None) -> Iterator[Solution]:
+        """找出所有可能的拼图解决方案
+
+        参数与 PuzzleSolver.find_all_solutions 相同。断点和置换表记录的是逐个位置回溯搜索的状态，
+        指定 checkpoint、resume_from 或 transposition 时按 PuzzleSolver 的方式搜索。
+
+        Args:
+            max_solutions: 最大解决方案数量
+            greedy: 是否先尝试贪心拼接，含义同 PuzzleSolver
+            timeout: 搜索的超时时间(秒)，超时抛出 TimeoutError(之前已经产生的解仍然有效)
+
+        Returns:
+            Iterator[List[Tuple[int, int, int, int]]]: 解决方案生成器
+        """
+        if checkpoint is not None or resume_from is not None or transposition is not None:
+            yield from super().find_all_solutions(max_solutions, greedy, checkpoint, resume_from,
+                                                  checkpoint_interval, transposition, timeout)
+            return
+        if max_solutions <= 0 or self.precheck() is not None:
+            return
+        assembled = self._greedy_solutions(greedy)
+        if assembled is not None:
+            yield from assembled[:max_solutions]
+            return
+        count = 0
+        search = self._search(None if timeout is None else time.monotonic() + timeout)
+        try:
+            for chosen in search:
+                solution = [self._options[self._node_option[x]] for x in chosen]
+                yield sorted(solution, key=lambda item: (item[1], item[2]))
+                count += 1
+                if count >= max_solutions:
+                    return
+        finally:
+            # 达到数量上限或调用方提前关闭时立即恢复链表，求解器可以再次使用
+            search.close()
@@ -0,0 +1,90 @@
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+from ..models.direction import Direction
+from .search_state import Option
+
+if TYPE_CHECKING:
+    from .puzzle_solver import PuzzleSolver
+
+Cell = Tuple[int, int]
+# 提示的候选: (拼图片id, 旋转角度)
+Candidate = Tuple[int, int]
+
+# 四个邻居: (行偏移, 列偏移, 本拼图片相接的边, 邻居相接的边)
+_NEIGHBOURS = ((-1, 0, 0, Direction.DOWN), (0, 1, 1, Direction.LEFT),
+               (1, 0, 2, Direction.UP), (0, -1, 3, Direction.RIGHT))
+
+
+class HintIndex:
+    """回答 "这个空位置能放哪些拼图片" 的索引
+
+    静态部分按位置类别(是否在四条边上，最多9类)建立一次: 满足类型和外边缘要求的全部
+    (拼图片, 旋转角度)，再按 (方向, 边缘值) 分桶。动态部分是棋盘本身和拼图维护的
+    "已在棋盘上的拼图片" 计数，随 place_piece / remove_piece 增量更新，不需要重建索引。
+
+    查询一个位置时，用一个已放置邻居的边缘值直接取出对应的桶，再用其余邻居过滤，
+    代价只与桶的大小有关，与拼图片总数无关(没有已放置邻居的位置除外)。
+    """
+
+    def __init__(self, solver: 'PuzzleSolver'):
+        self.solver = solver
+        self.puzzle = solver.puzzle
+        self._index: Dict[Tuple[bool, bool, bool, bool], Dict[Optional[Tuple[int, int]], List[Option]]] = {}
+        self._piece_count = len(self.puzzle.pieces)
+
+    def _options(self, row: int, col: int, side: Optional[int] = None, value: int = 0) -> List[Option]:
+        """满足位置要求的候选；指定 side 时只返回该方向边缘值为 value 的候选"""
+        if len(self.puzzle.pieces) != self._piece_count:
+            # 建立索引之后又添加了拼图片
+            self._index.clear()
+            self._piece_count = len(self.puzzle.pieces)
+        rows, cols = self.puzzle.rows, self.puzzle.cols
+        signature = (row == 0, col == cols - 1, row == rows - 1, col == 0)
+        index = self._index.get(signature)
+        if index is None:
+            index = {None: []}
+            for piece in self.puzzle.pieces:
+                for rotation, edges in self.solver._orientations(piece, row, col):
+                    option = (piece.id, rotation, edges)
+                    index[None].append(option)
+                    for s in range(4):
+                        index.setdefault((s, edges[s]), []).append(option)
+            self._index[signature] = index
+        return index[None] if side is None else index.get((side, value), [])
+
+    def candidates(self, row: int, col: int) -> List[Candidate]:
+        """可以放在 (row, col) 的所有 (拼图片id, 旋转角度)
+
+        候选满足拼图片类型和外边缘要求，与所有已放置的邻居匹配，且尚未放在棋盘上。
+        位置已被占用时返回空列表。
+        """
+        rows, cols = self.puzzle.rows, self.puzzle.cols
+        if not (0 <= row < rows and 0 <= col < cols):
+            raise ValueError(f"位置越界: ({row}, {col})")
+        board = self.puzzle.board
+        if board[row][col] is not None:
+            return []
+        links = []
+        for dr, dc, side, facing in _NEIGHBOURS:
+            r, c = row + dr, col + dc
+            neighbour = board[r][c] if 0 <= r < rows and 0 <= c < cols else None
+            if neighbour is not None:
+                links.append((side, -neighbour.get_edge(facing)))
+        if links:
+            # 从最小的桶出发，再用其余邻居过滤
+            buckets = [self._options(row, col, side, value) for side, value in links]
+            first = min(range(len(links)), key=lambda i: len(buckets[i]))
+            options = buckets[first]
+            del links[first]
+        else:
+            options = self._options(row, col)
+        on_board = self.puzzle.is_on_board
+        return [(piece_id, rotation) for piece_id, rotation, edges in options
+                if all(edges[side] == value for side, value in links) and not on_board(piece_id)]
+
+    def hints(self, cells: Optional[Iterable[Cell]] = None) -> Dict[Cell, List[Candidate]]:
+        """一组位置各自的候选，cells 为None时查询所有空位置"""
+        if cells is None:
+            board = self.puzzle.board
+            cells = [(row, col) for row in range(self.puzzle.rows) for col in range(self.puzzle.cols)
+                     if board[row][col] is None]
+        return {(row, col): self.candidates(row, col) for row, col in cells}
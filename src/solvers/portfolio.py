@@ -0,0 +1,158 @@
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+import multiprocessing
+import queue
+import time
+from ..models.puzzle import JigsawPuzzle
+from ..serialization.puzzle_codec import puzzle_from_dict, puzzle_to_dict
+from .dlx_solver import DancingLinksSolver
+from .puzzle_solver import PuzzleSolver
+from .restart_search import RandomizedRestartSearch
+from .row_chain_solver import RowChainSolver
+from .sat_solver import SatPuzzleSolver
+from .symmetry import SymmetryReducedSolver
+from .transposition import TranspositionTable
+
+Solution = List[Tuple[int, int, int, int]]
+
+# 完整搜索的求解引擎，配置中除 'engine' 以外的键作为构造参数
+ENGINES = {
+    'backtrack': PuzzleSolver,
+    'dlx': DancingLinksSolver,
+    'row_chain': RowChainSolver,
+    'sat': SatPuzzleSolver,
+    'symmetry': SymmetryReducedSolver,
+}
+
+
+def _run_config(puzzle_data: Dict[str, Any], position: int, config: Dict[str, Any],
+                results: Any) -> None:
+    """组合中的一个求解进程: 按配置求出第一个解并放入结果队列
+
+    结果为 (配置序号, 解决方案, 是否已有定论, 错误信息)。
+    完整搜索的引擎没有找到解即证明无解；随机重启搜索只有走完整棵搜索树才算证明。
+    """
+    options = dict(config)
+    engine = options.pop('engine')
+    try:
+        puzzle = puzzle_from_dict(puzzle_data)
+        if engine == 'restart':
+            search = RandomizedRestartSearch(PuzzleSolver(puzzle), **options)
+            solution = search.solve()
+            settled = solution is not None or search.stats['exhausted']
+        else:
+            solver = ENGINES[engine](puzzle, **options)
+            solution = next(iter(solver.find_all_solutions(max_solutions=1)), None)
+            settled = True
+        results.put((position, solution, settled, None))
+    except Exception as exc:  # 单个配置失败不影响其他配置
+        results.put((position, None, False, f"{type(exc).__name__}: {exc}"))
+
+
+class PortfolioSolver(PuzzleSolver):
+    """并行运行多种求解配置，取最先得到的答案
+
+    每个配置在单独的进程中运行，可以是随机重启搜索(不同的位置顺序、传播级别和随机数种子)，
+    也可以是完整搜索的求解引擎。任何一个配置找到解或证明无解后，其余进程立即终止。
+    """
+
+    DEFAULT_CONFIGS: Tuple[Dict[str, Any], ...] = (
+        {'engine': 'restart', 'cell_order': 'row', 'propagation': 1, 'seed': 0},
+        {'engine': 'restart', 'cell_order': 'spiral', 'propagation': 1, 'seed': 1},
+        {'engine': 'restart', 'cell_order': 'column', 'propagation': 0, 'seed': 2},
+        {'engine': 'backtrack'},
+        {'engine': 'dlx'},
+        {'engine': 'sat'},
+    )
+
+    def __init__(self, puzzle: JigsawPuzzle, configs: Optional[Sequence[Dict[str, Any]]] = None):
+        """
+        Args:
+            puzzle: 要求解的拼图
+            configs: 参与竞争的配置列表，每个配置为一个字典，'engine' 为 'restart' 或 ENGINES 中的名称，
+                     其余键作为 RandomizedRestartSearch 或求解器的构造参数
+        """
+        super().__init__(puzzle)
+        self.configs = [dict(config) for config in (configs or self.DEFAULT_CONFIGS)]
+        for config in self.configs:
+            engine = config.get('engine')
+            if engine != 'restart' and engine not in ENGINES:
+                raise ValueError(f"未知的求解引擎: {engine}")
+        self.stats: Dict[str, Any] = {}
+
+    def solve_first(self, timeout: Optional[float] = None) -> Optional[Solution]:
+        """同时启动所有配置，返回最先得到的解
+
+        Args:
+            timeout: 超时时间(秒)，超时抛出 TimeoutError
+
+        Returns:
+            解决方案，无解时返回None
+        """
+        self.stats = {'winner': None, 'elapsed': 0.0, 'errors': []}
+        if self.precheck() is not None:
+            return None
+        start = time.monotonic()
+        ctx = multiprocessing.get_context()
+        results = ctx.Queue()
+        puzzle_data = puzzle_to_dict(self.puzzle)
+        processes = [
+            ctx.Process(target=_run_config, args=(puzzle_data, position, config, results), daemon=True)
+            for position, config in enumerate(self.configs)
+        ]
+        for process in processes:
+            process.start()
+
+        deadline = None if timeout is None else start + timeout
+        remaining = len(processes)
+        try:
+            while remaining:
+                wait = None if deadline is None else deadline - time.monotonic()
+                if wait is not None and wait <= 0:
+                    raise TimeoutError("组合求解超时")
+                try:
+                    result: Tuple[int, Optional[Solution], bool, Optional[str]] = results.get(timeout=wait)
+                except queue.Empty:
+                    continue
+                position, solution, settled, error = result
+                remaining -= 1
+                if error is not None:
+                    self.stats['errors'].append({'config': self.configs[position], 'error': error})
+                    continue
+                if settled:
+                    self.stats['winner'] = self.configs[position]
+                    return solution
+            if len(self.stats['errors']) == len(processes):
+                raise RuntimeError(f"所有求解配置均失败: {self.stats['errors']}")
+            return None
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            for process in processes:
+                process.join()
+            results.close()
+            self.stats['elapsed'] = time.monotonic() - start
+
+    def find_all_solutions(self, max_solutions: int = 1000, greedy: Optional[bool] = None,
+                           checkpoint: Optional[str] = None, resume_from: Optional[str] = None,
+                           checkpoint_interval: float = 60.0,
+                           transposition: Optional[TranspositionTable] = None,
+                           timeout: Optional[float] = None) -> Iterator[Solution]:
+        """组合求解只求第一个解，因此最多产生一个解决方案
+
+        参数含义与 PuzzleSolver.find_all_solutions 相同。各个求解进程无法共同保存断点或共享置换表，
+        指定 checkpoint、resume_from 或 transposition 时改用当前进程中的回溯搜索；timeout 传给 solve_first。
+        """
+        if checkpoint is not None or resume_from is not None or transposition is not None:
+            yield from super().find_all_solutions(1, greedy, checkpoint, resume_from,
+                                                  checkpoint_interval, transposition, timeout)
+            return
+        if max_solutions <= 0 or self.precheck() is not None:
+            return
+        assembled = self._greedy_solutions(greedy)
+        if assembled is not None:
+            yield from assembled[:1]
+            return
+        solution = self.solve_first(timeout)
+        if solution is not None:
+            yield solution
@@ -0,0 +1,88 @@
+from collections import Counter
+from typing import Optional, Tuple
+from ..models.piece import JigsawPiece
+from ..models.puzzle import JigsawPuzzle
+
+
+def required_class_counts(rows: int, cols: int) -> Tuple[int, int, int]:
+    """rows x cols 拼图需要的 (角落片, 边缘片, 内部片) 数量"""
+    if rows == 1 and cols == 1:
+        return 1, 0, 0
+    if rows == 1 or cols == 1:
+        return 2, rows * cols - 2, 0
+    return 4, 2 * (rows - 2) + 2 * (cols - 2), (rows - 2) * (cols - 2)
+
+
+def _has_flat_run(edges: Tuple[int, int, int, int], length: int) -> bool:
+    """是否存在 length 条首尾相连的平边"""
+    return any(all(edges[(start + i) % 4] == 0 for i in range(length)) for start in range(4))
+
+
+def _outer_edges_flat(piece: JigsawPiece, rows: int, cols: int) -> bool:
+    """拼图片在某个旋转角度下能否满足其类型位置的外边缘要求"""
+    edges = piece.edges_at(0)
+    strip = rows == 1 or cols == 1
+    if piece.is_corner:
+        if rows == 1 and cols == 1:
+            return edges == (0, 0, 0, 0)
+        return _has_flat_run(edges, 3 if strip else 2)
+    if piece.is_edge:
+        if strip:
+            return (edges[0] == 0 and edges[2] == 0) or (edges[1] == 0 and edges[3] == 0)
+        return 0 in edges
+    return True
+
+
+def find_infeasibility(puzzle: JigsawPuzzle) -> Optional[str]:
+    """在搜索之前用线性时间的必要条件检查拼图是否一定无解
+
+    检查项:
+    - 拼图片总数以及角落片、边缘片、内部片的数量
+    - 角落片和边缘片能否旋转到外边缘为平边
+    - 所有拼图片都必须使用时: 平边的数量及其奇偶性，
+      以及每个非零边缘值 v 与 -v 的出现次数必须相同(每条内部接缝恰好消耗一对)
+
+    Returns:
+        无解的原因，无法判定时返回None
+    """
+    rows, cols = puzzle.rows, puzzle.cols
+    cells = rows * cols
+    pieces = puzzle.pieces
+    if len(pieces) < cells:
+        return f"拼图片数量({len(pieces)})少于位置数量({cells})"
+
+    exact = len(pieces) == cells
+    names = ('角落片', '边缘片', '内部片')
+    have = [0, 0, 0]
+    usable = [0, 0, 0]
+    not_flat = None
+    for piece in pieces:
+        kind = 0 if piece.is_corner else 1 if piece.is_edge else 2
+        have[kind] += 1
+        if _outer_edges_flat(piece, rows, cols):
+            usable[kind] += 1
+        elif not_flat is None:
+            not_flat = (piece, kind)
+    need = required_class_counts(rows, cols)
+    for name, count, required in zip(names, have, need):
+        if count < required:
+            return f"{name}数量为{count}，{rows}x{cols}拼图需要{required}个"
+    if exact and not_flat is not None:
+        piece, kind = not_flat
+        return f"拼图片{piece.id}无法旋转到外边缘为平边，不能放在{names[kind]}位置"
+    for name, ok, required in zip(names, usable, need):
+        if ok < required:
+            return f"外边缘可以为平边的{name}只有{ok}个，{rows}x{cols}拼图需要{required}个"
+
+    if not exact:
+        return None
+    values = Counter(value for piece in pieces for value in piece.edges_at(0))
+    border = 2 * (rows + cols)
+    if values[0] < border:
+        return f"平边数量为{values[0]}，{rows}x{cols}拼图的外边缘需要{border}条"
+    if (values[0] - border) % 2:
+        return f"平边数量为{values[0]}，除外边缘外剩余的平边无法两两配对"
+    for value, count in sorted(values.items()):
+        if value and count != values[-value] and (value > 0 or values[-value] == 0):
+            return f"边缘值{value}出现{count}次而{-value}出现{values[-value]}次，无法全部配对"
+    return None
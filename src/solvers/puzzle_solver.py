@@ -1,19 +1,30 @@
-from typing import List, Set, Optional, Tuple, Iterator
-from multiprocessing import Pool, cpu_count
-from itertools import permutations
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Set, Optional, Tuple, Iterator, Union, cast
+import os
+import time
 from ..models.direction import Direction
 from ..models.piece import JigsawPiece
 from ..models.puzzle import JigsawPuzzle
+from .prechecks import find_infeasibility
+from .restart_search import RandomizedRestartSearch
+from .search_state import CandidateIndex, SearchState
+from .transposition import TranspositionTable
+
+if TYPE_CHECKING:
+    from .hints import HintIndex
+
+# 拼图片在某个旋转角度下 (上, 右, 下, 左) 的边缘值
+Edges = Tuple[int, int, int, int]
 
 
 class PuzzleSolver:
     """拼图求解器类"""
     
+    # 使用断点或超时时，两次检查是否需要写入断点(是否超时)之间最多搜索的节点数
+    CHECKPOINT_NODES = 10000
+    
     def __init__(self, puzzle: JigsawPuzzle):
         self.puzzle = puzzle
-        self._corner_pieces = [p for p in puzzle.pieces if p.is_corner]
-        self._edge_pieces = [p for p in puzzle.pieces if p.is_edge and not p.is_corner]
-        self._inner_pieces = [p for p in puzzle.pieces if not p.is_edge]
+        self._hint_index: Optional['HintIndex'] = None
     
     def _check_edge_compatibility(self, piece: JigsawPiece, row: int, col: int,
                                 current_solution: List[List[Optional[JigsawPiece]]]) -> bool:
@@ -89,128 +100,508 @@ class PuzzleSolver:
                 
         return True
     
-    def _try_rotations(self, piece: JigsawPiece, row: int, col: int,
-                      used_pieces: Set[int], current_solution: List[List[Optional[JigsawPiece]]],
-                      next_row: int, next_col: int, solutions: List[List[Tuple[int, int, int, int]]]) -> bool:
-        """尝试所有可能的旋转"""
-        original_rotation = piece.rotation
-        
-        # 如果是边缘片，只需要尝试两个方向
-        if piece.is_edge and not piece.is_corner:
-            rotations = [0, 180] if row in (0, self.puzzle.rows-1) else [90, 270]
-        # 如果是角片，只需要尝试一个方向
-        elif piece.is_corner:
-            if row == 0 and col == 0:
-                rotations = [0]
-            elif row == 0 and col == self.puzzle.cols-1:
-                rotations = [90]
-            elif row == self.puzzle.rows-1 and col == 0:
-                rotations = [270]
-            else:  # bottom-right corner
-                rotations = [180]
-        else:
-            rotations = [0, 90, 180, 270]
-        
-        for rotation in rotations:
-            piece.rotation = rotation
-            if self._check_placement(piece, row, col, current_solution):
-                used_pieces.add(piece.id)
-                current_solution[row][col] = piece
-                if self._find_solutions_recursive(next_row, next_col, used_pieces,
-                                               current_solution, solutions):
-                    piece.rotation = original_rotation
-                    return True
-                current_solution[row][col] = None
-                used_pieces.remove(piece.id)
-            piece.rotation = original_rotation
-        return False
-    
-    def _find_solutions_recursive(self, row: int, col: int, used_pieces: Set[int],
-                                current_solution: List[List[Optional[JigsawPiece]]],
-                                solutions: List[List[Tuple[int, int, int, int]]]) -> bool:
-        """递归查找解决方案"""
-        if row == self.puzzle.rows:
-            solutions.append(self._collect_solution(current_solution))
-            return len(solutions) >= self.max_solutions if hasattr(self, 'max_solutions') else False
-        
-        next_row = row + (col + 1) // self.puzzle.cols
-        next_col = (col + 1) % self.puzzle.cols
-        
-        # 根据位置选择合适的拼图片集合
-        if (row == 0 and col == 0) or \
-           (row == 0 and col == self.puzzle.cols-1) or \
-           (row == self.puzzle.rows-1 and col == 0) or \
-           (row == self.puzzle.rows-1 and col == self.puzzle.cols-1):
-            pieces = self._corner_pieces
-        elif row == 0 or row == self.puzzle.rows-1 or col == 0 or col == self.puzzle.cols-1:
-            pieces = self._edge_pieces
-        else:
-            pieces = self._inner_pieces
-        
-        # 尝试每个可用的拼图片
-        for piece in pieces:
-            if piece.id not in used_pieces:
-                # 保存原始旋转角度
-                original_rotation = piece.rotation
-                # 尝试所有可能的旋转
-                rotations = self._get_valid_rotations()
-                for rotation in rotations:
-                    piece.rotation = rotation
-                    if self._check_placement(piece, row, col, current_solution):
-                        used_pieces.add(piece.id)
-                        current_solution[row][col] = piece
-                        if self._find_solutions_recursive(next_row, next_col, used_pieces,
-                                                       current_solution, solutions):
-                            piece.rotation = original_rotation
-                            return True
-                        current_solution[row][col] = None
-                        used_pieces.remove(piece.id)
-                # 恢复原始旋转角度
-                piece.rotation = original_rotation
-        
-        # 如果已经找到足够的解决方案，返回True
-        if hasattr(self, 'max_solutions') and len(solutions) >= self.max_solutions:
-            return True
-            
-        return False
-    
     def _get_valid_rotations(self) -> List[int]:
         """获取有效旋转角度列表"""
         return [0, 90, 180, 270]
     
-    def _collect_solution(self, current_solution: List[List[Optional[JigsawPiece]]]) -> List[Tuple[int, int, int, int]]:
-        """收集当前解决方案"""
-        return [(piece.id, r, c, piece.rotation)
-                for r in range(self.puzzle.rows)
-                for c in range(self.puzzle.cols)
-                if (piece := current_solution[r][c])]
-    
-    def find_all_solutions(self, max_solutions: int = 1000) -> Iterator[List[Tuple[int, int, int, int]]]:
+    def precheck(self) -> Optional[str]:
+        """在搜索之前检查拼图是否一定无解
+
+        Returns:
+            无解的原因，未发现矛盾时返回None
+        """
+        return find_infeasibility(self.puzzle)
+
+    def estimate_cost(self, time_budget: float = 0.05, max_probes: Optional[int] = None,
+                      confidence: float = 0.95, seed: Optional[int] = None) -> Dict[str, Any]:
+        """用 Knuth 随机探测估计回溯搜索的代价，不进行实际搜索
+
+        Args:
+            time_budget: 探测的时间预算(秒)，至少进行一次探测
+            max_probes: 探测次数上限
+            confidence: 节点数置信区间的置信水平
+            seed: 随机数种子
+
+        Returns:
+            Dict[str, Any]: 包含以下内容
+                - nodes / nodes_low / nodes_high: 搜索树节点数的估计值及置信区间
+                - solutions: 解数量的估计值
+                - probes, elapsed: 探测次数和耗时
+                - dead_end_rate: 探测在到达叶子之前走入死路的比例
+                - mean_candidates / max_candidates: 每个位置的平均和最大候选数
+                - distinct_edge_values / edges_per_value: 不同边缘值的数量和每个值平均出现的边数
+                - infeasible: 预检查发现的无解原因，未发现时为None。预检查失败时不进行探测，
+                  其余各项均为0(边缘值分布除外)，键与正常结果相同
+        """
+        from .cost_estimator import SearchCostEstimator
+
+        estimator = SearchCostEstimator(self)
+        reason = self.precheck()
+        if reason is None:
+            result = estimator.estimate(time_budget, max_probes, confidence, seed)
+        else:
+            result = {'nodes': 0.0, 'nodes_low': 0.0, 'nodes_high': 0.0, 'solutions': 0.0,
+                      'probes': 0, 'dead_end_rate': 0.0, 'mean_candidates': 0.0,
+                      'max_candidates': 0, 'elapsed': 0.0}
+            result.update(estimator.edge_value_stats())
+        result['infeasible'] = reason
+        return result
+
+    def find_first_solution(self, seed: Optional[int] = None, cell_order: str = 'row',
+                            propagation: int = 1, restart_unit: int = 100,
+                            timeout: Optional[float] = None) -> Optional[List[Tuple[int, int, int, int]]]:
+        """用随机化候选顺序和 Luby 重启搜索第一个解
+
+        只需要一个解时，随机重启可以避免因候选顺序不佳而长时间困在无解的子树中。
+        参数含义见 RandomizedRestartSearch。
+
+        Returns:
+            解决方案，无解时返回None；超时抛出 TimeoutError
+        """
+        if self.precheck() is not None:
+            return None
+        search = RandomizedRestartSearch(self, cell_order, propagation, restart_unit, seed)
+        return search.solve(timeout=timeout)
+
+    def _assemble_greedy(self) -> Optional[List[List[Tuple[int, int, int, int]]]]:
+        """在接缝值唯一时不经搜索直接拼接
+
+        按边缘值建立 "边缘值 -> 带有该值的拼图片" 的索引，从左上角的每个可能摆放出发，
+        按行优先顺序用左侧(行首用上方)邻居的边缘值查出唯一能接上的拼图片和旋转角度。
+        每个起点只需线性时间，且得到的就是从该起点出发的全部解。
+
+        Returns:
+            所有解决方案；某一步出现多个可接上的拼图片(接缝值重复)或内部接缝为0时返回None
+        """
+        rows, cols = self.puzzle.rows, self.puzzle.cols
+        if len(self.puzzle.pieces) != rows * cols:
+            return None
+        carriers: Dict[int, List[Tuple[JigsawPiece, int]]] = {}
+        for piece in self.puzzle.pieces:
+            for side, value in enumerate(piece.edges_at(0)):
+                if value:
+                    carriers.setdefault(value, []).append((piece, side))
+
+        solutions = []
+        for start in self.puzzle.pieces:
+            for start_rotation, start_edges in self._orientations(start, 0, 0):
+                grid: List[List[Optional[Edges]]] = [[None] * cols for _ in range(rows)]
+                grid[0][0] = start_edges
+                used = {start.id}
+                solution = [(start.id, 0, 0, start_rotation)]
+                for index in range(1, rows * cols):
+                    row, col = divmod(index, cols)
+                    # 与左侧邻居的右边缘相接，行首与上方邻居的下边缘相接(按行优先顺序拼接，邻居都已放置)
+                    if col > 0:
+                        value, side = cast(Edges, grid[row][col-1])[1], 3
+                    else:
+                        value, side = cast(Edges, grid[row-1][col])[2], 0
+                    if value == 0:
+                        return None
+                    matches = []
+                    for piece, raw_side in carriers.get(-value, []):
+                        if piece.id in used:
+                            continue
+                        rotation = (side - raw_side) % 4 * 90
+                        edges = piece.edges_at(rotation)
+                        if (rotation, edges) in self._orientations(piece, row, col) and \
+                           self._fits(edges, row, col, grid):
+                            matches.append((piece, rotation, edges))
+                    if len(matches) > 1:
+                        return None
+                    if not matches:
+                        break
+                    piece, rotation, edges = matches[0]
+                    grid[row][col] = edges
+                    used.add(piece.id)
+                    solution.append((piece.id, row, col, rotation))
+                else:
+                    solutions.append(solution)
+        return solutions
+
+    def _greedy_solutions(self, greedy: Optional[bool]) -> Optional[List[List[Tuple[int, int, int, int]]]]:
+        """按 find_all_solutions 的 greedy 参数尝试贪心拼接，供各个求解器共用
+
+        Returns:
+            贪心拼接得到的全部解；greedy 为 False 或接缝值存在歧义时返回 None，需要搜索
+
+        Raises:
+            ValueError: greedy 为 True 但接缝值存在歧义
+        """
+        if greedy is False:
+            return None
+        assembled = self._assemble_greedy()
+        if assembled is None and greedy:
+            raise ValueError("拼图的接缝值存在歧义，无法贪心拼接")
+        return assembled
+
+    def find_all_solutions(self, max_solutions: int = 1000, greedy: Optional[bool] = None,
+                           checkpoint: Optional[str] = None, resume_from: Optional[str] = None,
+                           checkpoint_interval: float = 60.0,
+                           transposition: Optional[TranspositionTable] = None,
+                           timeout: Optional[float] = None) -> Iterator[List[Tuple[int, int, int, int]]]:
         """找出所有可能的拼图解决方案
         
         Args:
-            max_solutions: 最大解决方案数量
+            max_solutions: 最大解决方案数量(从断点恢复时包括断点之前已经产生的解)
+            greedy: 是否使用贪心拼接。None 时先尝试贪心拼接，接缝值有歧义时自动退回到回溯搜索；
+                    True 时要求接缝值无歧义，否则抛出 ValueError；False 时总是回溯搜索
+            checkpoint: 断点文件路径。每隔 checkpoint_interval 秒、调用方停止迭代时以及搜索结束时
+                        把搜索前沿和已产生的解数量写入该文件；两次写入之间每交出一个解只在游标文件
+                        (断点路径加 .cursor)末尾追加一行，进程被强制终止后恢复也不会重复产生解。
+                        使用断点时不进行贪心拼接
+            resume_from: 从该断点文件继续搜索，恢复后只产生断点之后的解；文件不存在时从头开始。
+                         未指定 checkpoint 时继续写入同一个文件
+            checkpoint_interval: 两次写入断点之间的最短间隔(秒)
+            transposition: 置换表。回溯搜索时跳过表中记录为无解的子问题，并把新搜索完毕的子问题写入表中
+            timeout: 回溯搜索的超时时间(秒)，超时抛出 TimeoutError(之前已经产生的解仍然有效)，
+                     使用断点时在抛出之前写入断点
             
         Returns:
             Iterator[List[Tuple[int, int, int, int]]]: 解决方案生成器
         """
-        solutions = []
-        used_pieces = set()
-        current_solution = [[None for _ in range(self.puzzle.cols)]
-                          for _ in range(self.puzzle.rows)]
-        
-        # 设置最大解决方案数量
-        self.max_solutions = max_solutions
-        
-        # 从左上角开始尝试放置
-        self._find_solutions_recursive(0, 0, used_pieces, current_solution, solutions)
-        
-        # 删除最大解决方案数量属性
-        delattr(self, 'max_solutions')
-        
-        # 返回找到的解决方案
-        yield from solutions
-    
+        if max_solutions <= 0 or self.precheck() is not None:
+            return
+
+        if checkpoint is None:
+            checkpoint = resume_from
+        if checkpoint is None:
+            assembled = self._greedy_solutions(greedy)
+            if assembled is not None:
+                yield from assembled[:max_solutions]
+                return
+
+        # 搜索状态全部保存在本次求解的 SearchState 中，不修改拼图片的旋转角度，
+        # 因此多个线程可以同时求解同一个拼图
+        if checkpoint is not None:
+            from .checkpoint import EmittedCursor, load_checkpoint, read_cursor, save_checkpoint
+        skip = 0
+        resumed = False
+        if resume_from is not None and os.path.exists(resume_from):
+            resumed = True
+            state, emitted = load_checkpoint(resume_from, self, transposition)
+            # 断点之后、进程被终止之前已经交出的解，恢复后重新产生时跳过
+            skip = max(0, read_cursor(resume_from) - emitted)
+        else:
+            state, emitted = SearchState(self, table=transposition), 0
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if checkpoint is None:
+            chunk = None if deadline is None else self.CHECKPOINT_NODES
+            while not state.finished:
+                for solution in state.search(max_nodes=chunk):
+                    yield solution
+                    emitted += 1
+                    if emitted >= max_solutions:
+                        return
+                if deadline is not None and not state.finished and time.monotonic() > deadline:
+                    raise TimeoutError("求解超时")
+            return
+
+        # 从同一个文件恢复时保留它的游标；否则清空游标，并记下已经交出、需要跳过的解
+        cursor = EmittedCursor(checkpoint, fresh=not resumed or checkpoint != resume_from)
+        if skip:
+            cursor.record(emitted + skip)
+
+        def save() -> None:
+            save_checkpoint(checkpoint, self.puzzle, state, emitted)
+            cursor.reset()
+            if skip:
+                cursor.record(emitted + skip)
+
+        # 先写入一次断点，之后任何时刻被终止都能从断点加游标恢复
+        save()
+        saved_at = time.monotonic()
+        try:
+            while not state.finished and emitted < max_solutions:
+                for solution in state.search(max_nodes=self.CHECKPOINT_NODES):
+                    emitted += 1
+                    if skip:
+                        skip -= 1
+                    else:
+                        # 交出解之前先记入游标，进程在任何时刻被强制终止，恢复后都不会重复产生已经交出的解
+                        cursor.record(emitted)
+                        yield solution
+                    if emitted >= max_solutions:
+                        break
+                    if time.monotonic() - saved_at >= checkpoint_interval:
+                        save()
+                        saved_at = time.monotonic()
+                if time.monotonic() - saved_at >= checkpoint_interval:
+                    save()
+                    saved_at = time.monotonic()
+                if deadline is not None and not state.finished and time.monotonic() > deadline:
+                    save()
+                    raise TimeoutError("求解超时")
+            save()
+        except GeneratorExit:
+            # 调用方在某个解处停止迭代，此时搜索状态是完整的
+            save()
+            raise
+        finally:
+            cursor.close()
+
+    def count_solutions(self, transposition: Optional[TranspositionTable] = None) -> int:
+        """统计解的总数，不逐个产生解决方案
+
+        已经搜索完毕的子问题连同解数量记录在置换表中，
+        在其他前缀下再次遇到同一个子问题时直接累加其解数量。
+
+        Args:
+            transposition: 置换表，默认新建一个
+
+        Returns:
+            int: 解的总数
+        """
+        if self.precheck() is not None:
+            return 0
+        if transposition is None:
+            transposition = TranspositionTable()
+        return SearchState(self, table=transposition).count()
+
+    def sample_solutions(self, k: int, seed: Optional[int] = None, exact_nodes: int = 5000,
+                         particles: int = 32, timeout: Optional[float] = None
+                         ) -> List[List[Tuple[int, int, int, int]]]:
+        """有放回地随机抽取 k 个解决方案，不枚举全部解
+
+        每一层按子树的解数量加权选择候选，子树太大时用估计值代替精确计数，
+        参数含义见 SolutionSampler。
+
+        Args:
+            k: 抽取的数量
+            seed: 随机数种子
+            timeout: 超时时间(秒)，超时抛出 TimeoutError
+
+        Returns:
+            抽取的解决方案，拼图无解时返回空列表
+        """
+        from .sampling import SolutionSampler
+
+        if k <= 0 or self.precheck() is not None:
+            return []
+        deadline = None if timeout is None else time.monotonic() + timeout
+        sampler = SolutionSampler(self, exact_nodes, particles, seed=seed)
+        samples = []
+        for _ in range(k):
+            solution = sampler.sample(deadline)
+            if solution is None:
+                return []
+            samples.append(solution)
+        return samples
+
+    def assemble_by_cost(self, cost: Union[str, Callable[[int, int], float]] = 'absolute',
+                         beam_width: int = 64, top: int = 1, timeout: Optional[float] = None
+                         ) -> List[Tuple[float, List[Tuple[int, int, int, int]]]]:
+        """按接缝代价用束搜索拼装边缘值带有噪声的拼图
+
+        不要求相接的边缘值之和严格为0，返回接缝代价之和最小的若干个拼装，参数含义见 BeamSearchAssembler。
+
+        Args:
+            cost: 接缝代价函数，或 'exact'、'absolute'、'squared' 之一
+            beam_width: 每层保留的部分拼装数量
+            top: 返回的拼装数量
+            timeout: 时间预算(秒)，预算内逐次加宽束重新搜索
+
+        Returns:
+            按代价从小到大排列的 (代价, 解决方案)
+        """
+        from .beam_search import BeamSearchAssembler
+
+        return BeamSearchAssembler(self, cost, beam_width).assemble(top, timeout)
+
+    def hints(self, cells: Optional[Iterable[Tuple[int, int]]] = None) -> Dict[Tuple[int, int], List[Tuple[int, int]]]:
+        """查询当前棋盘上一组空位置各自可以放置的 (拼图片id, 旋转角度)
+
+        候选满足拼图片类型和外边缘要求，与已放置的邻居匹配，且尚未放在棋盘上。
+        索引在第一次查询时建立，之后随 place_piece / remove_piece 增量更新。
+
+        Args:
+            cells: 要查询的位置，None 表示所有空位置
+
+        Returns:
+            位置 -> 候选列表，已被占用的位置对应空列表
+        """
+        if self._hint_index is None:
+            from .hints import HintIndex
+
+            self._hint_index = HintIndex(self)
+        return self._hint_index.hints(cells)
+
+    def _orientations(self, piece: JigsawPiece, row: int, col: int) -> List[Tuple[int, Edges]]:
+        """获取拼图片在指定位置满足类型和外边缘要求的所有 (旋转角度, 边缘值)"""
+        if not self._check_edge_compatibility(piece, row, col, []):
+            return []
+        result = []
+        for rotation in self._get_valid_rotations():
+            edges = piece.edges_at(rotation)
+            if (row != 0 or edges[0] == 0) and \
+               (col != self.puzzle.cols - 1 or edges[1] == 0) and \
+               (row != self.puzzle.rows - 1 or edges[2] == 0) and \
+               (col != 0 or edges[3] == 0):
+                result.append((rotation, edges))
+        return result
+
+    def _fits(self, edges: Edges, row: int, col: int,
+              grid: List[List[Optional[Edges]]]) -> bool:
+        """检查边缘值与四个方向上已放置的拼图片是否匹配
+
+        grid 中保存每个位置已放置拼图片的 (上, 右, 下, 左) 边缘值，未放置为None
+        """
+        up = grid[row-1][col] if row > 0 else None
+        if up and edges[0] + up[2] != 0:
+            return False
+        left = grid[row][col-1] if col > 0 else None
+        if left and edges[3] + left[1] != 0:
+            return False
+        down = grid[row+1][col] if row < self.puzzle.rows - 1 else None
+        if down and edges[2] + down[0] != 0:
+            return False
+        right = grid[row][col+1] if col < self.puzzle.cols - 1 else None
+        if right and edges[1] + right[3] != 0:
+            return False
+        return True
+
+    def _search_region(self, cells: List[Tuple[int, int]], pieces: List[JigsawPiece],
+                       grid: List[List[Optional[Edges]]], index: Optional[CandidateIndex] = None,
+                       max_nodes: Optional[int] = None
+                       ) -> Optional[Dict[Tuple[int, int], Tuple[JigsawPiece, int]]]:
+        """在固定其余位置的前提下，用给定的拼图片填满给定的位置(显式栈回溯)
+
+        每个位置按上方和左侧已放置拼图片的边缘值从候选索引中查找，只尝试给定的拼图片。
+
+        Returns:
+            {位置: (拼图片, 旋转角度)}，无解或尝试的摆放超过 max_nodes 时返回None
+        """
+        if not cells:
+            return {}
+        index = index or CandidateIndex(self)
+        available = {piece.id: piece for piece in pieces}
+        used: Set[int] = set()
+        placement: Dict[Tuple[int, int], Tuple[JigsawPiece, int]] = {}
+
+        def options(position: int) -> Iterator[Tuple[int, int, Edges]]:
+            row, col = cells[position]
+            up = grid[row-1][col] if row > 0 else None
+            left = grid[row][col-1] if col > 0 else None
+            return iter(index.options(row, col, None if up is None else -up[2],
+                                      None if left is None else -left[1]))
+
+        stack = [options(0)]
+        nodes = 0
+        while stack:
+            row, col = cells[len(stack) - 1]
+            for piece_id, rotation, edges in stack[-1]:
+                if piece_id in available and piece_id not in used and self._fits(edges, row, col, grid):
+                    break
+            else:
+                stack.pop()
+                if stack:
+                    row, col = cells[len(stack) - 1]
+                    grid[row][col] = None
+                    used.remove(placement.pop((row, col))[0].id)
+                continue
+            nodes += 1
+            if max_nodes is not None and nodes > max_nodes:
+                break
+            used.add(piece_id)
+            grid[row][col] = edges
+            placement[(row, col)] = (available[piece_id], rotation)
+            if len(stack) == len(cells):
+                return placement
+            stack.append(options(len(stack)))
+        for row, col in placement:
+            grid[row][col] = None
+        return None
+
+    def resolve(self, previous_solution: List[Tuple[int, int, int, int]],
+                changed_pieces: Iterable[int] = (),
+                max_radius: int = 2) -> Optional[List[Tuple[int, int, int, int]]]:
+        """在拼图被小幅修改后修复之前的解决方案
+
+        先找出受影响的位置(被修改的拼图片所在位置以及不再匹配的位置)，
+        只释放这些位置周围的区域并在其中局部搜索，其余拼图片保持不动。
+        区域逐步扩大到 max_radius 仍无法修复时，退回到完整求解。
+
+        Args:
+            previous_solution: 修改前的解决方案
+            changed_pieces: 被修改的拼图片id(例如改变了接缝或互换了位置的拼图片)
+            max_radius: 受影响位置周围释放区域的最大半径
+
+        Returns:
+            修复后的解决方案，无解时返回None
+        """
+        rows, cols = self.puzzle.rows, self.puzzle.cols
+        pieces_by_id = {piece.id: piece for piece in self.puzzle.pieces}
+        layout: Dict[Tuple[int, int], Tuple[JigsawPiece, int]] = {}
+        for piece_id, row, col, rotation in previous_solution:
+            if piece_id in pieces_by_id and 0 <= row < rows and 0 <= col < cols:
+                layout[(row, col)] = (pieces_by_id[piece_id], rotation)
+
+        if len(layout) != rows * cols or len(pieces_by_id) != rows * cols or \
+           len({piece.id for piece, _ in layout.values()}) != rows * cols:
+            # 拼图片集合或位置发生了变化，无法局部修复
+            return next(self.find_all_solutions(max_solutions=1), None)
+
+        grid: List[List[Optional[Edges]]] = [[layout[(r, c)][0].edges_at(layout[(r, c)][1])
+                                              for c in range(cols)] for r in range(rows)]
+        changed = set(changed_pieces)
+        dirty = set()
+        for (row, col), (piece, rotation) in layout.items():
+            edges = piece.edges_at(rotation)
+            if piece.id in changed or \
+               (rotation, edges) not in self._orientations(piece, row, col) or \
+               not self._fits(edges, row, col, grid):
+                dirty.add((row, col))
+
+        if not dirty or self._repair_layout(layout, dirty, max_radius=max_radius):
+            return self._layout_to_solution(layout)
+
+        return next(self.find_all_solutions(max_solutions=1), None)
+
+    def _repair_layout(self, layout: Dict[Tuple[int, int], Tuple[JigsawPiece, int]],
+                       dirty: Iterable[Tuple[int, int]], spare: Iterable[JigsawPiece] = (),
+                       max_radius: int = 2, max_nodes: Optional[int] = None,
+                       index: Optional[CandidateIndex] = None) -> bool:
+        """释放 dirty 位置周围的区域并在其中局部搜索，区域半径逐步扩大到 max_radius
+
+        layout 中可以缺少部分位置(视为待填)，spare 为未放置在 layout 中的拼图片，
+        区域内的拼图片和 spare 一起作为候选。成功时就地更新 layout。
+        max_nodes 限制每个半径的局部搜索尝试的摆放数量，超过时视为该半径无法修复；
+        index 为调用方已经建立的候选索引，为空时新建。
+
+        Returns:
+            bool: 是否修复成功
+        """
+        rows, cols = self.puzzle.rows, self.puzzle.cols
+        dirty = set(dirty)
+        spare = list(spare)
+        grid: List[List[Optional[Edges]]] = [[None] * cols for _ in range(rows)]
+        for (row, col), (piece, rotation) in layout.items():
+            grid[row][col] = piece.edges_at(rotation)
+
+        index = index or CandidateIndex(self)
+        for radius in range(max_radius + 1):
+            region = sorted({(r, c)
+                             for row, col in dirty
+                             for r in range(max(0, row - radius), min(rows, row + radius + 1))
+                             for c in range(max(0, col - radius), min(cols, col + radius + 1))})
+            for row, col in region:
+                grid[row][col] = None
+            pieces = [layout[cell][0] for cell in region if cell in layout] + spare
+            placement = self._search_region(region, pieces, grid, index, max_nodes)
+            if placement is not None:
+                layout.update(placement)
+                return True
+            for row, col in region:
+                if (row, col) in layout:
+                    grid[row][col] = layout[(row, col)][0].edges_at(layout[(row, col)][1])
+        return False
+
+    def _layout_to_solution(self, layout: Dict[Tuple[int, int], Tuple[JigsawPiece, int]]) -> List[Tuple[int, int, int, int]]:
+        """把 {位置: (拼图片, 旋转角度)} 转换为按行优先排列的解决方案"""
+        return [(layout[(r, c)][0].id, r, c, layout[(r, c)][1])
+                for r in range(self.puzzle.rows)
+                for c in range(self.puzzle.cols)]
+
     def apply_solution(self, solution: List[Tuple[int, int, int, int]]) -> bool:
         """应用解决方案到拼图"""
         self.puzzle.board = [[None for _ in range(self.puzzle.cols)]
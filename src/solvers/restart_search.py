@@ -0,0 +1,182 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+import random
+import time
+from .cdcl import luby
+from .search_state import Edges, Option, Placement
+
+if TYPE_CHECKING:
+    from .puzzle_solver import PuzzleSolver
+
+Cell = Tuple[int, int]
+
+
+class RandomizedRestartSearch:
+    """随机化候选顺序并按 Luby 序列重启的首解搜索
+
+    回溯搜索的耗时呈重尾分布: 同一个拼图只因候选的尝试顺序不同，耗时可能相差几个数量级。
+    每次重启用新的随机顺序从头搜索，并把放置的节点数限制在 luby(i) * restart_unit 以内，
+    避免长时间困在一棵很大的无解子树中。某次搜索在预算内走完了整棵搜索树，说明拼图无解。
+    """
+
+    CELL_ORDERS = ('row', 'column', 'spiral')
+    # 每放置多少个节点检查一次是否超时
+    DEADLINE_CHECK = 1024
+
+    def __init__(self, solver: 'PuzzleSolver', cell_order: str = 'row', propagation: int = 1,
+                 restart_unit: int = 100, seed: Optional[int] = None):
+        """
+        Args:
+            solver: 提供拼图和合法摆放检查的 PuzzleSolver
+            cell_order: 位置的填充顺序，'row' 行优先，'column' 列优先，'spiral' 由外圈向内螺旋
+            propagation: 0 不做传播；1 每放置一个拼图片后检查相邻的空位置是否还有候选(前向检查)
+            restart_unit: Luby 序列每个单位对应的节点数
+            seed: 随机数种子
+        """
+        if cell_order not in self.CELL_ORDERS:
+            raise ValueError(f"未知的位置顺序: {cell_order}")
+        if propagation not in (0, 1):
+            raise ValueError(f"传播级别必须为0或1: {propagation}")
+        if restart_unit <= 0:
+            raise ValueError("重启单位必须为正数")
+        self.solver = solver
+        self.rows, self.cols = solver.puzzle.rows, solver.puzzle.cols
+        self.order = self._cell_order(cell_order)
+        self.propagation = propagation
+        self.restart_unit = restart_unit
+        self.rng = random.Random(seed)
+        self._index: Dict[Tuple[bool, bool, bool, bool], Dict[Any, List[Option]]] = {}
+        self.stats: Dict[str, Any] = {'restarts': 0, 'nodes': 0, 'exhausted': False}
+
+    def _cell_order(self, name: str) -> List[Cell]:
+        rows, cols = self.rows, self.cols
+        if name == 'row':
+            return [(r, c) for r in range(rows) for c in range(cols)]
+        if name == 'column':
+            return [(r, c) for c in range(cols) for r in range(rows)]
+        order: List[Cell] = []
+        top, bottom, left, right = 0, rows - 1, 0, cols - 1
+        while top <= bottom and left <= right:
+            order.extend((top, c) for c in range(left, right + 1))
+            order.extend((r, right) for r in range(top + 1, bottom + 1))
+            if top < bottom:
+                order.extend((bottom, c) for c in range(right - 1, left - 1, -1))
+            if left < right:
+                order.extend((r, left) for r in range(bottom - 1, top, -1))
+            top, bottom, left, right = top + 1, bottom - 1, left + 1, right - 1
+        return order
+
+    def _options(self, row: int, col: int, side: Optional[int] = None, value: int = 0) -> List[Option]:
+        """满足位置要求的候选；指定 side 时只返回该方向边缘值为 value 的候选"""
+        signature = (row == 0, col == self.cols - 1, row == self.rows - 1, col == 0)
+        index = self._index.get(signature)
+        if index is None:
+            index = {None: []}
+            for piece in self.solver.puzzle.pieces:
+                for rotation, edges in self.solver._orientations(piece, row, col):
+                    option = (piece.id, rotation, edges)
+                    index[None].append(option)
+                    for s in range(4):
+                        index.setdefault((s, edges[s]), []).append(option)
+            self._index[signature] = index
+        return index[None] if side is None else index.get((side, value), [])
+
+    def _matching(self, row: int, col: int, grid: List[List[Optional[Edges]]],
+                  used: set, first_only: bool = False) -> List[Option]:
+        """与 (row, col) 所有已放置的邻居都匹配的未使用候选"""
+        links = []
+        for (r, c, side, other) in ((row - 1, col, 0, 2), (row, col + 1, 1, 3),
+                                    (row + 1, col, 2, 0), (row, col - 1, 3, 1)):
+            neighbour = grid[r][c] if 0 <= r < self.rows and 0 <= c < self.cols else None
+            if neighbour is not None:
+                links.append((side, -neighbour[other]))
+        options = self._options(row, col, *links[0]) if links else self._options(row, col)
+        result = []
+        for option in options:
+            if option[0] in used:
+                continue
+            edges = option[2]
+            if all(edges[side] == value for side, value in links[1:]):
+                result.append(option)
+                if first_only:
+                    break
+        return result
+
+    def _viable(self, row: int, col: int, grid: List[List[Optional[Edges]]], used: set) -> bool:
+        """前向检查: (row, col) 的每个空邻居都至少还有一个候选"""
+        for r, c in ((row - 1, col), (row, col + 1), (row + 1, col), (row, col - 1)):
+            if 0 <= r < self.rows and 0 <= c < self.cols and grid[r][c] is None and \
+               not self._matching(r, c, grid, used, first_only=True):
+                return False
+        return True
+
+    def _run(self, budget: int, deadline: Optional[float]) -> Tuple[Optional[List[Placement]], bool]:
+        """一次带节点预算的随机化搜索
+
+        Returns:
+            (解决方案, 是否走完了整棵搜索树)，预算用尽时返回 (None, False)
+        """
+        grid: List[List[Optional[Edges]]] = [[None] * self.cols for _ in range(self.rows)]
+        used: Set[int] = set()
+        placed: List[Placement] = []
+        first = self._matching(*self.order[0], grid, used)
+        self.rng.shuffle(first)
+        stack = [first]
+        while stack:
+            options = stack[-1]
+            depth = len(stack) - 1
+            if len(placed) > depth:
+                piece_id, row, col, _ = placed.pop()
+                grid[row][col] = None
+                used.discard(piece_id)
+            if not options:
+                stack.pop()
+                continue
+            if budget <= 0:
+                return None, False
+            budget -= 1
+            self.stats['nodes'] += 1
+            if deadline is not None and self.stats['nodes'] % self.DEADLINE_CHECK == 0 and \
+               time.monotonic() > deadline:
+                raise TimeoutError("随机重启搜索超时")
+
+            # 候选已经随机打乱，从末尾取出即可
+            piece_id, rotation, edges = options.pop()
+            row, col = self.order[depth]
+            grid[row][col] = edges
+            used.add(piece_id)
+            placed.append((piece_id, row, col, rotation))
+            if depth + 1 == len(self.order):
+                return sorted(placed, key=lambda placement: (placement[1], placement[2])), False
+            if self.propagation and not self._viable(row, col, grid, used):
+                # 压入空帧，下一轮循环撤销刚才的摆放
+                stack.append([])
+                continue
+            children = self._matching(*self.order[depth + 1], grid, used)
+            self.rng.shuffle(children)
+            stack.append(children)
+        return None, True
+
+    def solve(self, max_restarts: Optional[int] = None,
+              timeout: Optional[float] = None) -> Optional[List[Placement]]:
+        """搜索第一个解
+
+        Args:
+            max_restarts: 最多进行的搜索次数，None 表示不限
+            timeout: 超时时间(秒)，超时抛出 TimeoutError
+
+        Returns:
+            解决方案；证明无解或达到 max_restarts 时返回None，
+            两者可以通过 stats['exhausted'] 区分
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        restart = 0
+        while max_restarts is None or restart < max_restarts:
+            restart += 1
+            self.stats['restarts'] = restart
+            solution, exhausted = self._run(luby(restart) * self.restart_unit, deadline)
+            if solution is not None:
+                return solution
+            if exhausted:
+                self.stats['exhausted'] = True
+                return None
+        return None
@@ -0,0 +1,170 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+import time
+from ..models.puzzle import JigsawPuzzle
+from .puzzle_solver import PuzzleSolver
+from .transposition import TranspositionTable
+
+Solution = List[Tuple[int, int, int, int]]
+Profile = Tuple[int, ...]
+
+
+class _Row:
+    """一整行的合法摆放"""
+
+    __slots__ = ('placements', 'top', 'bottom', 'mask')
+
+    def __init__(self, placements: Tuple[Tuple[int, int], ...], top: Profile,
+                 bottom: Profile, mask: int):
+        self.placements = placements  # 每列的 (拼图片id, 旋转角度)
+        self.top = top                # 每列上边缘值
+        self.bottom = bottom          # 每列下边缘值
+        self.mask = mask              # 使用的拼图片位掩码
+
+
+class RowChainSolver(PuzzleSolver):
+    """按行拼接的求解器
+
+    先为每一类行位置(顶行、中间行、底行)枚举一次所有合法的整行摆放，
+    并按上边缘轮廓建立索引；之后逐行用"下边缘轮廓 -> 所需上边缘轮廓"做哈希连接，
+    只检查拼图片是否被重复使用。行的构造不会随回溯重复进行，
+    因此对宽而矮的拼图效果最好。
+
+    meet_in_middle=True 时分别枚举上半部分和下半部分的拼接结果，
+    再在中间接缝处按轮廓连接。
+    """
+
+    def __init__(self, puzzle: JigsawPuzzle, meet_in_middle: bool = False):
+        super().__init__(puzzle)
+        self.meet_in_middle = meet_in_middle
+        self._bit = {piece.id: 1 << i for i, piece in enumerate(puzzle.pieces)}
+        self._rows_by_kind: Dict[Tuple[bool, bool], Dict[Profile, List[_Row]]] = {}
+
+    def _kind(self, row: int) -> Tuple[bool, bool]:
+        """行位置的类别: (是否顶行, 是否底行)，同类别的行的合法摆放完全相同"""
+        return row == 0, row == self.puzzle.rows - 1
+
+    def _build_rows(self, row: int) -> Dict[Profile, List[_Row]]:
+        """枚举某一行位置的所有合法整行摆放，按上边缘轮廓索引"""
+        kind = self._kind(row)
+        if kind in self._rows_by_kind:
+            return self._rows_by_kind[kind]
+
+        cols = self.puzzle.cols
+        candidates = [[(piece.id, rotation, edges)
+                       for piece in self.puzzle.pieces
+                       for rotation, edges in self._orientations(piece, row, col)]
+                      for col in range(cols)]
+        index: Dict[Profile, List[_Row]] = {}
+        placements: List[Tuple[int, int]] = []
+        edges_in_row: List[Tuple[int, int, int, int]] = []
+
+        def extend(col: int, mask: int) -> None:
+            if col == cols:
+                top = tuple(edges[0] for edges in edges_in_row)
+                bottom = tuple(edges[2] for edges in edges_in_row)
+                index.setdefault(top, []).append(_Row(tuple(placements), top, bottom, mask))
+                return
+            for piece_id, rotation, edges in candidates[col]:
+                bit = self._bit[piece_id]
+                if mask & bit:
+                    continue
+                if col > 0 and edges[3] + edges_in_row[-1][1] != 0:
+                    continue
+                placements.append((piece_id, rotation))
+                edges_in_row.append(edges)
+                extend(col + 1, mask | bit)
+                placements.pop()
+                edges_in_row.pop()
+
+        extend(0, 0)
+        self._rows_by_kind[kind] = index
+        return index
+
+    @staticmethod
+    def _needed_top(bottom: Profile) -> Profile:
+        """与给定下边缘轮廓相接的行所需的上边缘轮廓"""
+        return tuple(-value for value in bottom)
+
+    def _chains(self, start: int, stop: int, first_rows: List[_Row],
+                deadline: Optional[float] = None) -> Iterator[Tuple[List[_Row], int]]:
+        """从给定的首行出发，枚举覆盖 [start, stop) 行位置的拼接结果，超过截止时间抛出 TimeoutError"""
+        indices = [self._build_rows(row) for row in range(start, stop)]
+        chain: List[_Row] = []
+        nodes = 0
+
+        def extend(depth: int, candidates: List[_Row], used: int) -> Iterator[Tuple[List[_Row], int]]:
+            nonlocal nodes
+            for row in candidates:
+                nodes += 1
+                if deadline is not None and nodes % self.CHECKPOINT_NODES == 0 and \
+                        time.monotonic() > deadline:
+                    raise TimeoutError("求解超时")
+                if used & row.mask:
+                    continue
+                chain.append(row)
+                if depth + 1 == len(indices):
+                    yield chain, used | row.mask
+                else:
+                    yield from extend(depth + 1,
+                                      indices[depth + 1].get(self._needed_top(row.bottom), []),
+                                      used | row.mask)
+                chain.pop()
+
+        yield from extend(0, first_rows, 0)
+
+    def _to_solution(self, rows: List[_Row]) -> Solution:
+        return [(piece_id, r, c, rotation)
+                for r, row in enumerate(rows)
+                for c, (piece_id, rotation) in enumerate(row.placements)]
+
+    def _iter_solutions(self, deadline: Optional[float] = None) -> Iterator[Solution]:
+        total = self.puzzle.rows
+        top_rows = [row for rows in self._build_rows(0).values() for row in rows]
+        if not self.meet_in_middle or total < 2:
+            for chain, _ in self._chains(0, total, top_rows, deadline):
+                yield self._to_solution(chain)
+            return
+
+        # 上半部分按最后一行的下边缘轮廓分组，下半部分按首行的上边缘轮廓连接
+        half = total // 2
+        upper: Dict[Profile, List[Tuple[List[_Row], int]]] = {}
+        for chain, mask in self._chains(0, half, top_rows, deadline):
+            upper.setdefault(self._needed_top(chain[-1].bottom), []).append((list(chain), mask))
+        middle_index = self._build_rows(half)
+        for profile, halves in upper.items():
+            first_rows = middle_index.get(profile, [])
+            if not first_rows:
+                continue
+            for lower, lower_mask in self._chains(half, total, first_rows, deadline):
+                for upper_rows, upper_mask in halves:
+                    if not upper_mask & lower_mask:
+                        yield self._to_solution(upper_rows + lower)
+
+    def find_all_solutions(self, max_solutions: int = 1000, greedy: Optional[bool] = None,
+                           checkpoint: Optional[str] = None, resume_from: Optional[str] = None,
+                           checkpoint_interval: float = 60.0,
+                           transposition: Optional[TranspositionTable] = None,
+                           timeout: Optional[float] = None) -> Iterator[Solution]:
+        """找出所有可能的拼图解决方案
+
+        参数含义与 PuzzleSolver.find_all_solutions 相同。按行拼接没有可以保存的搜索前沿，
+        指定 checkpoint、resume_from 或 transposition 时改用逐格回溯搜索
+
+        Returns:
+            Iterator[List[Tuple[int, int, int, int]]]: 解决方案生成器
+        """
+        if checkpoint is not None or resume_from is not None or transposition is not None:
+            yield from super().find_all_solutions(max_solutions, greedy, checkpoint, resume_from,
+                                                  checkpoint_interval, transposition, timeout)
+            return
+        if max_solutions <= 0 or self.precheck() is not None:
+            return
+        assembled = self._greedy_solutions(greedy)
+        if assembled is not None:
+            yield from assembled[:max_solutions]
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for count, solution in enumerate(self._iter_solutions(deadline), 1):
+            yield solution
+            if count >= max_solutions:
+                return
@@ -0,0 +1,115 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
+import random
+import time
+from .cost_estimator import SearchCostEstimator
+from .search_state import CandidateIndex, Placement, SearchState
+from .transposition import TranspositionTable
+
+if TYPE_CHECKING:
+    from .puzzle_solver import PuzzleSolver
+
+
+class SolutionSampler:
+    """按解数量加权逐层下降，随机抽取解决方案而不枚举全部解
+
+    从空拼图开始按行优先顺序逐个位置选择候选，每个候选被选中的概率与它下面子树的解数量成正比，
+    走到底得到的解在所有解中均匀分布。子树的解数量在 exact_nodes 个节点的预算内精确计数，
+    结果记录在置换表中；预算不够时改用 population_estimate 的估计值，此时抽样只是近似均匀。
+
+    精确计数和估计值在多次抽样之间共享，越靠近根的子树越早算完，
+    因此第一个样本的代价最大，之后每个样本的代价大致相同。
+    """
+
+    def __init__(self, solver: 'PuzzleSolver', exact_nodes: int = 5000, particles: int = 32,
+                 table: Optional[TranspositionTable] = None, seed: Optional[int] = None):
+        """
+        Args:
+            solver: 要抽样的 PuzzleSolver
+            exact_nodes: 精确计数一棵子树时最多搜索的节点数，超出后改用估计值
+            particles: 估计子树解数量时使用的随机路径数
+            table: 记录子树解数量的置换表，默认新建一个
+            seed: 随机数种子
+        """
+        if exact_nodes <= 0:
+            raise ValueError("精确计数的节点预算必须为正数")
+        self.solver = solver
+        self.exact_nodes = exact_nodes
+        self.particles = particles
+        self.table = TranspositionTable() if table is None else table
+        self.index = CandidateIndex(solver)
+        self.estimator = SearchCostEstimator(solver)
+        self.rng = random.Random(seed)
+        self._estimates: Dict[int, float] = {}
+        self.stats: Dict[str, Any] = {'samples': 0, 'restarts': 0, 'exact': 0, 'estimated': 0}
+
+    @staticmethod
+    def _key(state: SearchState) -> int:
+        """state 在置换表中的键；抽样使用的 SearchState 总是带有置换表，键不会为None"""
+        return cast(int, state.key())
+
+    def _weight(self, state: SearchState) -> Tuple[float, bool]:
+        """以 state 当前的部分解为根的子树的解数量
+
+        先查置换表和已有的估计值；估计的子树不超过 exact_nodes 个节点时才尝试精确计数。
+
+        Returns:
+            (解数量, 是否为精确值)
+        """
+        if len(state.placements) == state.rows * state.cols:
+            return 1, True
+        key = self._key(state)
+        known = self.table.get(key)
+        if known is not None:
+            return known, True
+        if key in self._estimates:
+            return self._estimates[key], False
+        prefix = list(state.placements)
+        estimate = self.estimator.population_estimate(self.particles, seed=self.rng.getrandbits(32),
+                                                      prefix=prefix)
+        if estimate['nodes'] <= self.exact_nodes:
+            subtree = SearchState(self.solver, prefix, index=self.index, table=self.table)
+            count = subtree.count(self.exact_nodes)
+            if subtree.finished:
+                self.stats['exact'] += 1
+                return count, True
+        self.stats['estimated'] += 1
+        self._estimates[key] = estimate['solutions']
+        return estimate['solutions'], False
+
+    def sample(self, deadline: Optional[float] = None) -> Optional[List[Placement]]:
+        """抽取一个解决方案，拼图无解时返回None
+
+        按估计值下降时可能走入没有解的子树，此时从头重新抽取。
+        估计值全部为0时，在估计的候选之间均匀选择。
+
+        Args:
+            deadline: time.monotonic() 的截止时间，超过时抛出 TimeoutError
+        """
+        cells = self.solver.puzzle.rows * self.solver.puzzle.cols
+        while True:
+            state = SearchState(self.solver, index=self.index, table=self.table)
+            for cell in range(cells):
+                if deadline is not None and time.monotonic() > deadline:
+                    raise TimeoutError("抽样超时")
+                children = state.candidates(cell)
+                results = []
+                for option in children:
+                    state.push(option)
+                    results.append(self._weight(state))
+                    state.pop()
+                weights = [weight for weight, _ in results]
+                if cell and all(exact for _, exact in results):
+                    # 所有子树都已精确计数，当前部分解的解数量就是它们的和，记下来供以后的抽样直接使用
+                    self.table.store(self._key(state), int(sum(weights)))
+                elif not any(weights):
+                    weights = [0.0 if exact else 1.0 for _, exact in results]
+                if not any(weights):
+                    break
+                state.push(self.rng.choices(children, weights=weights)[0])
+            else:
+                self.stats['samples'] += 1
+                return list(state.placements)
+            if not state.placements:
+                # 根的所有子树都精确计数为0，拼图无解
+                return None
+            self.stats['restarts'] += 1
@@ -0,0 +1,278 @@
+from typing import Dict, IO, Iterator, List, Optional, Tuple
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from ..models.puzzle import JigsawPuzzle
+from .cdcl import CdclSolver
+from .puzzle_solver import PuzzleSolver
+from .transposition import TranspositionTable
+
+Solution = List[Tuple[int, int, int, int]]
+
+# 组内文字数量超过该值时，"至多一个"约束改用顺序计数器编码，避免两两互斥产生平方级子句
+PAIRWISE_LIMIT = 6
+
+
+class CnfFormula:
+    """拼图的CNF编码
+
+    变量 1..len(options) 表示 "拼图片以某个旋转角度放在某个位置"，
+    之后的变量是顺序计数器编码引入的辅助变量。
+    """
+
+    def __init__(self, options: List[Tuple[int, int, int, int]]):
+        self.options = options
+        self.num_vars = len(options)
+        self.clauses: List[List[int]] = []
+
+    def new_var(self) -> int:
+        self.num_vars += 1
+        return self.num_vars
+
+    def at_most_one(self, lits: List[int]) -> None:
+        """添加"至多一个为真"约束"""
+        if len(lits) <= PAIRWISE_LIMIT:
+            for i, a in enumerate(lits):
+                for b in lits[i + 1:]:
+                    self.clauses.append([-a, -b])
+            return
+        # 顺序计数器编码 (Sinz 2005): s_i 表示前i个文字中已有一个为真
+        prev = self.new_var()
+        self.clauses.append([-lits[0], prev])
+        for lit in lits[1:-1]:
+            cur = self.new_var()
+            self.clauses.append([-lit, cur])
+            self.clauses.append([-prev, cur])
+            self.clauses.append([-lit, -prev])
+            prev = cur
+        self.clauses.append([-lits[-1], -prev])
+
+    def exactly_one(self, lits: List[int]) -> None:
+        """添加"恰好一个为真"约束"""
+        self.clauses.append(list(lits))
+        self.at_most_one(lits)
+
+    def decode(self, model: List[int]) -> Solution:
+        """把赋值解码为按行优先排列的解决方案"""
+        solution = [self.options[lit - 1] for lit in model if 0 < lit <= len(self.options)]
+        return sorted(solution, key=lambda item: (item[1], item[2]))
+
+    def blocking_clause(self, solution: Solution) -> List[int]:
+        """排除给定解决方案的子句"""
+        index: Dict[Tuple[int, ...], int] = {option: i + 1 for i, option in enumerate(self.options)}
+        return [-index[tuple(option)] for option in solution]
+
+    def write_dimacs(self, f: IO[str]) -> None:
+        """以DIMACS格式写出"""
+        f.write(f"p cnf {self.num_vars} {len(self.clauses)}\n")
+        for clause in self.clauses:
+            f.write(" ".join(map(str, clause)) + " 0\n")
+
+
+class SatPuzzleSolver(PuzzleSolver):
+    """基于SAT的拼图求解器
+
+    把拼图编码为CNF: 每个位置恰好放一个拼图片、每个拼图片恰好使用一次，
+    相邻位置的接缝通过支持子句约束(选中一侧的拼图片时，另一侧必须选中边缘值匹配的拼图片)。
+    优先调用本地安装的SAT求解器，找不到时使用内置的纯Python CDCL求解器。
+    多个解通过不断追加阻塞子句依次求得。
+    """
+
+    # 按优先顺序尝试的外部求解器，均需支持 SAT competition 的输出格式
+    EXTERNAL_SOLVERS = ('kissat', 'cadical', 'cryptominisat5', 'glucose', 'minisat')
+    # 设置超时时内置求解器每次最多处理的冲突数，之后检查一次是否超时
+    TIMEOUT_CONFLICTS = 1000
+
+    def __init__(self, puzzle: JigsawPuzzle, backend: Optional[str] = 'auto'):
+        """
+        Args:
+            puzzle: 要求解的拼图
+            backend: 'auto' 自动查找外部求解器，'builtin' 使用内置求解器，
+                     其他值作为外部求解器的可执行文件名或路径
+        """
+        super().__init__(puzzle)
+        self.backend = self._resolve_backend(backend)
+
+    @classmethod
+    def _resolve_backend(cls, backend: Optional[str]) -> Optional[str]:
+        """返回外部求解器的路径，使用内置求解器时返回None"""
+        if backend in (None, 'builtin'):
+            return None
+        if backend == 'auto':
+            for name in cls.EXTERNAL_SOLVERS:
+                path = shutil.which(name)
+                if path:
+                    return path
+            return None
+        path = shutil.which(backend)
+        if not path:
+            raise ValueError(f"找不到SAT求解器: {backend}")
+        return path
+
+    def encode_cnf(self) -> CnfFormula:
+        """把拼图编码为CNF"""
+        rows, cols = self.puzzle.rows, self.puzzle.cols
+        options: List[Tuple[int, int, int, int]] = []
+        edges_of: List[Tuple[int, int, int, int]] = []
+        by_cell: Dict[Tuple[int, int], List[int]] = {}
+        by_piece: Dict[int, List[int]] = {piece.id: [] for piece in self.puzzle.pieces}
+        for r in range(rows):
+            for c in range(cols):
+                by_cell[(r, c)] = []
+                for piece in self.puzzle.pieces:
+                    for rotation, edges in self._orientations(piece, r, c):
+                        options.append((piece.id, r, c, rotation))
+                        edges_of.append(edges)
+                        by_cell[(r, c)].append(len(options))
+                        by_piece[piece.id].append(len(options))
+
+        cnf = CnfFormula(options)
+        for lits in by_cell.values():
+            cnf.exactly_one(lits)
+        for lits in by_piece.values():
+            if len(self.puzzle.pieces) == rows * cols:
+                cnf.exactly_one(lits)
+            elif lits:
+                cnf.at_most_one(lits)
+
+        def support(cell: Tuple[int, int], side: int) -> Dict[int, List[int]]:
+            """按指定方向的边缘值对某个位置的候选分组"""
+            groups: Dict[int, List[int]] = {}
+            for var in by_cell[cell]:
+                groups.setdefault(edges_of[var - 1][side], []).append(var)
+            return groups
+
+        # 接缝约束: 双向添加支持子句以加强单元传播
+        for r in range(rows):
+            for c in range(cols):
+                for (dr, dc, side, other_side) in ((0, 1, 1, 3), (1, 0, 2, 0)):
+                    nr, nc = r + dr, c + dc
+                    if nr >= rows or nc >= cols:
+                        continue
+                    near, far = support((r, c), side), support((nr, nc), other_side)
+                    for value, lits in near.items():
+                        for var in lits:
+                            cnf.clauses.append([-var] + far.get(-value, []))
+                    for value, lits in far.items():
+                        for var in lits:
+                            cnf.clauses.append([-var] + near.get(-value, []))
+        return cnf
+
+    def write_dimacs(self, f: IO[str]) -> CnfFormula:
+        """把拼图的CNF编码以DIMACS格式写出"""
+        cnf = self.encode_cnf()
+        cnf.write_dimacs(f)
+        return cnf
+
+    @classmethod
+    def _run_external(cls, backend: str, cnf: CnfFormula,
+                      deadline: Optional[float] = None) -> Optional[List[int]]:
+        """调用外部求解器，返回赋值，不可满足时返回None，超过截止时间抛出 TimeoutError"""
+        fd, path = tempfile.mkstemp(suffix='.cnf')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                cnf.write_dimacs(f)
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if os.path.basename(backend).startswith('minisat'):
+                return cls._run_minisat(backend, path, timeout)
+            result = subprocess.run([backend, path], capture_output=True, text=True, timeout=timeout)
+            return cls._parse_competition_output(result.stdout)
+        except subprocess.TimeoutExpired:
+            raise TimeoutError("求解超时") from None
+        finally:
+            os.unlink(path)
+
+    @staticmethod
+    def _run_minisat(backend: str, path: str, timeout: Optional[float] = None) -> Optional[List[int]]:
+        """minisat 把结果写入单独的文件"""
+        out_path = path + '.out'
+        try:
+            subprocess.run([backend, path, out_path], capture_output=True, text=True, timeout=timeout)
+            with open(out_path) as f:
+                lines = f.read().split('\n', 1)
+        finally:
+            if os.path.exists(out_path):
+                os.unlink(out_path)
+        if lines[0].strip() != 'SAT':
+            return None
+        return [int(token) for token in lines[1].split() if token != '0']
+
+    @staticmethod
+    def _parse_competition_output(output: str) -> Optional[List[int]]:
+        """解析 SAT competition 格式的输出 ('s SATISFIABLE' 与 'v ...' 行)"""
+        status = None
+        model: List[int] = []
+        for line in output.splitlines():
+            if line.startswith('s '):
+                status = line[2:].strip()
+            elif line.startswith('v '):
+                model.extend(int(token) for token in line[2:].split() if token != '0')
+        if status == 'SATISFIABLE':
+            return model
+        if status == 'UNSATISFIABLE':
+            return None
+        raise RuntimeError(f"无法解析SAT求解器的输出: {output[:200]!r}")
+
+    def _solve_builtin(self, sat: CdclSolver, deadline: Optional[float]) -> Optional[List[int]]:
+        """用内置求解器求解，返回赋值，不可满足时返回None，超过截止时间抛出 TimeoutError"""
+        while True:
+            result = sat.solve(None if deadline is None else self.TIMEOUT_CONFLICTS)
+            if result is not None:
+                return sat.model() if result else None
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError("求解超时")
+
+    def find_all_solutions(self, max_solutions: int = 1000, greedy: Optional[bool] = None,
+                           checkpoint: Optional[str] = None, resume_from: Optional[str] = None,
+                           checkpoint_interval: float = 60.0,
+                           transposition: Optional[TranspositionTable] = None,
+                           timeout: Optional[float] = None) -> Iterator[Solution]:
+        """找出所有可能的拼图解决方案
+
+        参数含义与 PuzzleSolver.find_all_solutions 相同。SAT求解无法保存搜索前沿，
+        也不经过置换表，指定 checkpoint、resume_from 或 transposition 时改用回溯搜索
+
+        Returns:
+            Iterator[List[Tuple[int, int, int, int]]]: 解决方案生成器
+        """
+        if checkpoint is not None or resume_from is not None or transposition is not None:
+            yield from super().find_all_solutions(max_solutions, greedy, checkpoint, resume_from,
+                                                  checkpoint_interval, transposition, timeout)
+            return
+        if max_solutions <= 0 or self.precheck() is not None:
+            return
+        assembled = self._greedy_solutions(greedy)
+        if assembled is not None:
+            yield from assembled[:max_solutions]
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        cnf = self.encode_cnf()
+        if self.backend is None:
+            sat = CdclSolver(cnf.num_vars)
+            # 决策时优先尝试"放置"，每次决策都能通过互斥约束传播出大量赋值
+            for var in range(1, len(cnf.options) + 1):
+                sat.set_phase(var, True)
+            for clause in cnf.clauses:
+                if not sat.add_clause(clause):
+                    return
+        count = 0
+        while count < max_solutions:
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError("求解超时")
+            if self.backend is None:
+                model = self._solve_builtin(sat, deadline)
+            else:
+                model = self._run_external(self.backend, cnf, deadline)
+            if model is None:
+                return
+            solution = cnf.decode(model)
+            yield solution
+            count += 1
+            blocking = cnf.blocking_clause(solution)
+            if self.backend is None:
+                if not sat.add_clause(blocking):
+                    return
+            else:
+                cnf.clauses.append(blocking)
@@ -0,0 +1,313 @@
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from .transposition import MASK64, TranspositionTable
+
+if TYPE_CHECKING:
+    from .puzzle_solver import PuzzleSolver
+
+Edges = Tuple[int, int, int, int]
+Placement = Tuple[int, int, int, int]
+# 候选摆放: (拼图片id, 旋转角度, 边缘值)
+Option = Tuple[int, int, Edges]
+
+
+class CandidateIndex:
+    """按位置类别和 (上边缘值, 左边缘值) 索引的候选摆放
+
+    位置的候选只取决于它是否在四条边上，因此最多只有9类位置。
+    索引在首次用到某类位置时建立，建立后只读，可以在多个搜索之间共享。
+    候选的顺序与 PuzzleSolver 回溯搜索的尝试顺序一致(按拼图片顺序，再按旋转角度)。
+    上方或左侧邻居尚未放置时可以只按另一个方向的边缘值查找。
+    """
+
+    def __init__(self, solver: 'PuzzleSolver'):
+        self.solver = solver
+        self.rows, self.cols = solver.puzzle.rows, solver.puzzle.cols
+        self._index: Dict[Tuple[bool, bool, bool, bool],
+                          Dict[Tuple[Optional[int], Optional[int]], List[Option]]] = {}
+
+    def options(self, row: int, col: int, up: Optional[int], left: Optional[int]) -> List[Option]:
+        """上边缘值为 up、左边缘值为 left 且满足位置要求的所有候选，up 或 left 为None时不限制该方向"""
+        signature = (row == 0, col == self.cols - 1, row == self.rows - 1, col == 0)
+        index = self._index.get(signature)
+        if index is None:
+            index = {}
+            for piece in self.solver.puzzle.pieces:
+                for rotation, edges in self.solver._orientations(piece, row, col):
+                    option = (piece.id, rotation, edges)
+                    for key in ((edges[0], edges[3]), (edges[0], None), (None, edges[3]), (None, None)):
+                        index.setdefault(key, []).append(option)
+            self._index[signature] = index
+        return index.get((up, left), [])
+
+
+class SearchState:
+    """一次回溯搜索的全部可变状态
+
+    按行优先顺序逐个位置放置拼图片，用显式栈代替递归，因此可以:
+    - 随时暂停和继续 (search 的 max_nodes 参数)
+    - 把栈中尚未尝试的分支分出去交给其他工作者 (split)
+    - 只读地共享拼图和拼图片，多个搜索可以同时在不同线程中进行
+
+    搜索从一个前缀(前若干个位置的固定摆放)开始，
+    并可以把第一个待填位置的候选限制在 [first, last) 范围内。
+    exclude 中的每一项 (前缀, limit) 表示摆放恰好为该前缀时，下一个位置只尝试下标小于 limit 的候选，
+    用于去掉已经分给其他工作者的子树(见 split)。
+    栈中每一帧为 [候选列表, 下一个候选的下标, 候选下标上界, 子问题的键, 已找到的解数量]。
+    子问题的键只在使用置换表且该帧会搜索全部候选时存在，搜索完毕后连同解数量一起写入置换表。
+    """
+
+    def __init__(self, solver: 'PuzzleSolver', prefix: Sequence[Placement] = (), first: int = 0,
+                 last: Optional[int] = None, index: Optional[CandidateIndex] = None,
+                 table: Optional[TranspositionTable] = None,
+                 exclude: Sequence[Tuple[Sequence[Placement], int]] = ()):
+        self.solver = solver
+        self.rows, self.cols = solver.puzzle.rows, solver.puzzle.cols
+        self.index = index or CandidateIndex(solver)
+        self.table = table
+        self.grid: List[List[Optional[Edges]]] = [[None] * self.cols for _ in range(self.rows)]
+        self.used: Set[int] = set()
+        self.placements: List[Placement] = []
+        self.stack: List[List[Any]] = []
+        self.nodes = 0
+        self.solutions = 0
+        # 摆放前缀 -> 下一个位置的候选下标上界
+        self._limits: Dict[Tuple[Tuple[int, ...], ...], int] = {}
+        for excluded, limit in exclude:
+            placed = tuple(tuple(placement) for placement in excluded)
+            self._limits[placed] = min(limit, self._limits.get(placed, limit))
+        # 每次放置后的 (下边界哈希, 剩余拼图片哈希)
+        self._hashes: List[Tuple[int, int]] = []
+        if table is not None:
+            remaining = 0
+            self._piece_keys: Dict[int, int] = {}
+            for piece in solver.puzzle.pieces:
+                shape = min(piece.edges_at(rotation) for rotation in (0, 90, 180, 270))
+                self._piece_keys[piece.id] = table.zobrist('piece', piece.is_corner, piece.is_edge, shape)
+                remaining = (remaining + self._piece_keys[piece.id]) & MASK64
+            self._hashes.append((0, remaining))
+        pieces = {piece.id: piece for piece in solver.puzzle.pieces}
+        for piece_id, row, col, rotation in prefix:
+            self._place(row * self.cols + col, (piece_id, rotation, pieces[piece_id].edges_at(rotation)))
+        self.base = len(self.placements)
+        self.first, self.last = first, last
+        # 前缀已经填满整个拼图时，前缀本身就是唯一的解
+        self._pending_solution = self.base == self.rows * self.cols and \
+            first == 0 and last in (None, 1)
+        if self.base < self.rows * self.cols:
+            options = self.candidates(self.base)
+            end = self._end(options) if last is None else min(last, self._end(options))
+            key = self.key() if first == 0 and end == len(options) else None
+            self.stack.append([options, first, end, key, 0])
+
+    @property
+    def finished(self) -> bool:
+        """搜索是否已经结束"""
+        return not self.stack and not self._pending_solution
+
+    def candidates(self, cell: int) -> List[Option]:
+        """在当前部分解下可以放在第 cell 个位置的所有候选"""
+        row, col = divmod(cell, self.cols)
+        # 按行优先顺序放置，上方和左侧的邻居(如果存在)都已放置
+        above = self.grid[row-1][col] if row > 0 else None
+        before = self.grid[row][col-1] if col > 0 else None
+        up = -above[2] if above is not None else 0
+        left = -before[1] if before is not None else 0
+        return [option for option in self.index.options(row, col, up, left)
+                if option[0] not in self.used]
+
+    def _end(self, options: List[Option]) -> int:
+        """在当前摆放下，下一个位置的候选下标上界"""
+        if self._limits:
+            limit = self._limits.get(tuple(self.placements))
+            if limit is not None:
+                return min(limit, len(options))
+        return len(options)
+
+    def key(self) -> Optional[int]:
+        """当前子问题(下一个待填位置、下边界、剩余拼图片)在置换表中的键，未使用置换表时为None"""
+        if self.table is None:
+            return None
+        frontier, remaining = self._hashes[-1]
+        return frontier ^ remaining ^ self.table.zobrist('cell', len(self.placements))
+
+    def push(self, option: Option) -> None:
+        """在下一个待填位置放置一个候选(通常取自 candidates)
+
+        用于在搜索栈之外手动逐层下降(例如抽样)，不要与 search / count 混用。
+        """
+        self._place(len(self.placements), option)
+
+    def pop(self) -> None:
+        """撤销最近一次 push"""
+        self._undo()
+
+    def _place(self, cell: int, option: Option) -> None:
+        piece_id, rotation, edges = option
+        row, col = divmod(cell, self.cols)
+        if self.table is not None:
+            # 第 col 列的边界由上方邻居的下边缘换成本拼图片的下边缘，左侧边界换成本拼图片的右边缘
+            zobrist = self.table.zobrist
+            above = self.grid[row-1][col] if row > 0 else None
+            before = self.grid[row][col-1] if col > 0 else None
+            up = above[2] if above is not None else 0
+            left = before[1] if before is not None else 0
+            frontier, remaining = self._hashes[-1]
+            frontier ^= zobrist('column', col, up) ^ zobrist('column', col, edges[2]) ^ \
+                zobrist('left', left) ^ zobrist('left', edges[1])
+            self._hashes.append((frontier, (remaining - self._piece_keys[piece_id]) & MASK64))
+        self.grid[row][col] = edges
+        self.used.add(piece_id)
+        self.placements.append((piece_id, row, col, rotation))
+
+    def _undo(self) -> None:
+        piece_id, row, col, _ = self.placements.pop()
+        self.grid[row][col] = None
+        self.used.discard(piece_id)
+        if self.table is not None:
+            self._hashes.pop()
+
+    def search(self, max_nodes: Optional[int] = None) -> Iterator[List[Placement]]:
+        """继续搜索并依次产生解决方案
+
+        Args:
+            max_nodes: 本次调用最多放置的拼图片数量，达到后暂停，再次调用时继续
+        """
+        return self._explore(max_nodes, enumerate_solutions=True)
+
+    def count(self, max_nodes: Optional[int] = None) -> int:
+        """继续搜索并返回目前找到的解的总数
+
+        使用置换表时，已记录解数量的子问题直接累加其解数量而不再展开。
+
+        Args:
+            max_nodes: 本次调用最多放置的拼图片数量，达到后暂停，是否已经搜索完毕见 finished
+        """
+        for _ in self._explore(max_nodes, enumerate_solutions=False):
+            pass
+        return self.solutions
+
+    def _explore(self, max_nodes: Optional[int], enumerate_solutions: bool) -> Iterator[List[Placement]]:
+        if self._pending_solution:
+            self._pending_solution = False
+            self.solutions += 1
+            yield list(self.placements)
+        cells = self.rows * self.cols
+        budget = max_nodes
+        stack = self.stack
+        table = self.table
+        limits = self._limits
+        while stack:
+            frame = stack[-1]
+            cell = self.base + len(stack) - 1
+            if len(self.placements) > cell:
+                self._undo()
+            if frame[1] >= frame[2]:
+                stack.pop()
+                # 只有使用置换表时帧才带有子问题的键
+                if frame[3] is not None and table is not None:
+                    table.store(frame[3], frame[4])
+                if stack:
+                    stack[-1][4] += frame[4]
+                continue
+            if budget is not None:
+                if budget <= 0:
+                    return
+                budget -= 1
+            option = frame[0][frame[1]]
+            frame[1] += 1
+            self._place(cell, option)
+            self.nodes += 1
+            if cell + 1 == cells:
+                frame[4] += 1
+                self.solutions += 1
+                yield list(self.placements)
+                continue
+            key = self.key()
+            if key is not None and table is not None:
+                known = table.get(key)
+                # 枚举时只能跳过无解的子问题，计数时可以直接累加已知的解数量
+                if known == 0 or (known is not None and not enumerate_solutions):
+                    frame[4] += known
+                    self.solutions += known
+                    stack.append([[], 0, 0, None, 0])
+                    continue
+            options = self.candidates(cell + 1)
+            end = self._end(options) if limits else len(options)
+            stack.append([options, 0, end, key if end == len(options) else None, 0])
+
+    def split(self) -> Optional[Tuple[List[Placement], int, int]]:
+        """把最浅一层尚未尝试的候选分出大约一半
+
+        Returns:
+            (前缀, first, last): 可以交给另一个 SearchState 的子树，没有可分的工作时返回None
+        """
+        for depth, frame in enumerate(self.stack):
+            remaining = frame[2] - frame[1]
+            if len(self.placements) > self.base + depth:
+                # 这一帧正在搜索某个候选，其余未尝试的候选最多可以全部分出
+                give = (remaining + 1) // 2
+            else:
+                # 这一帧还没有开始搜索，至少留一个候选给自己
+                give = remaining // 2
+            if give <= 0:
+                continue
+            mid = frame[2] - give
+            stolen = (list(self.placements[:self.base + depth]), mid, frame[2])
+            frame[2] = mid
+            # 这一帧及其上层的子问题不再由本搜索完整覆盖，搜索完毕后不能写入置换表
+            for shallower in self.stack[:depth + 1]:
+                shallower[3] = None
+            return stolen
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """把搜索前沿序列化为可以写入JSON的字典
+
+        每一帧记录为 [位置序号, 下一个候选的下标, 候选下标上界]，
+        已放置的拼图片记录为 [拼图片id, 行, 列, 旋转角度]。
+        候选列表由前面的摆放唯一确定，恢复时重新计算。
+        """
+        return {
+            'prefix': [list(placement) for placement in self.placements[:self.base]],
+            'first': self.first,
+            'last': self.last,
+            'frames': [[self.base + depth, frame[1], frame[2]]
+                       for depth, frame in enumerate(self.stack)],
+            'placements': [list(placement) for placement in self.placements[self.base:]],
+            'pending': self._pending_solution,
+            'nodes': self.nodes,
+        }
+
+    @classmethod
+    def from_dict(cls, solver: 'PuzzleSolver', data: Dict[str, Any], index: Optional[CandidateIndex] = None,
+                  table: Optional[TranspositionTable] = None) -> 'SearchState':
+        """从 to_dict 的结果恢复搜索状态
+
+        恢复的帧不知道断点之前已经找到的解数量，因此不会写入置换表。
+
+        Raises:
+            ValueError: 记录的摆放与重新计算的候选不一致(拼图已被修改)
+        """
+        state = cls(solver, data['prefix'], data['first'], data['last'], index, table)
+        state._pending_solution = data['pending']
+        state.nodes = data['nodes']
+        frames, placements = data['frames'], data['placements']
+        if len(placements) > len(frames) or (frames and not state.stack):
+            raise ValueError("断点数据与拼图不一致")
+        del state.stack[len(frames):]
+        for depth, (cell, position, end) in enumerate(frames):
+            frame = state.stack[depth]
+            if cell != state.base + depth or not 0 <= position <= end <= len(frame[0]):
+                raise ValueError("断点数据与拼图不一致")
+            frame[1], frame[2], frame[3] = position, end, None
+            if depth < len(placements):
+                piece_id, row, col, rotation = placements[depth]
+                option = frame[0][position - 1] if position > 0 else None
+                if option is None or option[:2] != (piece_id, rotation) or \
+                   divmod(cell, state.cols) != (row, col):
+                    raise ValueError("断点数据与拼图不一致")
+                state._place(cell, option)
+                if depth + 1 < len(frames):
+                    options = state.candidates(cell + 1)
+                    state.stack.append([options, 0, len(options), None, 0])
+        return state
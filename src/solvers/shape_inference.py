@@ -0,0 +1,118 @@
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Type
+from ..models.piece import JigsawPiece
+from ..models.puzzle import JigsawPuzzle
+from .puzzle_solver import PuzzleSolver
+
+try:
+    import numpy as np
+except ImportError:  # numpy 是可选依赖，缺少时使用纯Python实现
+    np = None  # type: ignore[assignment]
+
+Solution = List[Tuple[int, int, int, int]]
+Shape = Tuple[int, int]
+
+
+def edge_rows(pieces: Sequence[JigsawPiece]) -> List[Tuple[int, int, int, int]]:
+    """拼图片未旋转时的 (上, 右, 下, 左) 边缘值，可直接作为 classify_edges 的输入"""
+    return [piece.edges_at(0) for piece in pieces]
+
+
+def classify_edges(edges: Any) -> Tuple[List[bool], List[bool]]:
+    """根据平边(值为0)的数量和位置推断拼图片类型
+
+    两条相邻的平边(或三条及以上)为角落片，至少一条平边的其余拼图片为边缘片。
+    两条相对的平边出现在 1xN 拼图的中间位置，按边缘片处理。
+
+    Args:
+        edges: 形状为 (n, 4) 的边缘值矩阵，可以是 numpy 数组或由4元组组成的序列
+
+    Returns:
+        (is_corner, is_edge): 两个布尔列表，is_edge 不包含角落片
+    """
+    if np is not None:
+        flat = np.asarray(edges, dtype=np.int64).reshape(-1, 4) == 0
+        count = flat.sum(axis=1)
+        adjacent = (flat & np.roll(flat, 1, axis=1)).any(axis=1)
+        corner = (count >= 3) | ((count == 2) & adjacent)
+        edge = (count >= 1) & ~corner
+        return corner.tolist(), edge.tolist()
+
+    is_corner, is_edge = [], []
+    for row in edges:
+        flat = [value == 0 for value in row]
+        count = sum(flat)
+        corner = count >= 3 or (count == 2 and any(flat[i] and flat[i - 1] for i in range(4)))
+        is_corner.append(corner)
+        is_edge.append(count >= 1 and not corner)
+    return is_corner, is_edge
+
+
+def classify_pieces(pieces: Sequence[JigsawPiece], edges: Optional[Any] = None) -> Tuple[int, int]:
+    """推断并直接设置拼图片的 is_corner/is_edge
+
+    Args:
+        pieces: 拼图片
+        edges: 可选的预先构造好的边缘值矩阵，与 pieces 一一对应
+
+    Returns:
+        (角落片数量, 边缘片数量)，边缘片数量不包含角落片
+    """
+    is_corner, is_edge = classify_edges(edge_rows(pieces) if edges is None else edges)
+    for piece, corner, edge in zip(pieces, is_corner, is_edge):
+        piece.is_corner = corner
+        piece.is_edge = corner or edge
+    return sum(is_corner), sum(is_edge)
+
+
+def infer_shapes(piece_count: int, corners: int, edges: int) -> List[Shape]:
+    """根据拼图片数量以及角落片、边缘片的数量推断可能的 (行数, 列数)
+
+    rows x cols 与 cols x rows 的解可以通过整体旋转互相转换，两者都会列出。
+    """
+    shapes = []
+    for rows in range(1, piece_count + 1):
+        if piece_count % rows:
+            continue
+        cols = piece_count // rows
+        if rows == 1 or cols == 1:
+            expected = (1, 0) if piece_count == 1 else (2, piece_count - 2)
+        else:
+            expected = (4, 2 * (rows - 2) + 2 * (cols - 2))
+        if (corners, edges) == expected:
+            shapes.append((rows, cols))
+    return shapes
+
+
+def candidate_shapes(pieces: Sequence[JigsawPiece], edges: Optional[Any] = None) -> List[Shape]:
+    """推断拼图片类型并返回可能的 (行数, 列数)"""
+    corners, border = classify_pieces(pieces, edges)
+    return infer_shapes(len(pieces), corners, border)
+
+
+def solve_any_shape(pieces: Sequence[JigsawPiece], max_solutions: int = 1000,
+                    solver_class: Type[PuzzleSolver] = PuzzleSolver,
+                    edges: Optional[Any] = None) -> Iterator[Tuple[Shape, Solution]]:
+    """在不知道拼图大小的情况下求解
+
+    先推断拼图片类型和可能的大小，再依次在每个可能的大小上求解。
+    互为转置的大小只求解行数不大于列数的一个。
+
+    Args:
+        pieces: 拼图片，会直接设置其 is_corner/is_edge
+        max_solutions: 所有大小合计的最大解决方案数量
+        solver_class: 使用的求解器类
+        edges: 可选的预先构造好的边缘值矩阵
+
+    Returns:
+        Iterator[Tuple[Tuple[int, int], List[Tuple[int, int, int, int]]]]: ((行数, 列数), 解决方案) 生成器
+    """
+    remaining = max_solutions
+    for rows, cols in candidate_shapes(pieces, edges):
+        if rows > cols or remaining <= 0:
+            continue
+        puzzle = JigsawPuzzle(rows, cols)
+        for piece in pieces:
+            puzzle.add_piece(piece)
+        for solution in solver_class(puzzle).find_all_solutions(max_solutions=remaining):
+            yield (rows, cols), solution
+            remaining -= 1
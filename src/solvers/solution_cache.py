@@ -0,0 +1,179 @@
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from ..models.piece import JigsawPiece
+from ..models.puzzle import JigsawPuzzle
+from .puzzle_solver import PuzzleSolver
+
+Solution = List[Tuple[int, int, int, int]]
+# 规范化后的拼图片: (最小旋转下的边缘值, 是否角落片, 是否边缘片)
+PieceForm = Tuple[Tuple[int, int, int, int], bool, bool]
+
+
+def canonical_piece(piece: JigsawPiece) -> Tuple[PieceForm, int]:
+    """计算拼图片的规范形式
+
+    规范形式取四个旋转角度中字典序最小的边缘值序列，与拼图片当前的旋转无关。
+
+    Returns:
+        (规范形式, 从原始边缘值旋转到规范形式所需的角度)
+    """
+    edges, offset = min((piece.edges_at(rotation), rotation) for rotation in (0, 90, 180, 270))
+    return (edges, piece.is_corner, piece.is_edge), offset
+
+
+class CanonicalPuzzle:
+    """拼图的规范化表示
+
+    拼图片按规范形式排序，因此与拼图片的顺序、id和打乱时的旋转都无关。
+    缓存中的解决方案使用 (规范序号, 行, 列, 规范旋转) 表示，
+    可以在任意等价的拼图之间相互转换。
+    """
+
+    def __init__(self, puzzle: JigsawPuzzle):
+        entries = sorted(
+            ((*canonical_piece(piece), index) for index, piece in enumerate(puzzle.pieces)),
+            key=lambda entry: (entry[0], entry[2])
+        )
+        self._pieces = [puzzle.pieces[index] for _, _, index in entries]
+        self._offsets = [offset for _, offset, _ in entries]
+        self._index_of = {piece.id: i for i, piece in enumerate(self._pieces)}
+        payload = json.dumps([puzzle.rows, puzzle.cols, [form for form, _, _ in entries]])
+        self.key = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def to_canonical(self, solution: Solution) -> List[List[int]]:
+        """把解决方案转换为规范表示"""
+        result = []
+        for piece_id, row, col, rotation in solution:
+            index = self._index_of[piece_id]
+            result.append([index, row, col, (rotation - self._offsets[index]) % 360])
+        return result
+
+    def from_canonical(self, solution: List[List[int]]) -> Solution:
+        """把规范表示的解决方案转换回当前拼图的拼图片id和旋转"""
+        return [(self._pieces[index].id, row, col, (self._offsets[index] + rotation) % 360)
+                for index, row, col, rotation in solution]
+
+
+def canonical_key(puzzle: JigsawPuzzle) -> str:
+    """计算拼图的内容哈希，与拼图片顺序、旋转和id无关"""
+    return CanonicalPuzzle(puzzle).key
+
+
+class SolutionCache:
+    """以内容哈希为键的解决方案缓存
+
+    内存中保存有限数量的最近使用条目(LRU)，可选地把条目持久化到磁盘目录。
+    缓存条目记录已找到的解决方案以及搜索是否已经穷尽，
+    只有当缓存的结果足以回答请求的 max_solutions 时才会命中。
+    """
+
+    def __init__(self, maxsize: int = 128, directory: Optional[str] = None):
+        if maxsize < 1:
+            raise ValueError("缓存容量必须大于0")
+        self.maxsize = maxsize
+        self.directory = directory
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _path(directory: str, key: str) -> str:
+        return os.path.join(directory, f"{key}.json")
+
+    def _load(self, key: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """依次从内存和磁盘查找条目
+
+        Returns:
+            (条目, 是否来自磁盘)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry, False
+        directory = self.directory
+        if not directory:
+            return None, False
+        try:
+            with open(self._path(directory, key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None, False
+        self._remember(key, entry)
+        return entry, True
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        """放入内存LRU，超出容量时淘汰最久未使用的条目"""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _store(self, key: str, entry: Dict[str, Any]) -> None:
+        self._remember(key, entry)
+        directory = self.directory
+        if not directory:
+            return
+        # 先写临时文件再替换，避免并发读取到写了一半的文件
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, self._path(directory, key))
+
+    def find_all_solutions(self, solver: PuzzleSolver,
+                           max_solutions: int = 1000) -> Iterator[Solution]:
+        """带缓存的 solver.find_all_solutions
+
+        Args:
+            solver: 要查询的求解器
+            max_solutions: 最大解决方案数量
+
+        Returns:
+            Iterator[Solution]: 使用调用方拼图片id和旋转的解决方案生成器
+        """
+        canonical = CanonicalPuzzle(solver.puzzle)
+        entry, from_disk = self._load(canonical.key)
+        if entry is not None and (entry['complete'] or len(entry['solutions']) >= max_solutions):
+            with self._lock:
+                self.hits += 1
+                self.disk_hits += from_disk
+            for solution in entry['solutions'][:max_solutions]:
+                yield canonical.from_canonical(solution)
+            return
+
+        with self._lock:
+            self.misses += 1
+        # 边求解边交出，同时收集规范形式；调用方提前停止迭代时结果不完整，不写入缓存
+        solutions = []
+        for solution in solver.find_all_solutions(max_solutions=max_solutions):
+            solutions.append(canonical.to_canonical(solution))
+            yield solution
+        self._store(canonical.key, {
+            'solutions': solutions,
+            'complete': len(solutions) < max_solutions,
+        })
+
+    def stats(self) -> Dict[str, int]:
+        """返回命中统计"""
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+            }
+
+    def clear(self) -> None:
+        """清空内存中的条目(磁盘上的条目保留)"""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,225 @@
+from itertools import permutations, product
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import math
+import time
+from ..models.puzzle import JigsawPuzzle
+from .puzzle_solver import PuzzleSolver
+from .solution_cache import PieceForm, canonical_piece
+from .transposition import TranspositionTable
+
+Edges = Tuple[int, int, int, int]
+Solution = List[Tuple[int, int, int, int]]
+# 按类搜索得到的解: 每个位置 (类序号, 边缘值)，按行优先顺序排列
+ClassSolution = List[Tuple[int, Edges]]
+
+
+class _PieceClass:
+    """规范形式相同的一组拼图片"""
+
+    __slots__ = ('form', 'members', 'rotations', 'period')
+
+    def __init__(self, form: PieceForm):
+        self.form = form
+        # 拼图片id，按在拼图中出现的顺序
+        self.members: List[int] = []
+        # 每个成员: 边缘值 -> 得到这组边缘值的旋转角度
+        self.rotations: Dict[int, Dict[Edges, List[int]]] = {}
+        # 旋转对称的周期: 1 四个方向相同，2 旋转180°后不变，4 没有旋转对称
+        edges = form[0]
+        self.period = next(p for p in (1, 2, 4) if edges == edges[p:] + edges[:p])
+
+
+class SymmetryReducedSolver(PuzzleSolver):
+    """把相同的拼图片和对称的旋转合并后再搜索的求解器
+
+    edge_types 较小时很多拼图片在旋转意义下完全相同(规范形式相同)，
+    有的拼图片旋转180°甚至90°后与自身重合。逐个拼图片、逐个旋转角度回溯时，
+    这些等价的选择会展开出大量完全相同的子搜索。
+
+    这里按规范形式把拼图片分成等价类，每个位置对每一类、每一组不同的边缘值只分支一次，
+    搜索的是 "类的排列"。一个类解对应的具体解的数量(重数)为:
+    每一类 k 个成员在其占用的 m 个位置上的排列数 k!/(k-m)!，乘以每个位置上
+    能得到同一组边缘值的旋转角度个数(4/周期)。
+
+    find_all_solutions 把类解展开为全部具体解，与 PuzzleSolver 得到的解集合相同(顺序不同)；
+    find_solution_classes 只给出每个类解的一个代表及其重数，count_solutions 直接累加重数。
+    """
+
+    def __init__(self, puzzle: JigsawPuzzle):
+        super().__init__(puzzle)
+        self.classes: List[_PieceClass] = []
+        by_form: Dict[PieceForm, _PieceClass] = {}
+        for piece in puzzle.pieces:
+            form, _ = canonical_piece(piece)
+            piece_class = by_form.get(form)
+            if piece_class is None:
+                piece_class = by_form[form] = _PieceClass(form)
+                self.classes.append(piece_class)
+            piece_class.members.append(piece.id)
+            rotations: Dict[Edges, List[int]] = {}
+            for rotation in (0, 90, 180, 270):
+                rotations.setdefault(piece.edges_at(rotation), []).append(rotation)
+            piece_class.rotations[piece.id] = rotations
+        self._pieces = {piece.id: piece for piece in puzzle.pieces}
+        self._index: Dict[Tuple[bool, bool, bool, bool], Dict[Tuple[int, int], List[Tuple[int, Edges]]]] = {}
+
+    def _options(self, row: int, col: int, up: int, left: int) -> List[Tuple[int, Edges]]:
+        """上边缘值为 up、左边缘值为 left 且满足位置要求的 (类序号, 边缘值)，每组边缘值只出现一次"""
+        rows, cols = self.puzzle.rows, self.puzzle.cols
+        signature = (row == 0, col == cols - 1, row == rows - 1, col == 0)
+        index = self._index.get(signature)
+        if index is None:
+            index = {}
+            for class_index, piece_class in enumerate(self.classes):
+                representative = self._pieces[piece_class.members[0]]
+                seen = set()
+                for _, edges in self._orientations(representative, row, col):
+                    if edges not in seen:
+                        seen.add(edges)
+                        index.setdefault((edges[0], edges[3]), []).append((class_index, edges))
+            self._index[signature] = index
+        return index.get((up, left), [])
+
+    def _iter_class_solutions(self, deadline: Optional[float] = None) -> Iterator[ClassSolution]:
+        """按类回溯搜索，依次产生类解
+
+        用显式栈代替递归，大拼图不受递归深度限制。按行优先顺序放置，
+        placed[i] 就是第i个位置的 (类序号, 边缘值)，上方和左侧邻居的边缘值直接从中读取。
+
+        Args:
+            deadline: time.monotonic() 的截止时间，超过时抛出 TimeoutError
+        """
+        cols = self.puzzle.cols
+        cells = self.puzzle.rows * cols
+        remaining = [len(piece_class.members) for piece_class in self.classes]
+        placed: ClassSolution = []
+        # stack[i]: 第i个位置的候选列表和下一个要尝试的候选序号
+        stack: List[List[Any]] = [[self._options(0, 0, 0, 0), 0]]
+        nodes = 0
+        while stack:
+            index = len(stack) - 1
+            frame = stack[-1]
+            options, position = frame
+            if len(placed) > index:
+                # 撤销这个位置上一次的选择
+                class_index, _ = placed.pop()
+                remaining[class_index] += 1
+            while position < len(options) and not remaining[options[position][0]]:
+                position += 1
+            if position == len(options):
+                stack.pop()
+                continue
+            frame[1] = position + 1
+            class_index, edges = options[position]
+            remaining[class_index] -= 1
+            placed.append((class_index, edges))
+            nodes += 1
+            if deadline is not None and nodes % self.CHECKPOINT_NODES == 0 and time.monotonic() > deadline:
+                raise TimeoutError("求解超时")
+            if index + 1 == cells:
+                yield list(placed)
+                continue
+            row, col = divmod(index + 1, cols)
+            up = -placed[index + 1 - cols][1][2] if row > 0 else 0
+            left = -edges[1] if col > 0 else 0
+            stack.append([self._options(row, col, up, left), 0])
+
+    def multiplicity(self, class_solution: ClassSolution) -> int:
+        """一个类解对应的具体解的数量"""
+        used: Dict[int, int] = {}
+        for class_index, _ in class_solution:
+            used[class_index] = used.get(class_index, 0) + 1
+        result = 1
+        for class_index, count in used.items():
+            members = len(self.classes[class_index].members)
+            result *= math.perm(members, count) * (4 // self.classes[class_index].period) ** count
+        return result
+
+    def _expand(self, class_solution: ClassSolution) -> Iterator[Solution]:
+        """把类解展开为全部具体解"""
+        cols = self.puzzle.cols
+        cells_of: Dict[int, List[int]] = {}
+        for cell, (class_index, _) in enumerate(class_solution):
+            cells_of.setdefault(class_index, []).append(cell)
+        groups = list(cells_of.items())
+        # 每一类: 成员在该类所占位置上的所有排列
+        assignments = [permutations(self.classes[class_index].members, len(cells))
+                       for class_index, cells in groups]
+        for chosen in product(*assignments):
+            owners: List[int] = [0] * len(class_solution)
+            for (class_index, cells), members in zip(groups, chosen):
+                for cell, piece_id in zip(cells, members):
+                    owners[cell] = piece_id
+            choices = [self.classes[class_index].rotations[owners[cell]][edges]
+                       for cell, (class_index, edges) in enumerate(class_solution)]
+            for rotations in product(*choices):
+                yield [(owners[cell], *divmod(cell, cols), rotation)
+                       for cell, rotation in enumerate(rotations)]
+
+    def find_solution_classes(self, max_classes: int = 1000,
+                              timeout: Optional[float] = None) -> Iterator[Tuple[Solution, int]]:
+        """依次产生类解的一个代表(具体解)及其重数
+
+        Args:
+            max_classes: 最多产生的类解数量
+            timeout: 超时时间(秒)，超时抛出 TimeoutError(之前已经产生的类解仍然有效)
+        """
+        if max_classes <= 0 or self.precheck() is not None:
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for count, class_solution in enumerate(self._iter_class_solutions(deadline), 1):
+            yield next(self._expand(class_solution)), self.multiplicity(class_solution)
+            if count >= max_classes:
+                return
+
+    def find_all_solutions(self, max_solutions: int = 1000, greedy: Optional[bool] = None,
+                           checkpoint: Optional[str] = None, resume_from: Optional[str] = None,
+                           checkpoint_interval: float = 60.0,
+                           transposition: Optional[TranspositionTable] = None,
+                           timeout: Optional[float] = None) -> Iterator[Solution]:
+        """找出所有可能的拼图解决方案，每个类解展开为它对应的全部具体解
+
+        参数与 PuzzleSolver.find_all_solutions 相同。断点和置换表记录的是逐个拼图片搜索的状态，
+        指定 checkpoint、resume_from 或 transposition 时按 PuzzleSolver 的方式搜索。
+
+        Args:
+            max_solutions: 最大解决方案数量
+            greedy: 是否先尝试贪心拼接，含义同 PuzzleSolver
+            timeout: 搜索的超时时间(秒)，超时抛出 TimeoutError(之前已经产生的解仍然有效)
+
+        Returns:
+            Iterator[List[Tuple[int, int, int, int]]]: 解决方案生成器
+        """
+        if checkpoint is not None or resume_from is not None or transposition is not None:
+            yield from super().find_all_solutions(max_solutions, greedy, checkpoint, resume_from,
+                                                  checkpoint_interval, transposition, timeout)
+            return
+        if max_solutions <= 0 or self.precheck() is not None:
+            return
+        assembled = self._greedy_solutions(greedy)
+        if assembled is not None:
+            yield from assembled[:max_solutions]
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        count = 0
+        for class_solution in self._iter_class_solutions(deadline):
+            for solution in self._expand(class_solution):
+                yield solution
+                count += 1
+                if count >= max_solutions:
+                    return
+                # 一个类解可能展开出大量具体解，展开过程中同样要检查超时
+                if deadline is not None and count % self.CHECKPOINT_NODES == 0 and time.monotonic() > deadline:
+                    raise TimeoutError("求解超时")
+
+    def count_solutions(self, transposition: Optional[TranspositionTable] = None) -> int:
+        """统计具体解的总数: 不展开类解，直接累加重数
+
+        Args:
+            transposition: 置换表。指定时按 PuzzleSolver 的方式计数并把子问题的解数量写入表中
+        """
+        if transposition is not None:
+            return super().count_solutions(transposition)
+        if self.precheck() is not None:
+            return 0
+        return sum(self.multiplicity(class_solution) for class_solution in self._iter_class_solutions())
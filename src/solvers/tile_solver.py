@@ -0,0 +1,265 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import os
+import time
+from ..models.piece import JigsawPiece
+from ..models.puzzle import JigsawPuzzle
+from ..serialization.puzzle_codec import puzzle_from_dict, puzzle_to_dict
+from .puzzle_solver import Edges, PuzzleSolver
+from .search_state import CandidateIndex, Option
+from .transposition import TranspositionTable
+
+Solution = List[Tuple[int, int, int, int]]
+Cell = Tuple[int, int]
+# 子区域的描述: (起始行, 结束行, 起始列, 结束列)，不含结束行和结束列
+Tile = Tuple[int, int, int, int]
+# 子区域的任务: (待填位置, 相邻的骨架位置 {位置: (拼图片id, 旋转角度)}, 节点上限)
+TileTask = Tuple[List[Cell], Dict[Cell, Tuple[int, int]], Optional[int]]
+
+
+class _TileContext:
+    """在给定锚点的前提下按边缘值查找拼图片，逐个位置填充
+
+    主进程用它拼出骨架，工作进程用它拼出各个子区域。
+    """
+
+    def __init__(self, solver: PuzzleSolver, used: Iterable[int] = ()):
+        self.solver = solver
+        self.pieces = {piece.id: piece for piece in solver.puzzle.pieces}
+        self.used = set(used)
+        self.index = CandidateIndex(solver)
+
+    @staticmethod
+    def _fits(edges: Edges, row: int, col: int, placed: Dict[Cell, Edges]) -> bool:
+        """检查与已放置的四个邻居是否匹配"""
+        for (r, c, side, other) in ((row - 1, col, 0, 2), (row, col + 1, 1, 3),
+                                    (row + 1, col, 2, 0), (row, col - 1, 3, 1)):
+            neighbour = placed.get((r, c))
+            if neighbour is not None and edges[side] + neighbour[other] != 0:
+                return False
+        return True
+
+    def candidates(self, row: int, col: int, placed: Dict[Cell, Edges]) -> List[Option]:
+        """列出可以放在 (row, col) 的所有未使用的 (拼图片id, 旋转角度, 边缘值)
+
+        按已放置的上方和左侧邻居的边缘值从候选索引中查找，再检查右侧和下方的邻居。
+        """
+        up, left = placed.get((row - 1, col)), placed.get((row, col - 1))
+        options = self.index.options(row, col, None if up is None else -up[2],
+                                     None if left is None else -left[1])
+        return [option for option in options
+                if option[0] not in self.used and self._fits(option[2], row, col, placed)]
+
+    def fill(self, cells: List[Cell], placed: Dict[Cell, Edges],
+             max_nodes: Optional[int] = None) -> Optional[Solution]:
+        """按顺序填充给定的位置(显式栈回溯)，超过节点上限或无解时返回None"""
+        if not cells:
+            return []
+        result: Solution = []
+        stack = [iter(self.candidates(*cells[0], placed))]
+        nodes = 0
+        while stack:
+            option = next(stack[-1], None)
+            if option is None:
+                stack.pop()
+                if result:
+                    piece_id, row, col, _ = result.pop()
+                    del placed[(row, col)]
+                    self.used.discard(piece_id)
+                continue
+            nodes += 1
+            if max_nodes is not None and nodes > max_nodes:
+                break
+            piece_id, rotation, edges = option
+            row, col = cells[len(result)]
+            placed[(row, col)] = edges
+            self.used.add(piece_id)
+            result.append((piece_id, row, col, rotation))
+            if len(result) == len(cells):
+                return result
+            stack.append(iter(self.candidates(*cells[len(result)], placed)))
+        # 撤销未完成的放置
+        for piece_id, row, col, _ in result:
+            del placed[(row, col)]
+            self.used.discard(piece_id)
+        return None
+
+
+_worker_context: Optional[_TileContext] = None
+
+
+def _init_worker(puzzle_data: Dict[str, Any], skeleton_ids: List[int]) -> None:
+    """工作进程初始化: 重建拼图和边缘值索引"""
+    global _worker_context
+    _worker_context = _TileContext(PuzzleSolver(puzzle_from_dict(puzzle_data)), skeleton_ids)
+
+
+def _run_tile(task: TileTask) -> Optional[Solution]:
+    if _worker_context is None:
+        raise RuntimeError("工作进程尚未初始化")
+    return _fill_tile(_worker_context, task)
+
+
+def _fill_tile(context: _TileContext, task: TileTask) -> Optional[Solution]:
+    """拼出一个子区域"""
+    cells, anchors, max_nodes = task
+    placed = {cell: context.pieces[piece_id].edges_at(rotation)
+              for cell, (piece_id, rotation) in anchors.items()}
+    used = set(context.used)
+    try:
+        return context.fill(cells, placed, max_nodes)
+    finally:
+        context.used = used
+
+
+class TileSolver(PuzzleSolver):
+    """分块并行的拼图求解器，适用于接缝值基本唯一的大拼图
+
+    1. 先用边缘值查找拼出骨架: 第一行以及每个子区域的最左列
+    2. 把拼图切成矩形子区域，在多个进程中从骨架出发按行拼出各个子区域
+    3. 把子区域拼接起来，重复使用的拼图片和子区域边界上不匹配的接缝在其周围局部重新搜索
+
+    只求一个解；骨架无法拼出或局部修复失败时退回到 PuzzleSolver 的完整求解。
+    """
+
+    # 单个子区域回溯的节点上限，超过时该子区域交给拼接阶段的局部搜索处理
+    TILE_NODE_LIMIT = 100000
+    # 拼接阶段每个半径的局部搜索的节点上限，超过时退回到完整求解
+    REPAIR_NODE_LIMIT = 100000
+
+    def __init__(self, puzzle: JigsawPuzzle, tile_size: Tuple[int, int] = (16, 16),
+                 processes: Optional[int] = None, max_radius: int = 2):
+        """
+        Args:
+            puzzle: 要求解的拼图
+            tile_size: 子区域的 (行数, 列数)
+            processes: 进程数量，默认为CPU核数，为1时在当前进程中依次拼接
+            max_radius: 拼接冲突处局部搜索区域的最大半径
+        """
+        super().__init__(puzzle)
+        if tile_size[0] < 1 or tile_size[1] < 1:
+            raise ValueError("子区域大小必须为正数")
+        self.tile_size = tile_size
+        self.processes = processes
+        self.max_radius = max_radius
+
+    def tiles(self) -> List[Tile]:
+        """按 tile_size 切分出的所有子区域"""
+        rows, cols = self.puzzle.rows, self.puzzle.cols
+        height, width = self.tile_size
+        return [(r0, min(r0 + height, rows), c0, min(c0 + width, cols))
+                for r0 in range(0, rows, height)
+                for c0 in range(0, cols, width)]
+
+    def _skeleton_cells(self) -> List[Cell]:
+        rows, cols = self.puzzle.rows, self.puzzle.cols
+        cells = [(0, c) for c in range(cols)]
+        for c0 in range(0, cols, self.tile_size[1]):
+            cells.extend((r, c0) for r in range(1, rows))
+        return cells
+
+    def _tile_task(self, tile: Tile, skeleton: Dict[Cell, Tuple[int, int]]) -> TileTask:
+        """子区域的待填位置及其可用的骨架锚点"""
+        r0, r1, c0, c1 = tile
+        cells = [(r, c) for r in range(max(r0, 1), r1) for c in range(c0 + 1, c1)]
+        anchors = {(r, c): skeleton[(r, c)]
+                   for r in range(r0, r1) for c in (c0, c1) if (r, c) in skeleton}
+        if r0 == 0:
+            anchors.update(((0, c), skeleton[(0, c)]) for c in range(c0, c1))
+        return cells, anchors, self.TILE_NODE_LIMIT
+
+    def _assemble(self) -> Optional[Solution]:
+        rows, cols = self.puzzle.rows, self.puzzle.cols
+        if len(self.puzzle.pieces) != rows * cols:
+            return None
+        context = _TileContext(self)
+        placed: Dict[Cell, Edges] = {}
+        skeleton_placements = context.fill(self._skeleton_cells(), placed, self.TILE_NODE_LIMIT)
+        if skeleton_placements is None:
+            return None
+        skeleton = {(row, col): (piece_id, rotation)
+                    for piece_id, row, col, rotation in skeleton_placements}
+
+        tiles = self.tiles()
+        tasks = [self._tile_task(tile, skeleton) for tile in tiles]
+        processes = self.processes or os.cpu_count() or 1
+        if processes == 1 or len(tasks) == 1:
+            results = [_fill_tile(context, task) for task in tasks]
+        else:
+            skeleton_ids = [piece_id for piece_id, _ in skeleton.values()]
+            with ProcessPoolExecutor(max_workers=min(processes, len(tasks)),
+                                     initializer=_init_worker,
+                                     initargs=(puzzle_to_dict(self.puzzle), skeleton_ids)) as executor:
+                results = list(executor.map(_run_tile, tasks))
+        return self._stitch(skeleton, tasks, results, context.index)
+
+    def _stitch(self, skeleton: Dict[Cell, Tuple[int, int]], tasks: List[TileTask],
+                results: List[Optional[Solution]],
+                index: Optional[CandidateIndex] = None) -> Optional[Solution]:
+        """拼接各子区域，冲突处局部重新搜索"""
+        pieces = {piece.id: piece for piece in self.puzzle.pieces}
+        layout: Dict[Cell, Tuple[JigsawPiece, int]] = {
+            cell: (pieces[piece_id], rotation) for cell, (piece_id, rotation) in skeleton.items()}
+        used = {piece_id for piece_id, _ in skeleton.values()}
+        dirty = set()
+        for (cells, _, _), placements in zip(tasks, results):
+            if placements is None:
+                dirty.update(cells)
+                continue
+            for piece_id, row, col, rotation in placements:
+                if piece_id in used:
+                    dirty.add((row, col))  # 已被其他子区域使用
+                else:
+                    used.add(piece_id)
+                    layout[(row, col)] = (pieces[piece_id], rotation)
+
+        rows, cols = self.puzzle.rows, self.puzzle.cols
+        for (row, col), (piece, rotation) in layout.items():
+            edges = piece.edges_at(rotation)
+            if col + 1 < cols and (row, col + 1) in layout:
+                right_piece, right_rotation = layout[(row, col + 1)]
+                if edges[1] + right_piece.edges_at(right_rotation)[3] != 0:
+                    dirty.update(((row, col), (row, col + 1)))
+            if row + 1 < rows and (row + 1, col) in layout:
+                down_piece, down_rotation = layout[(row + 1, col)]
+                if edges[2] + down_piece.edges_at(down_rotation)[0] != 0:
+                    dirty.update(((row, col), (row + 1, col)))
+
+        if dirty:
+            spare = [piece for piece in self.puzzle.pieces if piece.id not in used]
+            if not self._repair_layout(layout, dirty, spare, self.max_radius,
+                                       self.REPAIR_NODE_LIMIT, index):
+                return None
+        return self._layout_to_solution(layout)
+
+    def find_all_solutions(self, max_solutions: int = 1000, greedy: Optional[bool] = None,
+                           checkpoint: Optional[str] = None, resume_from: Optional[str] = None,
+                           checkpoint_interval: float = 60.0,
+                           transposition: Optional[TranspositionTable] = None,
+                           timeout: Optional[float] = None) -> Iterator[Solution]:
+        """分块求解拼图，得到一个解决方案
+
+        参数含义与 PuzzleSolver.find_all_solutions 相同，但最多只产生一个解。
+        分块拼接无法保存断点，也不经过置换表，指定 checkpoint、resume_from 或 transposition 时
+        直接使用 PuzzleSolver 的完整求解；greedy 只作用于退回的完整求解。
+
+        Returns:
+            Iterator[List[Tuple[int, int, int, int]]]: 解决方案生成器
+        """
+        if checkpoint is not None or resume_from is not None or transposition is not None:
+            yield from super().find_all_solutions(1, greedy, checkpoint, resume_from,
+                                                  checkpoint_interval, transposition, timeout)
+            return
+        if max_solutions <= 0 or self.precheck() is not None:
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if len(self.tiles()) > 1:
+            solution = self._assemble()
+            if solution is not None:
+                yield solution
+                return
+        if deadline is not None:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                raise TimeoutError("求解超时")
+        yield from super().find_all_solutions(max_solutions=1, greedy=greedy, timeout=timeout)
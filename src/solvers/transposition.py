@@ -0,0 +1,85 @@
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+import random
+
+MASK64 = (1 << 64) - 1
+
+
+class TranspositionTable:
+    """记录已经搜索完毕的子问题及其解数量的有界缓存
+
+    行优先的回溯搜索中，从第k个位置往后的搜索只取决于三件事: 位置k、
+    已放置区域的下边界(每列最下面一个拼图片的下边缘值以及左侧邻居的右边缘值)
+    和尚未使用的拼图片。拼图片按类型(角落/边缘/内部以及旋转无关的边缘值)计入多重集合，
+    边缘值完全相同的拼图片可以互换，因此解数量也相同。
+
+    子问题的键是 Zobrist 风格的64位哈希: 边界上每个 (列, 边缘值) 对应一个随机数，按异或累加；
+    剩余拼图片的每种类型对应一个随机数，按加法累加(多重集合中重复的类型不会相互抵消)。
+    键可以在放置和撤销时增量更新。64位哈希冲突的概率可以忽略，但并非为零。
+
+    容量满时淘汰最久未使用的条目(LRU)。
+    """
+
+    def __init__(self, capacity: int = 1 << 20, seed: int = 0):
+        """
+        Args:
+            capacity: 最多保存的子问题数量
+            seed: 生成 Zobrist 随机数的种子，同一个种子总是生成同样的键
+        """
+        if capacity <= 0:
+            raise ValueError("置换表容量必须为正数")
+        self.capacity = capacity
+        self._rng = random.Random(seed)
+        self._zobrist: Dict[Hashable, int] = {}
+        self._entries: 'OrderedDict[int, int]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def zobrist(self, *slot: Hashable) -> int:
+        """slot 对应的64位随机数，首次用到时生成"""
+        value = self._zobrist.get(slot)
+        if value is None:
+            value = self._zobrist[slot] = self._rng.getrandbits(64)
+        return value
+
+    def get(self, key: int) -> Optional[int]:
+        """查找子问题的解数量，0 表示该子问题无解(nogood)，未记录时返回None"""
+        count = self._entries.get(key)
+        if count is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return count
+
+    def store(self, key: int, count: int) -> None:
+        """记录一个已经搜索完毕的子问题的解数量"""
+        self._entries[key] = count
+        self._entries.move_to_end(key)
+        self.stores += 1
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """清空所有条目和统计信息(Zobrist 随机数保持不变)"""
+        self._entries.clear()
+        self.hits = self.misses = self.stores = self.evictions = 0
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'stores': self.stores,
+            'evictions': self.evictions,
+        }
@@ -0,0 +1,195 @@
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, cast
+from ..models.direction import Direction
+from ..models.puzzle import JigsawPuzzle
+
+try:
+    import numpy as np
+except ImportError:  # numpy 是可选依赖，缺少时使用纯Python实现
+    np = None  # type: ignore[assignment]
+
+Solution = Sequence[Tuple[int, int, int, int]]
+Edges = Tuple[int, int, int, int]
+
+# 失败原因，按检查顺序排列
+CELL = 'cell'            # 位置越界、重复或缺失
+PIECE = 'piece'          # 未知的拼图片编号或不是90倍数的旋转角度
+DUPLICATE = 'duplicate'  # 同一个拼图片被使用了多次
+BORDER = 'border'        # 朝向拼图外侧的边不是平边
+SEAM = 'seam'            # 相邻两块拼图片的边缘值之和不为0
+
+# (失败原因, 行, 列, 方向)；接缝失败的方向为 RIGHT 或 DOWN，指向接缝另一侧的拼图片，
+# 与边无关的失败方向为None
+Failure = Tuple[str, int, int, Optional[Direction]]
+
+# 每批向量化检查的解决方案数量，限制中间数组占用的内存
+CHUNK_SIZE = 1024
+
+
+def verify_solutions(puzzle: JigsawPuzzle, solutions: Iterable[Solution],
+                     chunk_size: int = CHUNK_SIZE) -> Tuple[List[bool], List[Optional[Failure]]]:
+    """批量验证解决方案，不修改拼图
+
+    与 apply_solution 逐个位置调用 place_piece 不同，这里把一批解决方案堆叠成
+    (解数量, 行, 列, 4) 的边缘值数组，用数组运算一次检查所有的位置、拼图片编号、
+    外圈平边以及每条水平和垂直接缝。安装了 numpy 时向量化执行，否则逐个检查，结果相同。
+
+    对每个无效的解决方案，按以下顺序报告第一个失败，同一类检查中按行优先顺序取第一个位置:
+    CELL(按给出的顺序取第一个越界或重复的摆放，其次是第一个缺失的位置)、PIECE、
+    DUPLICATE(第二次出现的位置)、BORDER、SEAM(同一位置先右侧后下方)。
+
+    Args:
+        puzzle: 拼图，只使用尺寸和拼图片的边缘值
+        solutions: 解决方案，每个为 (piece_id, row, col, rotation) 的序列，可以是任意可迭代对象
+        chunk_size: 每批检查的解决方案数量
+
+    Returns:
+        (valid, failures): valid[i] 表示第i个解决方案是否有效；
+        failures[i] 为其第一个失败 (原因, 行, 列, 方向)，有效时为None
+    """
+    if chunk_size <= 0:
+        raise ValueError("批大小必须为正数")
+    base = {piece.id: piece.edges_at(0) for piece in puzzle.pieces}
+    failures: List[Optional[Failure]] = []
+    iterator = iter(solutions)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            break
+        if np is not None and base:
+            failures.extend(_verify_chunk(puzzle.rows, puzzle.cols, base, chunk))
+        else:
+            failures.extend(_verify_one(puzzle.rows, puzzle.cols, base, solution) for solution in chunk)
+    return [failure is None for failure in failures], failures
+
+
+def _verify_one(rows: int, cols: int, base: Dict[int, Edges], solution: Solution) -> Optional[Failure]:
+    """纯Python实现: 验证一个解决方案，返回第一个失败"""
+    grid: List[Optional[Tuple[int, int]]] = [None] * (rows * cols)
+    for piece_id, row, col, rotation in solution:
+        if not (0 <= row < rows and 0 <= col < cols) or grid[row * cols + col] is not None:
+            return CELL, row, col, None
+        grid[row * cols + col] = (piece_id, rotation)
+    for cell, slot in enumerate(grid):
+        if slot is None:
+            return (CELL, *divmod(cell, cols), None)
+    placed = cast(List[Tuple[int, int]], grid)
+
+    rotated: List[Edges] = []
+    for cell, (piece_id, rotation) in enumerate(placed):
+        edges = base.get(piece_id)
+        if edges is None or rotation % 90 != 0:
+            return (PIECE, *divmod(cell, cols), None)
+        turns = (rotation // 90) % 4
+        rotated.append((edges[-turns % 4], edges[(1 - turns) % 4],
+                        edges[(2 - turns) % 4], edges[(3 - turns) % 4]))
+
+    seen = set()
+    for cell, (piece_id, _) in enumerate(placed):
+        if piece_id in seen:
+            return (DUPLICATE, *divmod(cell, cols), None)
+        seen.add(piece_id)
+
+    for cell, edges in enumerate(rotated):
+        row, col = divmod(cell, cols)
+        for direction, outside in ((Direction.UP, row == 0), (Direction.RIGHT, col == cols - 1),
+                                   (Direction.DOWN, row == rows - 1), (Direction.LEFT, col == 0)):
+            if outside and edges[direction.value] != 0:
+                return BORDER, row, col, direction
+
+    for cell, edges in enumerate(rotated):
+        row, col = divmod(cell, cols)
+        if col + 1 < cols and edges[1] + rotated[cell + 1][3] != 0:
+            return SEAM, row, col, Direction.RIGHT
+        if row + 1 < rows and edges[2] + rotated[cell + cols][0] != 0:
+            return SEAM, row, col, Direction.DOWN
+    return None
+
+
+def _verify_chunk(rows: int, cols: int, base: Dict[int, Edges],
+                  chunk: List[Solution]) -> List[Optional[Failure]]:
+    """numpy 实现: 向量化验证一批解决方案
+
+    摆放数量不等于位置数量的解决方案无法堆叠，交给纯Python实现。
+    """
+    size = rows * cols
+    results: List[Optional[Failure]] = [None] * len(chunk)
+    stacked = []
+    for index, solution in enumerate(chunk):
+        if len(solution) == size:
+            stacked.append(index)
+        else:
+            results[index] = _verify_one(rows, cols, base, solution)
+    if not stacked:
+        return results
+
+    data = np.asarray([chunk[index] for index in stacked], dtype=np.int64).reshape(len(stacked), size, 4)
+    piece_ids, row, col, rotation = data[..., 0], data[..., 1], data[..., 2], data[..., 3]
+
+    # 位置: 越界的摆放换成互不相同的哨兵值，重复的位置在稳定排序后相邻
+    outside = (row < 0) | (row >= rows) | (col < 0) | (col >= cols)
+    cells = np.where(outside, size + np.arange(size), row * cols + col)
+    bad_cell = outside | _later_repeats(cells)
+    layout_failed = bad_cell.any(axis=1)
+    first_cell = bad_cell.argmax(axis=1)
+    for position in np.flatnonzero(layout_failed):
+        placement = first_cell[position]
+        results[stacked[position]] = (CELL, int(row[position, placement]),
+                                      int(col[position, placement]), None)
+
+    valid = np.flatnonzero(~layout_failed)
+    if not len(valid):
+        return results
+    # 按行优先顺序重排拼图片编号和旋转角度
+    count = len(valid)
+    grid_ids = np.empty((count, size), dtype=np.int64)
+    grid_rotation = np.empty((count, size), dtype=np.int64)
+    index_rows = np.arange(count)[:, None]
+    grid_ids[index_rows, cells[valid]] = piece_ids[valid]
+    grid_rotation[index_rows, cells[valid]] = rotation[valid]
+
+    known_ids = np.array(sorted(base), dtype=np.int64)
+    table = np.array([base[piece_id] for piece_id in known_ids.tolist()], dtype=np.int64)
+    lookup = np.minimum(np.searchsorted(known_ids, grid_ids), len(known_ids) - 1)
+    bad_piece = (known_ids[lookup] != grid_ids) | (grid_rotation % 90 != 0)
+    duplicate = _later_repeats(grid_ids)
+
+    # edges_at: 旋转 turns 次后方向 d 上的边是原来方向 (d - turns) % 4 上的边
+    turns = (grid_rotation // 90) % 4
+    sides = (np.arange(4) - turns[..., None]) % 4
+    edges = np.take_along_axis(table[lookup], sides, axis=2).reshape(count, rows, cols, 4)
+
+    border_grid = np.zeros((count, rows, cols, 4), dtype=bool)
+    border_grid[:, 0, :, 0] = edges[:, 0, :, 0] != 0
+    border_grid[:, :, -1, 1] = edges[:, :, -1, 1] != 0
+    border_grid[:, -1, :, 2] = edges[:, -1, :, 2] != 0
+    border_grid[:, :, 0, 3] = edges[:, :, 0, 3] != 0
+    border = border_grid.reshape(count, size * 4)
+
+    seam_grid = np.zeros((count, rows, cols, 2), dtype=bool)
+    seam_grid[:, :, :-1, 0] = edges[:, :, :-1, 1] + edges[:, :, 1:, 3] != 0
+    seam_grid[:, :-1, :, 1] = edges[:, :-1, :, 2] + edges[:, 1:, :, 0] != 0
+    seams = seam_grid.reshape(count, size * 2)
+
+    seam_directions = (Direction.RIGHT, Direction.DOWN)
+    checks = ((PIECE, bad_piece, 1, None), (DUPLICATE, duplicate, 1, None),
+              (BORDER, border, 4, tuple(Direction)), (SEAM, seams, 2, seam_directions))
+    undecided = np.ones(count, dtype=bool)
+    for reason, mask, width, directions in checks:
+        failed = undecided & mask.any(axis=1)
+        first = mask.argmax(axis=1)
+        for position in np.flatnonzero(failed):
+            cell, slot = divmod(int(first[position]), width)
+            results[stacked[valid[position]]] = (reason, *divmod(cell, cols),
+                                                 None if directions is None else directions[slot])
+        undecided &= ~failed
+    return results
+
+
+def _later_repeats(values: Any) -> Any:
+    """每行中与同一行前面某个元素相等的位置(numpy 布尔数组)"""
+    order = np.argsort(values, axis=1, kind='stable')
+    ordered = np.take_along_axis(values, order, axis=1)
+    repeats = np.zeros(values.shape, dtype=bool)
+    np.put_along_axis(repeats, order[:, 1:], ordered[:, 1:] == ordered[:, :-1], axis=1)
+    return repeats
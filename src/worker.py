@@ -0,0 +1,22 @@
+"""分布式搜索的工作节点入口
+
+用法: python -m src.worker --connect 192.168.1.10:9000
+"""
+from typing import List, Optional
+import argparse
+from .server.distributed import run_worker
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="拼图分布式搜索工作节点")
+    parser.add_argument('--connect', required=True, help="协调者地址，格式为 host:port")
+    parser.add_argument('--chunk-nodes', type=int, default=1000,
+                        help="两次检查协调者消息之间最多搜索的节点数")
+    args = parser.parse_args(argv)
+
+    host, _, port = args.connect.rpartition(':')
+    run_worker(host or '127.0.0.1', int(port), chunk_nodes=args.chunk_nodes)
+
+
+if __name__ == '__main__':
+    main()
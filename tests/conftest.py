@@ -4,6 +4,21 @@ import pytest
 from src.models.direction import Direction
 from src.models.piece import JigsawPiece
 from src.models.puzzle import JigsawPuzzle
+from src.solvers import shape_inference, verification
+
+# numpy 是可选依赖: 这些模块在安装了 numpy 时走向量化实现，否则走纯Python实现
+NUMPY_MODULES = (shape_inference, verification)
+
+
+@pytest.fixture(params=[True, False], ids=['numpy', 'python'])
+def use_numpy(request, monkeypatch):
+    """分别用 numpy 实现和纯Python实现运行测试，未安装 numpy 时跳过前者"""
+    if request.param and verification.np is None:
+        pytest.skip("未安装 numpy")
+    if not request.param:
+        for module in NUMPY_MODULES:
+            monkeypatch.setattr(module, 'np', None)
+    return request.param
 
 
 @pytest.fixture
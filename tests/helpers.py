@@ -0,0 +1,76 @@
+"""测试模块共用的拼图构造函数"""
+import random
+
+from src.generators.puzzle_generator import PuzzleGenerator
+from src.models.direction import Direction
+from src.models.piece import JigsawPiece
+from src.models.puzzle import JigsawPuzzle
+
+
+def create_puzzle(rows: int, cols: int) -> JigsawPuzzle:
+    """创建指定大小的拼图"""
+    puzzle = JigsawPuzzle(rows, cols)
+    piece_id = 1
+    
+    # 创建一个二维数组来存储边的值
+    horizontal_edges = [[i + j * cols for j in range(cols-1)] for i in range(1, rows * cols, cols)]
+    vertical_edges = [[i + rows * cols for i in range(cols)] for _ in range(rows-1)]
+    
+    for row in range(rows):
+        for col in range(cols):
+            # 确定拼图片类型
+            is_corner = (row in (0, rows-1) and col in (0, cols-1))
+            is_edge = (row in (0, rows-1) or col in (0, cols-1)) and not is_corner
+            
+            # 创建边缘值
+            edges = {
+                Direction.UP: 0 if row == 0 else -vertical_edges[row-1][col],
+                Direction.RIGHT: 0 if col == cols-1 else horizontal_edges[row][col],
+                Direction.DOWN: 0 if row == rows-1 else vertical_edges[row][col],
+                Direction.LEFT: 0 if col == 0 else -horizontal_edges[row][col-1]
+            }
+            
+            piece = JigsawPiece(piece_id, edges, is_corner=is_corner, is_edge=is_edge)
+            puzzle.add_piece(piece)
+            piece_id += 1
+    
+    return puzzle
+
+
+def generated_puzzle(rows: int, cols: int, edge_types: int, seed: int) -> JigsawPuzzle:
+    random.seed(seed)
+    puzzle = JigsawPuzzle(rows, cols)
+    for piece in PuzzleGenerator().generate_solvable_puzzle(rows, cols, edge_types):
+        puzzle.add_piece(piece)
+    puzzle.shuffle()
+    return puzzle
+
+
+def unsolvable_puzzle(rows, cols):
+    """交换两个内部片的边缘值: 边缘值统计不变(能通过预检查)，但拼图无解或很难求解"""
+    puzzle = generated_puzzle(rows, cols, 2, 0)
+    first, second = [p for p in puzzle.pieces if not p.is_corner and not p.is_edge][:2]
+    first._edges[Direction.UP], second._edges[Direction.LEFT] = \
+        second._edges[Direction.LEFT], first._edges[Direction.UP]
+    return puzzle
+
+
+def unique_seam_puzzle(rows: int, cols: int, seed: int = 0) -> JigsawPuzzle:
+    """创建所有接缝值互不相同的拼图，并随机打乱顺序和旋转"""
+    random.seed(seed)
+    values = iter(random.sample(range(1, 10 * rows * cols), 2 * rows * cols))
+    right = [[next(values) * random.choice((1, -1)) for _ in range(cols)] for _ in range(rows)]
+    down = [[next(values) * random.choice((1, -1)) for _ in range(cols)] for _ in range(rows)]
+    puzzle = JigsawPuzzle(rows, cols)
+    for row in range(rows):
+        for col in range(cols):
+            is_corner = row in (0, rows - 1) and col in (0, cols - 1)
+            is_edge = row in (0, rows - 1) or col in (0, cols - 1)
+            puzzle.add_piece(JigsawPiece(row * cols + col, {
+                Direction.UP: 0 if row == 0 else -down[row - 1][col],
+                Direction.RIGHT: 0 if col == cols - 1 else right[row][col],
+                Direction.DOWN: 0 if row == rows - 1 else down[row][col],
+                Direction.LEFT: 0 if col == 0 else -right[row][col - 1],
+            }, is_corner=is_corner, is_edge=is_edge))
+    puzzle.shuffle()
+    return puzzle
@@ -0,0 +1,99 @@
+import math
+import random
+import pytest
+from src.models.direction import Direction
+from src.models.piece import JigsawPiece
+from src.models.puzzle import JigsawPuzzle
+from src.solvers.beam_search import (
+    BeamSearchAssembler, absolute_cost, exact_cost, solution_cost, squared_cost, within
+)
+from src.solvers.puzzle_solver import PuzzleSolver
+from tests.helpers import generated_puzzle
+
+
+def _noisy_puzzle(rows: int, cols: int, noise: int = 2, seed: int = 0,
+                  noisy_border: bool = False) -> JigsawPuzzle:
+    """接缝值互不相同(间隔10)的拼图，每条内部边的边缘值再加上 [-noise, noise] 的扫描误差
+
+    noisy_border 为真时外边缘的平边也带有扫描误差
+    """
+    rng = random.Random(seed)
+    values = iter(rng.sample(range(1, 5 * rows * cols), 2 * rows * cols))
+    right = [[next(values) * 10 * rng.choice((1, -1)) for _ in range(cols)] for _ in range(rows)]
+    down = [[next(values) * 10 * rng.choice((1, -1)) for _ in range(cols)] for _ in range(rows)]
+
+    def scan(value: int) -> int:
+        return value + rng.randint(-noise, noise) if value or noisy_border else 0
+
+    puzzle = JigsawPuzzle(rows, cols)
+    for row in range(rows):
+        for col in range(cols):
+            is_corner = row in (0, rows - 1) and col in (0, cols - 1)
+            is_edge = row in (0, rows - 1) or col in (0, cols - 1)
+            piece = JigsawPiece(row * cols + col, {
+                Direction.UP: scan(0 if row == 0 else -down[row - 1][col]),
+                Direction.RIGHT: scan(0 if col == cols - 1 else right[row][col]),
+                Direction.DOWN: scan(0 if row == rows - 1 else down[row][col]),
+                Direction.LEFT: scan(0 if col == 0 else -right[row][col - 1]),
+            }, is_corner=is_corner, is_edge=is_edge)
+            piece.rotate(rng.choice((0, 90, 180, 270)))
+            puzzle.add_piece(piece)
+    rng.shuffle(puzzle.pieces)
+    return puzzle
+
+
+def _truth(rows, cols):
+    return [(row * cols + col, row, col, 0) for row in range(rows) for col in range(cols)]
+
+
+def test_cost_functions():
+    assert exact_cost(3, -3) == 0 and exact_cost(3, -2) == math.inf
+    assert absolute_cost(3, -1) == 2 and squared_cost(3, -1) == 4
+    bounded = within(1)
+    assert bounded(3, -2) == 1 and bounded(3, -1) == math.inf
+    a = JigsawPiece(0, {Direction.UP: 0, Direction.RIGHT: 5, Direction.DOWN: 0, Direction.LEFT: 0})
+    b = JigsawPiece(1, {Direction.UP: 0, Direction.RIGHT: 0, Direction.DOWN: 0, Direction.LEFT: -4})
+    assert a.match_cost(b, Direction.RIGHT) == math.inf
+    assert a.match_cost(b, Direction.RIGHT, absolute_cost) == 1
+
+
+@pytest.mark.parametrize("rows,cols", [(3, 3), (3, 5), (5, 5)])
+def test_recovers_noisy_puzzle(rows, cols):
+    """测试精确搜索无解的噪声拼图可以按代价拼装回原来的排列"""
+    puzzle = _noisy_puzzle(rows, cols, seed=rows * cols)
+    solver = PuzzleSolver(puzzle)
+    assert next(solver.find_all_solutions(max_solutions=1, greedy=False), None) is None
+    (cost, solution), = solver.assemble_by_cost(beam_width=16)
+    assert cost == solution_cost(puzzle, solution) <= solution_cost(puzzle, _truth(rows, cols))
+    assert sorted(piece_id for piece_id, _, _, _ in solution) == list(range(rows * cols))
+
+
+def test_noisy_border():
+    """测试外边缘的平边带有误差时按代价计入，而不是把所有候选都剪掉"""
+    puzzle = _noisy_puzzle(4, 4, seed=3, noisy_border=True)
+    # 有的角落片两条平边都不为0，严格要求平边时它放不进任何角落
+    assert any(0 not in piece.edges_at(0) for piece in puzzle.pieces if piece.is_corner)
+    (cost, solution), = PuzzleSolver(puzzle).assemble_by_cost(beam_width=16)
+    assert cost == solution_cost(puzzle, solution) <= solution_cost(puzzle, _truth(4, 4))
+    assert sorted(piece_id for piece_id, _, _, _ in solution) == list(range(16))
+
+
+def test_exact_cost_matches_search():
+    """测试精确代价加足够宽的束时，零代价拼装就是回溯搜索的全部解"""
+    solver = PuzzleSolver(generated_puzzle(3, 3, 1, 0))
+    expected = sorted(solver.find_all_solutions(max_solutions=10**6, greedy=False))
+    results = solver.assemble_by_cost('exact', beam_width=10**4, top=100)
+    assert [cost for cost, _ in results] == [0.0] * len(expected)
+    assert sorted(solution for _, solution in results) == expected
+
+
+def test_timeout_widens_beam():
+    puzzle = _noisy_puzzle(4, 4, noise=4, seed=1)
+    assembler = BeamSearchAssembler(PuzzleSolver(puzzle), squared_cost, beam_width=1)
+    results = assembler.assemble(top=3, timeout=0.5)
+    assert assembler.stats['passes'] >= 2 and assembler.stats['beam_width'] >= 2
+    assert [cost for cost, _ in results] == sorted(cost for cost, _ in results)
+    with pytest.raises(ValueError):
+        BeamSearchAssembler(PuzzleSolver(puzzle), 'unknown')
+    with pytest.raises(TimeoutError):
+        BeamSearchAssembler(PuzzleSolver(puzzle), beam_width=1000).assemble(timeout=0)
@@ -0,0 +1,98 @@
+import json
+import shutil
+import pytest
+from src.solvers.puzzle_solver import PuzzleSolver
+from src.solvers.search_state import SearchState
+from tests.helpers import generated_puzzle
+
+
+@pytest.fixture
+def solver():
+    return PuzzleSolver(generated_puzzle(3, 4, 1, 0))
+
+
+@pytest.fixture
+def expected(solver):
+    return list(solver.find_all_solutions(max_solutions=10**6, greedy=False))
+
+
+def test_stop_and_resume(solver, expected, tmp_path):
+    """测试在任意位置停止后恢复，解不重不漏且顺序不变"""
+    path = str(tmp_path / "search.ckpt")
+    for stop in (1, 7, len(expected) // 2):
+        first = solver.find_all_solutions(max_solutions=10**6, checkpoint=path)
+        head = [next(first) for _ in range(stop)]
+        first.close()
+        rest = list(solver.find_all_solutions(max_solutions=10**6, resume_from=path))
+        assert head + rest == expected
+        # 搜索结束后的断点不再产生任何解
+        assert list(solver.find_all_solutions(max_solutions=10**6, resume_from=path)) == []
+        (tmp_path / "search.ckpt").unlink()
+
+
+def test_periodic_snapshots(solver, expected, tmp_path):
+    """测试运行中途写入的每个断点都能精确恢复(模拟进程被强制终止)"""
+    path = tmp_path / "search.ckpt"
+    snapshots = []
+    for i, _ in enumerate(solver.find_all_solutions(max_solutions=10**6, checkpoint=str(path),
+                                                    checkpoint_interval=0)):
+        if i % 10 == 3:
+            copy = tmp_path / f"snapshot{i}.ckpt"
+            shutil.copy(path, copy)
+            snapshots.append(copy)
+    assert snapshots
+    for copy in snapshots:
+        emitted = json.loads(copy.read_text())['emitted']
+        resumed = list(solver.find_all_solutions(max_solutions=10**6, resume_from=str(copy)))
+        assert resumed == expected[emitted:]
+
+
+def _kill_copy(path, copy):
+    """复制断点文件和游标文件，模拟进程在此刻被强制终止"""
+    shutil.copy(path, copy)
+    shutil.copy(f"{path}.cursor", f"{copy}.cursor")
+
+
+def test_no_duplicates_after_kill(solver, expected, tmp_path):
+    """测试两次写入断点之间被强制终止: 断点不随每个解重写，恢复后跳过游标记录的已交出的解"""
+    path = tmp_path / "search.ckpt"
+    killed = tmp_path / "killed.ckpt"
+    again = tmp_path / "again.ckpt"
+    for i, _ in enumerate(solver.find_all_solutions(max_solutions=10**6, checkpoint=str(path))):
+        if i % 10 == 5 and i + 4 <= len(expected):
+            assert json.loads(path.read_text())['emitted'] == 0
+            _kill_copy(path, killed)
+            resumed = solver.find_all_solutions(max_solutions=10**6, resume_from=str(killed))
+            head = [next(resumed) for _ in range(3)]
+            # 恢复后的运行也可能在跳过阶段之后再次被终止
+            _kill_copy(killed, again)
+            resumed.close()
+            assert head == expected[i + 1:i + 4]
+            assert list(solver.find_all_solutions(max_solutions=10**6, resume_from=str(again))) == \
+                expected[i + 4:]
+
+
+def test_max_solutions_counts_across_runs(solver, expected, tmp_path):
+    path = str(tmp_path / "search.ckpt")
+    assert list(solver.find_all_solutions(max_solutions=5, checkpoint=path)) == expected[:5]
+    assert list(solver.find_all_solutions(max_solutions=12, resume_from=path)) == expected[5:12]
+
+
+def test_missing_file_starts_fresh(solver, expected, tmp_path):
+    path = str(tmp_path / "missing.ckpt")
+    assert list(solver.find_all_solutions(max_solutions=10**6, resume_from=path)) == expected
+
+
+def test_other_puzzle_rejected(solver, tmp_path):
+    path = str(tmp_path / "search.ckpt")
+    list(solver.find_all_solutions(max_solutions=3, checkpoint=path))
+    other = PuzzleSolver(generated_puzzle(3, 4, 1, 1))
+    with pytest.raises(ValueError):
+        list(other.find_all_solutions(resume_from=path))
+
+
+def test_state_round_trip(solver, expected):
+    state = SearchState(solver)
+    head = list(state.search(max_nodes=25))
+    restored = SearchState.from_dict(solver, json.loads(json.dumps(state.to_dict())))
+    assert head + list(restored.search()) == expected
@@ -0,0 +1,69 @@
+import io
+import json
+import pytest
+from src.cli import main, solve_stream
+from src.serialization.puzzle_codec import encode_puzzle, puzzle_to_dict
+from src.solvers.puzzle_solver import PuzzleSolver
+from tests.helpers import generated_puzzle, unsolvable_puzzle
+
+
+def _puzzles(count):
+    return [generated_puzzle(3, 3 + i % 3, 2, i) for i in range(count)]
+
+
+def _jsonl(puzzles):
+    return ''.join(json.dumps(puzzle_to_dict(p)) + '\n' for p in puzzles).encode('utf-8')
+
+
+def _records(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_input_order(jobs):
+    puzzles = _puzzles(6)
+    out = io.StringIO()
+    stats = solve_stream(io.BytesIO(_jsonl(puzzles)), out, jobs=jobs, max_solutions=3)
+    records = _records(out.getvalue())
+    order = [record['puzzle'] for record in records]
+    assert order == sorted(order)
+    for index, puzzle in enumerate(puzzles):
+        expected = [[list(p) for p in s]
+                    for s in PuzzleSolver(puzzle).find_all_solutions(max_solutions=3)]
+        assert [r['solution'] for r in records if r['puzzle'] == index and 'solution' in r] == expected
+    assert stats['puzzles'] == 6
+    assert stats['solutions'] == sum(1 for r in records if 'solution' in r)
+
+
+def test_completion_order_binary_input():
+    puzzles = _puzzles(5)
+    data = b''.join(encode_puzzle(p) for p in puzzles)
+    out = io.StringIO()
+    solve_stream(io.BytesIO(data), out, jobs=2, ordered=False, max_solutions=1)
+    done = [r for r in _records(out.getvalue()) if r.get('done')]
+    assert sorted(r['puzzle'] for r in done) == list(range(5))
+    assert all(r['count'] == 1 for r in done)
+
+
+def test_invalid_lines_and_timeout():
+    """测试无效的行和超时的拼图都单独报告，不影响其他拼图"""
+    data = _jsonl(_puzzles(1)) + b'not json\n\n' + _jsonl([unsolvable_puzzle(8, 8)])
+    out = io.StringIO()
+    stats = solve_stream(io.BytesIO(data), out, timeout=0.05)
+    done = [r for r in _records(out.getvalue()) if r.get('done')]
+    assert [r['puzzle'] for r in done] == [0, 1, 2]
+    assert done[0]['count'] > 0 and done[0]['error'] is None
+    assert '无效的拼图数据' in done[1]['error']
+    assert done[2]['timed_out']
+    assert (stats['errors'], stats['timed_out']) == (1, 1)
+
+
+def test_main(tmp_path, capsys):
+    path = tmp_path / 'puzzles.jsonl'
+    path.write_bytes(_jsonl(_puzzles(2)))
+    assert main(['solve', str(path), '--max-solutions', '1', '--stats']) == 0
+    captured = capsys.readouterr()
+    assert len(_records(captured.out)) == 4
+    assert json.loads(captured.err)['puzzles'] == 2
+    with pytest.raises(SystemExit):
+        main(['solve', str(path), '--order', 'random'])
@@ -0,0 +1,81 @@
+from src.solvers import cost_estimator
+from src.solvers.cost_estimator import SearchCostEstimator
+from src.solvers.puzzle_solver import PuzzleSolver
+from src.solvers.search_state import SearchState
+from tests.helpers import generated_puzzle, unique_seam_puzzle
+
+
+def test_estimate_close_to_actual():
+    """测试估计的解数量接近实际值，置信区间包含估计值"""
+    solver = PuzzleSolver(generated_puzzle(4, 4, 2, 0))
+    actual = len(list(solver.find_all_solutions(max_solutions=10**6, greedy=False)))
+    result = solver.estimate_cost(time_budget=10, max_probes=5000, seed=1)
+    assert result['probes'] == 5000
+    assert abs(result['solutions'] - actual) < 0.3 * actual
+    assert result['nodes_low'] <= result['nodes'] <= result['nodes_high']
+    assert result['distinct_edge_values'] == 2
+    assert 1 < result['mean_candidates'] <= result['max_candidates']
+
+
+def test_unique_seams_have_little_branching():
+    """测试接缝值唯一时只有左上角有多个候选(四个角落片)，其后的搜索树都是单链"""
+    result = PuzzleSolver(unique_seam_puzzle(6, 6)).estimate_cost(max_probes=200, seed=0)
+    assert result['max_candidates'] == 4
+    assert result['nodes'] <= 1 + 4 * 36
+    assert result['mean_candidates'] < 1.2
+
+
+class _StepClock:
+    """每次读取前进固定步长的时钟，使按时间预算停止的探测次数与机器速度无关"""
+
+    def __init__(self, step: float):
+        self.now = 0.0
+        self.step = step
+
+    def perf_counter(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+def test_time_budget(monkeypatch):
+    """测试预算用完后停止探测，预算为0时仍至少探测一次"""
+    monkeypatch.setattr(cost_estimator, 'time', _StepClock(0.01))
+    solver = PuzzleSolver(generated_puzzle(8, 8, 2, 1))
+    assert solver.estimate_cost(time_budget=0.045)['probes'] == 5
+    assert solver.estimate_cost(time_budget=0)['probes'] == 1
+
+
+def test_infeasible():
+    puzzle = generated_puzzle(3, 3, 2, 2)
+    puzzle.pieces.pop()
+    result = PuzzleSolver(puzzle).estimate_cost()
+    assert result['nodes'] == 0
+    assert '少于位置数量' in result['infeasible']
+    # 与正常的估计结果键相同，调用方不需要特殊处理
+    feasible = PuzzleSolver(generated_puzzle(3, 3, 2, 2)).estimate_cost(max_probes=1)
+    assert feasible['infeasible'] is None
+    assert set(result) == set(feasible)
+
+
+def test_population_estimate():
+    """测试多条路径重采样的估计在解很多的拼图上接近实际值，且可以复现"""
+    solver = PuzzleSolver(generated_puzzle(3, 5, 1, 2))
+    state = SearchState(solver)
+    actual = len(list(state.search()))
+    estimator = SearchCostEstimator(solver)
+    runs = [estimator.population_estimate(particles=64, seed=seed) for seed in range(20)]
+    mean_solutions = sum(run['solutions'] for run in runs) / len(runs)
+    mean_nodes = sum(run['nodes'] for run in runs) / len(runs)
+    assert abs(mean_solutions - actual) < 0.3 * actual
+    assert abs(mean_nodes - state.nodes) < 0.2 * state.nodes
+    assert estimator.population_estimate(particles=64, seed=3) == runs[3]
+
+
+def test_population_estimate_from_prefix():
+    """测试从前缀开始估计: 完整的解作为前缀时解数量为1"""
+    solver = PuzzleSolver(generated_puzzle(3, 3, 1, 0))
+    solution = next(solver.find_all_solutions(max_solutions=1, greedy=False))
+    estimator = SearchCostEstimator(solver)
+    assert estimator.population_estimate(8, seed=0, prefix=solution)['solutions'] == 1
+    partial = estimator.population_estimate(8, seed=0, prefix=solution[:4])
+    assert partial['solutions'] > 0
@@ -0,0 +1,81 @@
+import multiprocessing
+import pytest
+from src.server.distributed import Coordinator, run_worker
+from src.solvers.puzzle_solver import PuzzleSolver
+from tests.helpers import generated_puzzle
+
+
+@pytest.fixture(scope="module")
+def coordinator():
+    """协调者和三个本机工作进程"""
+    coordinator = Coordinator()
+    host, port = coordinator.address
+    workers = [multiprocessing.Process(target=run_worker, args=(host, port, 50), daemon=True)
+               for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    assert coordinator.wait_for_workers(3, timeout=30)
+    yield coordinator
+    coordinator.close()
+    for worker in workers:
+        worker.join(timeout=5)
+
+
+def test_all_solutions_with_work_stealing(coordinator):
+    """测试分布式搜索得到的解与单机搜索完全相同，且发生了工作窃取"""
+    puzzle = generated_puzzle(4, 5, 2, 3)
+    expected = list(PuzzleSolver(puzzle).find_all_solutions(max_solutions=10**6, greedy=False))
+    actual = list(coordinator.find_all_solutions(puzzle, max_solutions=10**6, timeout=60))
+    assert len(actual) == len(expected)
+    assert set(map(tuple, actual)) == set(map(tuple, expected))
+    assert coordinator.stats['work_items'] > 1
+    assert coordinator.stats['workers'] == 3
+    assert sum(w['solutions'] for w in coordinator.stats['per_worker']) == len(expected)
+
+
+def test_limit_then_reuse(coordinator):
+    """测试提前结束后协调者和工作节点可以继续求解下一个拼图"""
+    puzzle = generated_puzzle(4, 4, 1, 4)
+    assert len(list(coordinator.find_all_solutions(puzzle, max_solutions=5, timeout=60))) == 5
+    small = generated_puzzle(3, 3, 2, 5)
+    expected = list(PuzzleSolver(small).find_all_solutions(max_solutions=10**6, greedy=False))
+    actual = list(coordinator.find_all_solutions(small, max_solutions=10**6, timeout=60))
+    assert sorted(actual) == sorted(expected)
+
+
+def test_infeasible_puzzle(coordinator):
+    puzzle = generated_puzzle(3, 3, 2, 6)
+    puzzle.pieces.pop()
+    assert list(coordinator.find_all_solutions(puzzle)) == []
+
+
+def test_worker_killed_mid_job():
+    """测试工作节点在搜索途中被杀死后，它的子树交给其他节点，解不重不漏"""
+    puzzle = generated_puzzle(4, 4, 1, 0)
+    expected = list(PuzzleSolver(puzzle).find_all_solutions(max_solutions=10**6, greedy=False))
+    with Coordinator() as coordinator:
+        host, port = coordinator.address
+
+        def start(count):
+            workers = [multiprocessing.Process(target=run_worker, args=(host, port, 50), daemon=True)
+                       for _ in range(count)]
+            for worker in workers:
+                worker.start()
+            return workers
+
+        workers = start(2)
+        assert coordinator.wait_for_workers(2, timeout=30)
+        actual = []
+        for solution in coordinator.find_all_solutions(puzzle, max_solutions=10**6, timeout=60):
+            actual.append(solution)
+            if len(actual) == 100:
+                # 两个节点都在搜索中途被杀死，之后连接的节点接手它们的子树
+                for worker in workers:
+                    worker.kill()
+                    worker.join()
+                workers = start(1)
+        assert len(actual) == len(expected)
+        assert set(map(tuple, actual)) == set(map(tuple, expected))
+        assert coordinator.stats['requeued'] >= 1
+    for worker in workers:
+        worker.join(timeout=5)
@@ -0,0 +1,84 @@
+import inspect
+import sys
+import pytest
+from src.solvers.dlx_solver import DancingLinksSolver
+from src.solvers.puzzle_solver import PuzzleSolver
+from src.solvers.transposition import TranspositionTable
+from tests.helpers import generated_puzzle
+
+
+def _solution_set(solutions):
+    return {tuple(solution) for solution in solutions}
+
+
+@pytest.mark.parametrize("rows,cols,edge_types,seed", [
+    (2, 2, 1, 0), (3, 3, 1, 1), (3, 4, 2, 2), (4, 4, 2, 3), (2, 5, 2, 4),
+])
+def test_same_solutions_as_dfs(rows, cols, edge_types, seed):
+    """测试与回溯搜索得到完全相同的解集合"""
+    puzzle = generated_puzzle(rows, cols, edge_types, seed)
+    expected = list(PuzzleSolver(puzzle).find_all_solutions(max_solutions=10**6))
+    actual = list(DancingLinksSolver(puzzle).find_all_solutions(max_solutions=10**6))
+    assert len(actual) == len(expected)
+    assert _solution_set(actual) == _solution_set(expected)
+
+
+def test_solution_format(simple_2x2_puzzle):
+    """测试解的格式与 PuzzleSolver 一致"""
+    solver = DancingLinksSolver(simple_2x2_puzzle)
+    solution = next(solver.find_all_solutions(max_solutions=1))
+    assert [(row, col) for _, row, col, _ in solution] == [(0, 0), (0, 1), (1, 0), (1, 1)]
+    assert solver.apply_solution(solution)
+    assert simple_2x2_puzzle.is_complete()
+
+
+def test_limit_and_reuse():
+    """测试提前结束后求解器仍可再次使用"""
+    solver = DancingLinksSolver(generated_puzzle(3, 3, 1, 5))
+    total = len(list(solver.find_all_solutions(max_solutions=10**6)))
+    assert total > 2
+    assert len(list(solver.find_all_solutions(max_solutions=2))) == 2
+    assert len(list(solver.find_all_solutions(max_solutions=10**6))) == total
+
+
+def test_reuse_after_close():
+    """测试调用方提前关闭生成器后链表已恢复"""
+    solver = DancingLinksSolver(generated_puzzle(3, 3, 1, 5))
+    solutions = solver.find_all_solutions(max_solutions=10**6)
+    next(solutions)
+    solutions.close()
+    assert len(list(solver.find_all_solutions(max_solutions=10**6))) == 16
+
+
+def test_deep_search_without_recursion():
+    """测试搜索深度不受递归深度限制: 在只剩很少递归余量时求解64个位置的拼图"""
+    solver = DancingLinksSolver(generated_puzzle(8, 8, 200, 1))
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(len(inspect.stack(0)) + 30)
+    try:
+        solution = next(solver.find_all_solutions(max_solutions=1))
+    finally:
+        sys.setrecursionlimit(limit)
+    assert solver.apply_solution(solution)
+
+
+def test_unsolvable():
+    """测试无解的拼图"""
+    puzzle = generated_puzzle(3, 3, 5, 6)
+    puzzle.pieces.pop()
+    assert list(DancingLinksSolver(puzzle).find_all_solutions()) == []
+
+
+def test_base_keywords(tmp_path):
+    """测试接受 PuzzleSolver 的关键字参数，超时后链表已恢复"""
+    solver = DancingLinksSolver(generated_puzzle(3, 4, 1, 0))
+    assert len(list(solver.find_all_solutions(max_solutions=10**6, timeout=10, greedy=False))) == 88
+    assert len(list(solver.find_all_solutions(max_solutions=10**6,
+                                              transposition=TranspositionTable()))) == 88
+    path = str(tmp_path / "search.ckpt")
+    assert len(list(solver.find_all_solutions(max_solutions=5, checkpoint=path))) == 5
+    assert len(list(solver.find_all_solutions(max_solutions=10**6, resume_from=path))) == 83
+    slow = DancingLinksSolver(generated_puzzle(4, 5, 1, 2))
+    with pytest.raises(TimeoutError):
+        list(slow.find_all_solutions(max_solutions=10**8, timeout=0.2))
+    assert len(list(slow.find_all_solutions(max_solutions=3))) == 3
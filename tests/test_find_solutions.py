@@ -4,36 +4,7 @@ from src.models.direction import Direction
 from src.models.piece import JigsawPiece
 from src.models.puzzle import JigsawPuzzle
 from src.solvers.puzzle_solver import PuzzleSolver
-
-
-def create_puzzle(rows: int, cols: int) -> JigsawPuzzle:
-    """创建指定大小的拼图"""
-    puzzle = JigsawPuzzle(rows, cols)
-    piece_id = 1
-    
-    # 创建一个二维数组来存储边的值
-    horizontal_edges = [[i + j * cols for j in range(cols-1)] for i in range(1, rows * cols, cols)]
-    vertical_edges = [[i + rows * cols for i in range(cols)] for _ in range(rows-1)]
-    
-    for row in range(rows):
-        for col in range(cols):
-            # 确定拼图片类型
-            is_corner = (row in (0, rows-1) and col in (0, cols-1))
-            is_edge = (row in (0, rows-1) or col in (0, cols-1)) and not is_corner
-            
-            # 创建边缘值
-            edges = {
-                Direction.UP: 0 if row == 0 else -vertical_edges[row-1][col],
-                Direction.RIGHT: 0 if col == cols-1 else horizontal_edges[row][col],
-                Direction.DOWN: 0 if row == rows-1 else vertical_edges[row][col],
-                Direction.LEFT: 0 if col == 0 else -horizontal_edges[row][col-1]
-            }
-            
-            piece = JigsawPiece(piece_id, edges, is_corner=is_corner, is_edge=is_edge)
-            puzzle.add_piece(piece)
-            piece_id += 1
-    
-    return puzzle
+from tests.helpers import create_puzzle
 
 
 @pytest.fixture(params=[(1, 2), (2, 1), (2, 2), (2, 3), (3, 2), (3, 3), (3, 4), (4, 4)])
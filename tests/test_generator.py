@@ -1,6 +1,13 @@
+import io
+import random
+import tracemalloc
 import pytest
 from src.models.direction import Direction
 from src.generators.puzzle_generator import PuzzleGenerator
+from src.models.puzzle import JigsawPuzzle
+from src.serialization.puzzle_codec import decode_puzzle
+from src.solvers.puzzle_solver import PuzzleSolver
+from src.solvers.search_state import SearchState
 
 def test_generate_edge_values():
     """测试边缘值生成"""
@@ -57,4 +64,109 @@ def test_generate_solvable_puzzle():
                 assert piece.matches(left_piece, Direction.LEFT)
             if row > 0:  # 检查上边的片
                 up_piece = pieces[(row - 1) * 2 + col]
-                assert piece.matches(up_piece, Direction.UP) 
\ No newline at end of file
+                assert piece.matches(up_piece, Direction.UP) 
+
+def _as_puzzle(rows, cols, pieces):
+    puzzle = JigsawPuzzle(rows, cols)
+    for piece in pieces:
+        puzzle.add_piece(piece)
+    return puzzle
+
+
+def test_generate_with_difficulty_is_solvable():
+    """测试按难度生成的拼图按生成顺序摆放即是一个解"""
+    generator = PuzzleGenerator()
+    pieces, _ = generator.generate_with_difficulty(5, 4, target_nodes=1000, seed=0)
+    puzzle = _as_puzzle(5, 4, pieces)
+    solution = [(piece.id, i // 4, i % 4, 0) for i, piece in enumerate(pieces)]
+    assert PuzzleSolver(puzzle).apply_solution(solution)
+    assert puzzle.is_complete()
+    again, _ = generator.generate_with_difficulty(5, 4, target_nodes=1000, seed=0)
+    assert again[7].edges_at(0) == pieces[7].edges_at(0)
+
+
+@pytest.mark.parametrize("target", [1.2, 1.6])
+def test_target_candidates(target):
+    _, estimate = PuzzleGenerator().generate_with_difficulty(8, 8, target_candidates=target, seed=1)
+    assert abs(estimate['mean_candidates'] - target) <= 0.25 * target
+
+
+def test_target_nodes_tracks_actual_search():
+    """测试目标节点数越大，实际回溯搜索的节点数越大"""
+    generator = PuzzleGenerator()
+    nodes = []
+    for target in (100, 10000):
+        pieces, estimate = generator.generate_with_difficulty(5, 5, target_nodes=target, seed=2)
+        assert 0 < estimate['ambiguity'] < 1
+        state = SearchState(PuzzleSolver(_as_puzzle(5, 5, pieces)))
+        list(state.search())
+        nodes.append(state.nodes)
+    assert nodes[0] * 10 < nodes[1]
+
+
+def test_target_solutions():
+    generator = PuzzleGenerator()
+    pieces, _ = generator.generate_with_difficulty(4, 4, target_solutions=8, edge_types=1, seed=1)
+    assert PuzzleSolver(_as_puzzle(4, 4, pieces)).count_solutions() == 8
+
+
+def test_generate_with_difficulty_arguments():
+    generator = PuzzleGenerator()
+    with pytest.raises(ValueError):
+        generator.generate_with_difficulty(4, 4)
+    with pytest.raises(ValueError):
+        generator.generate_with_difficulty(4, 4, target_nodes=10, target_solutions=2)
+    with pytest.raises(ValueError):
+        generator.generate_with_difficulty(1, 4, target_nodes=10)
+
+
+def test_iter_pieces_matches_generate():
+    """测试流式生成与 generate_solvable_puzzle 在同一个随机数种子下结果相同"""
+    generator = PuzzleGenerator()
+    random.seed(3)
+    expected = generator.generate_solvable_puzzle(4, 5, 2)
+    random.seed(3)
+    streamed = list(generator.iter_pieces(4, 5, 2))
+    random.seed(3)
+    rows = list(generator.iter_rows(4, 5, 2))
+    assert [(p.id, p.edges_at(0), p.is_corner, p.is_edge) for p in streamed] == \
+           [(p.id, p.edges_at(0), p.is_corner, p.is_edge) for p in expected]
+    assert [edges for row in rows for edges in row] == [p.edges_at(0) for p in expected]
+    assert PuzzleSolver(_as_puzzle(4, 5, streamed)).apply_solution(
+        [(p.id, i // 5, i % 5, 0) for i, p in enumerate(streamed)])
+    with pytest.raises(ValueError):
+        next(generator.iter_rows(1, 5))
+
+
+def test_write_binary_round_trip():
+    generator = PuzzleGenerator()
+    random.seed(4)
+    stream = io.BytesIO()
+    assert generator.write_binary(stream, 3, 4, 2) == 12
+    random.seed(4)
+    expected = generator.generate_solvable_puzzle(3, 4, 2)
+    puzzle = decode_puzzle(stream.getvalue())
+    assert (puzzle.rows, puzzle.cols) == (3, 4)
+    assert [(p.id, p.edges_at(0), p.is_corner, p.is_edge) for p in puzzle.pieces] == \
+           [(p.id, p.edges_at(0), p.is_corner, p.is_edge) for p in expected]
+
+
+def test_write_binary_rejects_small_size():
+    """测试尺寸无效时不写入任何数据"""
+    stream = io.BytesIO()
+    with pytest.raises(ValueError):
+        PuzzleGenerator().write_binary(stream, 1, 5)
+    assert stream.getvalue() == b''
+
+
+def test_iter_rows_bounded_memory():
+    """测试流式生成的内存峰值与行数无关"""
+    def peak(rows):
+        tracemalloc.start()
+        for _ in PuzzleGenerator().iter_rows(rows, 200):
+            pass
+        result = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return result
+
+    assert peak(400) < 2 * peak(10)
@@ -0,0 +1,57 @@
+import pytest
+from src.models.direction import Direction
+from src.models.piece import JigsawPiece
+from src.solvers import puzzle_solver
+from src.solvers.puzzle_solver import PuzzleSolver
+from tests.helpers import create_puzzle, unique_seam_puzzle
+
+
+@pytest.mark.parametrize("rows,cols", [(2, 2), (2, 3), (3, 3), (3, 4), (4, 4)])
+def test_same_solutions_as_search(rows, cols):
+    """测试贪心拼接与回溯搜索得到相同的解"""
+    solver = PuzzleSolver(unique_seam_puzzle(rows, cols, seed=rows * cols))
+    expected = list(solver.find_all_solutions(max_solutions=100, greedy=False))
+    assert list(solver.find_all_solutions(max_solutions=100, greedy=True)) == expected
+    assert list(solver.find_all_solutions(max_solutions=100)) == expected
+
+
+def test_large_puzzle_without_search(monkeypatch):
+    """测试大拼图不经过回溯搜索，在线性时间内拼好: 每个起点对每个位置只检查一次匹配"""
+    def no_search(*args, **kwargs):
+        raise AssertionError("不应进行回溯搜索")
+
+    fits = []
+    check = PuzzleSolver._fits
+
+    def counting_fits(self, *args):
+        fits.append(args)
+        return check(self, *args)
+
+    monkeypatch.setattr(puzzle_solver, 'SearchState', no_search)
+    monkeypatch.setattr(PuzzleSolver, '_fits', counting_fits)
+    puzzle = unique_seam_puzzle(60, 60)
+    solver = PuzzleSolver(puzzle)
+    solutions = list(solver.find_all_solutions(max_solutions=1))
+    assert len(fits) <= 4 * 60 * 60
+    assert len(solutions) == 1
+    assert solver.apply_solution(solutions[0])
+    assert puzzle.is_complete()
+
+
+def test_ambiguous_seams_fall_back_to_search():
+    """测试接缝值重复时自动退回到回溯搜索"""
+    puzzle = create_puzzle(4, 3)
+    solver = PuzzleSolver(puzzle)
+    assert solver._assemble_greedy() is None
+    solutions = list(solver.find_all_solutions(max_solutions=10))
+    assert solutions == list(solver.find_all_solutions(max_solutions=10, greedy=False))
+    with pytest.raises(ValueError):
+        list(solver.find_all_solutions(greedy=True))
+
+
+def test_unsolvable_unique_seams():
+    """测试接缝值唯一但无解时直接返回空结果"""
+    puzzle = unique_seam_puzzle(5, 5)
+    puzzle.pieces.pop()
+    puzzle.add_piece(JigsawPiece(999, {d: 0 for d in Direction}, is_corner=True))
+    assert list(PuzzleSolver(puzzle).find_all_solutions()) == []
@@ -0,0 +1,79 @@
+import random
+import pytest
+from src.models.direction import Direction
+from src.solvers.puzzle_solver import PuzzleSolver
+from tests.helpers import generated_puzzle
+
+
+def _brute_force(solver, row, col):
+    """逐个拼图片和旋转角度检查，作为提示的参考结果"""
+    puzzle = solver.puzzle
+    result = []
+    for piece in puzzle.pieces:
+        if any(p is piece for line in puzzle.board for p in line):
+            continue
+        for rotation, edges in solver._orientations(piece, row, col):
+            fits = True
+            for dr, dc, side, facing in ((-1, 0, 0, Direction.DOWN), (0, 1, 1, Direction.LEFT),
+                                         (1, 0, 2, Direction.UP), (0, -1, 3, Direction.RIGHT)):
+                r, c = row + dr, col + dc
+                if 0 <= r < puzzle.rows and 0 <= c < puzzle.cols and puzzle.board[r][c] is not None:
+                    fits = fits and edges[side] + puzzle.board[r][c].get_edge(facing) == 0
+            if fits:
+                result.append((piece.id, rotation))
+    return sorted(result)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_matches_brute_force(seed):
+    """测试随机的部分棋盘上每个空位置的提示与逐个检查的结果相同"""
+    puzzle = generated_puzzle(4, 4, 2, seed)
+    solver = PuzzleSolver(puzzle)
+    solution = next(solver.find_all_solutions(max_solutions=1))
+    pieces = {piece.id: piece for piece in puzzle.pieces}
+    rng = random.Random(seed)
+    for piece_id, row, col, rotation in rng.sample(solution, 7):
+        pieces[piece_id].rotation = rotation
+        assert puzzle.place_piece(pieces[piece_id], row, col)
+    hints = solver.hints()
+    assert len(hints) == 16 - 7
+    for (row, col), candidates in hints.items():
+        assert sorted(candidates) == _brute_force(solver, row, col)
+    # 解中该位置的摆放一定在候选中
+    for piece_id, row, col, rotation in solution:
+        if (row, col) in hints:
+            assert (piece_id, rotation) in hints[(row, col)]
+
+
+def test_incremental_place_and_remove():
+    """测试放置和取下拼图片后提示随之更新"""
+    puzzle = generated_puzzle(3, 3, 2, 0)
+    solver = PuzzleSolver(puzzle)
+    initial = solver.hints([(0, 1), (1, 1)])
+    (piece_id, _, _, rotation), = [p for p in next(solver.find_all_solutions(max_solutions=1))
+                                   if p[1:3] == (0, 0)]
+    piece = next(p for p in puzzle.pieces if p.id == piece_id)
+    piece.rotation = rotation
+    assert puzzle.place_piece(piece, 0, 0)
+    assert puzzle.is_on_board(piece_id)
+    placed = solver.hints([(0, 0), (0, 1)])
+    assert placed[(0, 0)] == []
+    assert all(candidate[0] != piece_id for candidate in placed[(0, 1)])
+    assert len(placed[(0, 1)]) <= len(initial[(0, 1)])
+
+    assert puzzle.remove_piece(0, 0) is piece
+    assert not puzzle.is_on_board(piece_id) and piece.position is None
+    assert puzzle.remove_piece(0, 0) is None
+    assert solver.hints([(0, 1), (1, 1)]) == initial
+
+
+def test_board_reassignment_resets_index():
+    puzzle = generated_puzzle(3, 3, 2, 0)
+    solver = PuzzleSolver(puzzle)
+    initial = solver.hints()
+    assert solver.apply_solution(next(solver.find_all_solutions(max_solutions=1)))
+    assert solver.hints() == {}
+    puzzle.board = [[None] * 3 for _ in range(3)]
+    assert solver.hints() == initial
+    with pytest.raises(ValueError):
+        solver.hints([(3, 0)])
@@ -0,0 +1,61 @@
+import pytest
+from src.solvers.portfolio import PortfolioSolver
+from src.solvers.puzzle_solver import PuzzleSolver
+from src.solvers.transposition import TranspositionTable
+from tests.helpers import generated_puzzle, unique_seam_puzzle, unsolvable_puzzle
+
+
+def test_first_answer_wins():
+    puzzle = generated_puzzle(4, 5, 2, 3)
+    solver = PortfolioSolver(puzzle)
+    solutions = list(solver.find_all_solutions())
+    assert len(solutions) == 1
+    assert solver.stats['winner'] in solver.configs
+    assert solver.apply_solution(solutions[0])
+    assert puzzle.is_complete()
+
+
+def test_complete_engine_proves_unsolvable():
+    """测试完整搜索的引擎证明无解时不再等待随机重启搜索"""
+    puzzle = unsolvable_puzzle(4, 4)
+    assert PuzzleSolver(puzzle).precheck() is None
+    solver = PortfolioSolver(puzzle, configs=[
+        {'engine': 'restart', 'restart_unit': 1, 'seed': 0},
+        {'engine': 'dlx'},
+    ])
+    assert solver.solve_first(timeout=30) is None
+    assert solver.stats['winner'] is not None
+
+
+def test_timeout_cancels_workers():
+    puzzle = unsolvable_puzzle(8, 8)
+    solver = PortfolioSolver(puzzle, configs=[
+        {'engine': 'restart', 'propagation': 0, 'restart_unit': 10**9, 'seed': 0}])
+    with pytest.raises(TimeoutError):
+        solver.solve_first(timeout=0.5)
+    assert solver.stats['elapsed'] < 10
+
+
+def test_failed_configs_reported():
+    puzzle = generated_puzzle(3, 3, 2, 0)
+    solver = PortfolioSolver(puzzle, configs=[{'engine': 'restart', 'cell_order': 'diagonal'}])
+    with pytest.raises(RuntimeError):
+        solver.solve_first()
+    assert len(solver.stats['errors']) == 1
+    with pytest.raises(ValueError):
+        PortfolioSolver(puzzle, configs=[{'engine': 'quantum'}])
+
+
+def test_base_keywords(tmp_path):
+    """测试接受 PuzzleSolver 的关键字参数，最多只产生一个解"""
+    solver = PortfolioSolver(unique_seam_puzzle(4, 4), configs=[{'engine': 'backtrack'}])
+    assert len(list(solver.find_all_solutions(greedy=True))) == 1
+    assert solver.stats == {}
+    puzzle = generated_puzzle(3, 4, 1, 0)
+    solver = PortfolioSolver(puzzle, configs=[{'engine': 'backtrack'}])
+    assert len(list(solver.find_all_solutions(transposition=TranspositionTable()))) == 1
+    assert len(list(solver.find_all_solutions(checkpoint=str(tmp_path / "search.ckpt")))) == 1
+    slow = PortfolioSolver(unsolvable_puzzle(8, 8), configs=[
+        {'engine': 'restart', 'propagation': 0, 'restart_unit': 10**9, 'seed': 0}])
+    with pytest.raises(TimeoutError):
+        list(slow.find_all_solutions(timeout=0.5, greedy=False))
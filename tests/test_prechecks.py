@@ -0,0 +1,76 @@
+import pytest
+from src.models.direction import Direction
+from src.models.piece import JigsawPiece
+from src.solvers.dlx_solver import DancingLinksSolver
+from src.solvers.prechecks import find_infeasibility, required_class_counts
+from src.solvers.puzzle_solver import PuzzleSolver
+from tests.helpers import create_puzzle, generated_puzzle
+
+
+def _set_edge(piece, direction, value):
+    piece._edges[direction] = value
+
+
+@pytest.mark.parametrize("rows,cols", [(1, 1), (1, 3), (3, 1), (2, 2), (3, 4), (5, 5)])
+def test_solvable_puzzles_pass(rows, cols):
+    """测试可解的拼图不会被误判"""
+    assert find_infeasibility(create_puzzle(rows, cols)) is None
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_shuffled_puzzles_pass(seed):
+    assert PuzzleSolver(generated_puzzle(4, 5, 3, seed)).precheck() is None
+
+
+def test_required_class_counts():
+    assert required_class_counts(1, 1) == (1, 0, 0)
+    assert required_class_counts(1, 5) == (2, 3, 0)
+    assert required_class_counts(3, 4) == (4, 6, 2)
+
+
+def test_missing_piece():
+    puzzle = create_puzzle(3, 3)
+    puzzle.pieces.pop()
+    assert "少于位置数量" in find_infeasibility(puzzle)
+
+
+def test_class_counts():
+    puzzle = create_puzzle(3, 3)
+    puzzle.pieces[4].is_edge = True
+    assert "内部片数量为0" in find_infeasibility(puzzle)
+
+
+def test_border_not_flat():
+    puzzle = create_puzzle(3, 3)
+    _set_edge(puzzle.pieces[0], Direction.UP, 7)
+    assert "拼图片1无法旋转到外边缘为平边" in find_infeasibility(puzzle)
+
+
+def test_unmatched_edge_values():
+    puzzle = create_puzzle(3, 3)
+    _set_edge(puzzle.pieces[4], Direction.RIGHT, 99)
+    assert "无法全部配对" in find_infeasibility(puzzle)
+
+
+def test_zero_parity():
+    puzzle = create_puzzle(3, 3)
+    piece = puzzle.pieces[4]
+    _set_edge(piece, Direction.RIGHT, 0)
+    assert "无法两两配对" in find_infeasibility(puzzle)
+
+
+def test_extra_pieces_skip_exact_checks():
+    """测试拼图片多于位置时只做数量检查"""
+    puzzle = create_puzzle(2, 2)
+    puzzle.add_piece(JigsawPiece(99, {d: 5 for d in Direction}))
+    assert find_infeasibility(puzzle) is None
+
+
+@pytest.mark.parametrize("solver_class", [PuzzleSolver, DancingLinksSolver])
+def test_solvers_skip_search(solver_class):
+    """测试求解器在预检查失败时直接返回空结果"""
+    puzzle = generated_puzzle(6, 6, 1, 0)
+    _set_edge(puzzle.pieces[10], Direction.LEFT, 42)
+    solver = solver_class(puzzle)
+    assert solver.precheck() is not None
+    assert list(solver.find_all_solutions()) == []
@@ -123,4 +123,16 @@ def test_get_solution(puzzle_with_pieces):
     for piece_id, row, col, rotation in solution:
         piece = next(p for p in puzzle_with_pieces.pieces if p.id == piece_id)
         assert piece.position == (row, col)
-        assert piece.rotation == rotation 
\ No newline at end of file
+        assert piece.rotation == rotation 
+
+
+def test_remove_piece(puzzle_with_pieces):
+    """测试取下拼图片"""
+    piece = puzzle_with_pieces.pieces[0]
+    assert puzzle_with_pieces.place_piece(piece, 0, 0)
+    assert puzzle_with_pieces.is_on_board(piece.id)
+    assert puzzle_with_pieces.remove_piece(0, 0) is piece
+    assert puzzle_with_pieces.board[0][0] is None
+    assert not puzzle_with_pieces.is_on_board(piece.id)
+    assert puzzle_with_pieces.remove_piece(0, 0) is None
+    assert puzzle_with_pieces.remove_piece(5, 5) is None
@@ -0,0 +1,52 @@
+import io
+import pytest
+from src.models.direction import Direction
+from src.serialization.puzzle_codec import (
+    decode_puzzle,
+    encode_puzzle,
+    is_binary,
+    iter_decode_puzzles,
+    puzzle_from_dict,
+    puzzle_to_dict,
+)
+
+
+def _assert_same_puzzle(a, b):
+    assert (a.rows, a.cols) == (b.rows, b.cols)
+    assert len(a.pieces) == len(b.pieces)
+    for p, q in zip(a.pieces, b.pieces):
+        assert p.id == q.id
+        assert p.rotation == q.rotation
+        assert (p.is_corner, p.is_edge) == (q.is_corner, q.is_edge)
+        assert all(p.get_edge(d) == q.get_edge(d) for d in Direction)
+
+
+def test_dict_round_trip(simple_2x2_puzzle):
+    """测试字典格式的往返转换"""
+    simple_2x2_puzzle.pieces[1].rotate(90)
+    restored = puzzle_from_dict(puzzle_to_dict(simple_2x2_puzzle))
+    _assert_same_puzzle(simple_2x2_puzzle, restored)
+
+
+def test_binary_round_trip(simple_2x2_puzzle):
+    """测试二进制格式的往返转换"""
+    simple_2x2_puzzle.pieces[2].rotate(270)
+    data = encode_puzzle(simple_2x2_puzzle)
+    assert is_binary(data)
+    _assert_same_puzzle(simple_2x2_puzzle, decode_puzzle(data))
+
+
+def test_iter_decode_multiple(simple_2x2_puzzle):
+    """测试连续存放的多个二进制拼图"""
+    stream = io.BytesIO(encode_puzzle(simple_2x2_puzzle) * 3)
+    puzzles = list(iter_decode_puzzles(stream))
+    assert len(puzzles) == 3
+    for puzzle in puzzles:
+        _assert_same_puzzle(simple_2x2_puzzle, puzzle)
+
+
+def test_truncated_binary(simple_2x2_puzzle):
+    """测试不完整的二进制数据"""
+    data = encode_puzzle(simple_2x2_puzzle)
+    with pytest.raises(ValueError):
+        decode_puzzle(data[:-3])
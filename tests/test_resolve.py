@@ -0,0 +1,84 @@
+import random
+import pytest
+from src.generators.puzzle_generator import PuzzleGenerator
+from src.models.direction import Direction
+from src.models.piece import JigsawPiece
+from src.models.puzzle import JigsawPuzzle
+from src.solvers.puzzle_solver import PuzzleSolver
+
+
+@pytest.fixture
+def solved_puzzle():
+    """创建一个4x4拼图及其解决方案"""
+    random.seed(7)
+    puzzle = JigsawPuzzle(4, 4)
+    for piece in PuzzleGenerator().generate_solvable_puzzle(4, 4, edge_types=50):
+        puzzle.add_piece(piece)
+    solver = PuzzleSolver(puzzle)
+    return puzzle, next(solver.find_all_solutions(max_solutions=1))
+
+
+def _replace_piece(puzzle: JigsawPuzzle, piece_id: int, edges) -> None:
+    """模拟编辑器修改某个拼图片"""
+    index = next(i for i, p in enumerate(puzzle.pieces) if p.id == piece_id)
+    old = puzzle.pieces[index]
+    puzzle.pieces[index] = JigsawPiece(piece_id, dict(zip(Direction, edges)),
+                                       old.is_corner, old.is_edge)
+
+
+def _edges_of(puzzle: JigsawPuzzle, piece_id: int):
+    return next(p for p in puzzle.pieces if p.id == piece_id).edges_at(0)
+
+
+def _assert_valid(puzzle: JigsawPuzzle, solution) -> None:
+    assert solution is not None
+    assert PuzzleSolver(puzzle).apply_solution(solution)
+    assert puzzle.is_complete()
+
+
+def test_resolve_unchanged(solved_puzzle):
+    """测试拼图未修改时直接返回原解"""
+    puzzle, solution = solved_puzzle
+    assert PuzzleSolver(puzzle).resolve(solution) == solution
+
+
+def test_resolve_swapped_pieces(solved_puzzle):
+    """测试两个拼图片互换内容后局部修复"""
+    puzzle, solution = solved_puzzle
+    a, b = solution[5][0], solution[10][0]  # 两个内部拼图片
+    edges_a, edges_b = _edges_of(puzzle, a), _edges_of(puzzle, b)
+    _replace_piece(puzzle, a, edges_b)
+    _replace_piece(puzzle, b, edges_a)
+
+    repaired = PuzzleSolver(puzzle).resolve(solution, changed_pieces=[a, b])
+    _assert_valid(puzzle, repaired)
+    moved = {(row, col) for (pid, row, col, rot), old in zip(repaired, solution)
+             if (pid, rot) != (old[0], old[3])}
+    assert moved == {(1, 1), (2, 2)}
+
+
+def test_resolve_seam_change(solved_puzzle):
+    """测试修改一条接缝后局部修复"""
+    puzzle, solution = solved_puzzle
+    left_id, right_id = solution[5][0], solution[6][0]  # (1, 1) 和 (1, 2)
+    left = list(next(p for p in puzzle.pieces if p.id == left_id).edges_at(solution[5][3]))
+    right = list(next(p for p in puzzle.pieces if p.id == right_id).edges_at(solution[6][3]))
+    left[Direction.RIGHT.value], right[Direction.LEFT.value] = 999, -999
+    # 修改后的边缘值按旋转还原回原始方向
+    left_turns, right_turns = solution[5][3] // 90, solution[6][3] // 90
+    _replace_piece(puzzle, left_id, left[left_turns:] + left[:left_turns])
+    _replace_piece(puzzle, right_id, right[right_turns:] + right[:right_turns])
+
+    repaired = PuzzleSolver(puzzle).resolve(solution, changed_pieces=[left_id, right_id])
+    _assert_valid(puzzle, repaired)
+    assert repaired == solution
+
+
+def test_resolve_falls_back_when_unsolvable(solved_puzzle):
+    """测试局部修复失败且拼图无解时返回None"""
+    puzzle, solution = solved_puzzle
+    piece_id = solution[5][0]
+    edges = list(_edges_of(puzzle, piece_id))
+    edges[0] = 12345
+    _replace_piece(puzzle, piece_id, edges)
+    assert PuzzleSolver(puzzle).resolve(solution, changed_pieces=[piece_id]) is None
@@ -0,0 +1,74 @@
+import pytest
+from src.models.puzzle import JigsawPuzzle
+from src.solvers.puzzle_solver import PuzzleSolver
+from src.solvers.restart_search import RandomizedRestartSearch
+from tests.helpers import generated_puzzle, unsolvable_puzzle
+
+
+def _assert_valid(solver, solution):
+    assert solver.apply_solution(solution)
+    assert solver.puzzle.is_complete()
+
+
+@pytest.mark.parametrize("cell_order", RandomizedRestartSearch.CELL_ORDERS)
+@pytest.mark.parametrize("propagation", [0, 1])
+def test_finds_valid_solution(cell_order, propagation):
+    puzzle = generated_puzzle(5, 4, 2, 7)
+    solver = PuzzleSolver(puzzle)
+    all_solutions = {tuple(s) for s in solver.find_all_solutions(max_solutions=10**6, greedy=False)}
+    for seed in range(3):
+        search = RandomizedRestartSearch(solver, cell_order, propagation, restart_unit=8, seed=seed)
+        solution = search.solve()
+        assert tuple(solution) in all_solutions
+    _assert_valid(solver, solution)
+
+
+def test_spiral_covers_every_cell():
+    for rows, cols in ((1, 5), (4, 1), (3, 3), (4, 6), (7, 2)):
+        search = RandomizedRestartSearch(PuzzleSolver(JigsawPuzzle(rows, cols)), 'spiral')
+        assert sorted(search.order) == [(r, c) for r in range(rows) for c in range(cols)]
+
+
+def test_restarts_follow_luby_budget():
+    """测试预算很小时需要多次重启，且同一种子的结果可以复现"""
+    puzzle = generated_puzzle(5, 5, 1, 3)
+    first = RandomizedRestartSearch(PuzzleSolver(puzzle), restart_unit=1, seed=11)
+    second = RandomizedRestartSearch(PuzzleSolver(puzzle), restart_unit=1, seed=11)
+    assert first.solve() == second.solve()
+    assert first.stats['restarts'] > 1
+    assert first.stats == second.stats
+
+
+def test_unsolvable_is_proven():
+    """测试在预算内走完整棵搜索树时证明无解"""
+    puzzle = unsolvable_puzzle(4, 4)
+    assert PuzzleSolver(puzzle).precheck() is None
+    search = RandomizedRestartSearch(PuzzleSolver(puzzle), restart_unit=10**6, seed=0)
+    assert search.solve() is None
+    assert search.stats['exhausted']
+    assert search.stats['restarts'] == 1
+
+
+def test_max_restarts_and_timeout():
+    puzzle = generated_puzzle(4, 4, 1, 0)
+    search = RandomizedRestartSearch(PuzzleSolver(puzzle), restart_unit=1, seed=0)
+    assert search.solve(max_restarts=1) is None
+    assert not search.stats['exhausted']
+    with pytest.raises(TimeoutError):
+        RandomizedRestartSearch(PuzzleSolver(unsolvable_puzzle(8, 8)), restart_unit=10**9,
+                                propagation=0, seed=0).solve(timeout=0)
+
+
+def test_invalid_arguments():
+    solver = PuzzleSolver(generated_puzzle(2, 2, 1, 0))
+    with pytest.raises(ValueError):
+        RandomizedRestartSearch(solver, cell_order='diagonal')
+    with pytest.raises(ValueError):
+        RandomizedRestartSearch(solver, propagation=2)
+
+
+def test_find_first_solution():
+    puzzle = generated_puzzle(4, 5, 2, 1)
+    solver = PuzzleSolver(puzzle)
+    solution = solver.find_first_solution(seed=5, cell_order='spiral')
+    _assert_valid(solver, solution)
@@ -0,0 +1,62 @@
+import pytest
+from src.solvers.puzzle_solver import PuzzleSolver
+from src.solvers.row_chain_solver import RowChainSolver
+from src.solvers.transposition import TranspositionTable
+from tests.helpers import generated_puzzle
+
+
+def _solution_set(solutions):
+    return {tuple(solution) for solution in solutions}
+
+
+@pytest.mark.parametrize("meet_in_middle", [False, True])
+@pytest.mark.parametrize("rows,cols,edge_types,seed", [
+    (2, 5, 2, 0), (2, 2, 1, 0), (3, 3, 1, 1), (3, 4, 2, 2), (4, 4, 2, 3), (5, 2, 2, 4),
+])
+def test_same_solutions_as_dfs(rows, cols, edge_types, seed, meet_in_middle):
+    """测试与回溯搜索得到完全相同的解集合"""
+    puzzle = generated_puzzle(rows, cols, edge_types, seed)
+    expected = list(PuzzleSolver(puzzle).find_all_solutions(max_solutions=10**6))
+    solver = RowChainSolver(puzzle, meet_in_middle=meet_in_middle)
+    actual = list(solver.find_all_solutions(max_solutions=10**6))
+    assert len(actual) == len(expected)
+    assert _solution_set(actual) == _solution_set(expected)
+
+
+def test_rows_enumerated_once_per_kind():
+    """测试同类别的行位置共用一份行索引"""
+    solver = RowChainSolver(generated_puzzle(5, 3, 2, 7))
+    list(solver.find_all_solutions(max_solutions=10**6))
+    assert set(solver._rows_by_kind) <= {(True, False), (False, False), (False, True)}
+
+
+def test_limit_and_apply():
+    """测试解数量上限以及解可以直接应用"""
+    puzzle = generated_puzzle(3, 3, 1, 5)
+    solver = RowChainSolver(puzzle)
+    solutions = list(solver.find_all_solutions(max_solutions=2))
+    assert len(solutions) == 2
+    assert solver.apply_solution(solutions[0])
+    assert puzzle.is_complete()
+
+
+def test_unsolvable():
+    """测试无解的拼图"""
+    puzzle = generated_puzzle(3, 3, 5, 6)
+    puzzle.pieces.pop()
+    assert list(RowChainSolver(puzzle).find_all_solutions()) == []
+
+
+@pytest.mark.parametrize("meet_in_middle", [False, True])
+def test_base_keywords(tmp_path, meet_in_middle):
+    """测试接受 PuzzleSolver 的关键字参数"""
+    solver = RowChainSolver(generated_puzzle(3, 4, 1, 0), meet_in_middle=meet_in_middle)
+    assert len(list(solver.find_all_solutions(max_solutions=10**6, timeout=30, greedy=False))) == 88
+    assert len(list(solver.find_all_solutions(max_solutions=10**6,
+                                              transposition=TranspositionTable()))) == 88
+    path = str(tmp_path / "search.ckpt")
+    assert len(list(solver.find_all_solutions(max_solutions=5, checkpoint=path))) == 5
+    assert len(list(solver.find_all_solutions(max_solutions=10**6, resume_from=path))) == 83
+    slow = RowChainSolver(generated_puzzle(4, 5, 1, 2), meet_in_middle=meet_in_middle)
+    with pytest.raises(TimeoutError):
+        list(slow.find_all_solutions(max_solutions=10**8, timeout=0.2))
@@ -0,0 +1,47 @@
+from collections import Counter
+import pytest
+from src.solvers.puzzle_solver import PuzzleSolver
+from src.solvers.sampling import SolutionSampler
+from src.solvers.verification import verify_solutions
+from tests.helpers import generated_puzzle, unsolvable_puzzle
+
+
+def test_exact_counts_sample_uniformly():
+    """测试所有子树都能精确计数时，每个解被抽中的频率接近均匀"""
+    puzzle = generated_puzzle(3, 3, 1, 0)
+    solver = PuzzleSolver(puzzle)
+    solutions = {tuple(s) for s in solver.find_all_solutions(max_solutions=10**6, greedy=False)}
+    samples = solver.sample_solutions(50 * len(solutions), seed=0)
+    frequency = Counter(tuple(sample) for sample in samples)
+    assert set(frequency) == solutions
+    # 每个解期望50次，标准差约7
+    assert 20 <= min(frequency.values()) and max(frequency.values()) <= 85
+
+
+def test_estimated_counts_give_valid_solutions():
+    """测试子树超出计数预算时用估计值下降，得到的仍然是合法的解"""
+    puzzle = generated_puzzle(5, 5, 2, 0)
+    sampler = SolutionSampler(PuzzleSolver(puzzle), exact_nodes=50, particles=8, seed=1)
+    samples = [sampler.sample() for _ in range(5)]
+    assert all(verify_solutions(puzzle, samples)[0])
+    assert sampler.stats['samples'] == 5
+    assert sampler.stats['estimated'] > 0
+
+
+def test_seed_is_reproducible():
+    solver = PuzzleSolver(generated_puzzle(3, 4, 1, 0))
+    assert solver.sample_solutions(5, seed=3) == solver.sample_solutions(5, seed=3)
+
+
+def test_unsolvable_and_empty():
+    solver = PuzzleSolver(unsolvable_puzzle(4, 4))
+    assert solver.sample_solutions(3, seed=0) == []
+    assert PuzzleSolver(generated_puzzle(3, 3, 1, 0)).sample_solutions(0) == []
+    with pytest.raises(ValueError):
+        SolutionSampler(solver, exact_nodes=0)
+
+
+def test_timeout():
+    solver = PuzzleSolver(generated_puzzle(8, 8, 2, 0))
+    with pytest.raises(TimeoutError):
+        solver.sample_solutions(100, seed=0, timeout=0.01)
@@ -0,0 +1,126 @@
+import io
+import os
+import stat
+import sys
+import pytest
+from src.solvers.cdcl import CdclSolver, luby
+from src.solvers.puzzle_solver import PuzzleSolver
+from src.solvers.sat_solver import SatPuzzleSolver
+from src.solvers.transposition import TranspositionTable
+from tests.helpers import generated_puzzle
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 用内置求解器模拟一个输出 SAT competition 格式的外部求解器
+FAKE_SOLVER = f"""#!{sys.executable}
+import sys
+sys.path.insert(0, {ROOT!r})
+from src.solvers.cdcl import CdclSolver
+solver = CdclSolver()
+for line in open(sys.argv[1]):
+    if line.startswith(('p', 'c')) or not line.strip():
+        continue
+    solver.add_clause([int(t) for t in line.split()[:-1]])
+if solver.solve():
+    print("s SATISFIABLE")
+    print("v " + " ".join(map(str, solver.model())) + " 0")
+    sys.exit(10)
+print("s UNSATISFIABLE")
+sys.exit(20)
+"""
+
+
+def _solution_set(solutions):
+    return {tuple(solution) for solution in solutions}
+
+
+def test_luby_sequence():
+    """测试Luby序列"""
+    assert [luby(i) for i in range(1, 16)] == [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8]
+
+
+def test_cdcl_pigeonhole_unsat():
+    """测试内置求解器证明鸽巢问题不可满足"""
+    pigeons, holes = 6, 5
+    var = lambda p, h: p * holes + h + 1
+    solver = CdclSolver()
+    for p in range(pigeons):
+        solver.add_clause([var(p, h) for h in range(holes)])
+    for h in range(holes):
+        for a in range(pigeons):
+            for b in range(a + 1, pigeons):
+                solver.add_clause([-var(a, h), -var(b, h)])
+    assert solver.solve() is False
+
+
+def test_cdcl_blocking_enumeration():
+    """测试用阻塞子句枚举全部赋值"""
+    solver = CdclSolver(3)
+    solver.add_clause([1, 2, 3])
+    models = set()
+    while solver.solve():
+        model = solver.model()
+        models.add(tuple(model))
+        solver.add_clause([-lit for lit in model])
+    assert len(models) == 7
+
+
+@pytest.mark.parametrize("rows,cols,edge_types,seed", [(2, 2, 1, 0), (3, 3, 2, 1), (3, 4, 2, 2)])
+def test_same_solutions_as_dfs(rows, cols, edge_types, seed):
+    """测试内置求解器与回溯搜索得到相同的解集合"""
+    puzzle = generated_puzzle(rows, cols, edge_types, seed)
+    expected = list(PuzzleSolver(puzzle).find_all_solutions(max_solutions=10**6))
+    actual = list(SatPuzzleSolver(puzzle, backend='builtin').find_all_solutions(10**6))
+    assert _solution_set(actual) == _solution_set(expected)
+
+
+def test_solution_limit(simple_2x2_puzzle):
+    """测试解决方案数量限制和解的格式"""
+    solver = SatPuzzleSolver(simple_2x2_puzzle, backend='builtin')
+    solutions = list(solver.find_all_solutions(max_solutions=2))
+    assert len(solutions) == 2
+    for solution in solutions:
+        assert [(row, col) for _, row, col, _ in solution] == [(0, 0), (0, 1), (1, 0), (1, 1)]
+        assert solver.apply_solution(solution)
+
+
+def test_write_dimacs(simple_2x2_puzzle):
+    """测试DIMACS输出"""
+    buffer = io.StringIO()
+    cnf = SatPuzzleSolver(simple_2x2_puzzle, backend='builtin').write_dimacs(buffer)
+    lines = buffer.getvalue().splitlines()
+    assert lines[0] == f"p cnf {cnf.num_vars} {len(cnf.clauses)}"
+    assert len(lines) == len(cnf.clauses) + 1
+    assert all(line.endswith(" 0") for line in lines[1:])
+
+
+def test_external_backend(tmp_path):
+    """测试调用外部求解器"""
+    script = tmp_path / "fake-sat"
+    script.write_text(FAKE_SOLVER)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+
+    puzzle = generated_puzzle(3, 3, 2, 3)
+    expected = list(PuzzleSolver(puzzle).find_all_solutions(max_solutions=10**6))
+    actual = list(SatPuzzleSolver(puzzle, backend=str(script)).find_all_solutions(10**6))
+    assert _solution_set(actual) == _solution_set(expected)
+
+
+def test_missing_backend(simple_2x2_puzzle):
+    """测试指定的外部求解器不存在"""
+    with pytest.raises(ValueError):
+        SatPuzzleSolver(simple_2x2_puzzle, backend='no-such-sat-solver')
+
+
+def test_base_keywords(tmp_path):
+    """测试接受 PuzzleSolver 的关键字参数"""
+    solver = SatPuzzleSolver(generated_puzzle(3, 4, 1, 0), backend='builtin')
+    assert len(list(solver.find_all_solutions(max_solutions=10**6, timeout=30, greedy=False))) == 88
+    assert len(list(solver.find_all_solutions(max_solutions=10**6,
+                                              transposition=TranspositionTable()))) == 88
+    path = str(tmp_path / "search.ckpt")
+    assert len(list(solver.find_all_solutions(max_solutions=5, checkpoint=path))) == 5
+    assert len(list(solver.find_all_solutions(max_solutions=10**6, resume_from=path))) == 83
+    slow = SatPuzzleSolver(generated_puzzle(4, 5, 1, 2), backend='builtin')
+    with pytest.raises(TimeoutError):
+        list(slow.find_all_solutions(max_solutions=10**8, timeout=0.2))
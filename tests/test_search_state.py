@@ -0,0 +1,78 @@
+import random
+import pytest
+from src.solvers.puzzle_solver import PuzzleSolver
+from src.solvers.search_state import SearchState
+from src.solvers.transposition import TranspositionTable
+from tests.helpers import generated_puzzle
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_same_order_as_dfs(seed):
+    """测试显式栈搜索与回溯搜索按相同顺序产生相同的解"""
+    solver = PuzzleSolver(generated_puzzle(3, 4, 2, seed))
+    expected = list(solver.find_all_solutions(max_solutions=10**6, greedy=False))
+    assert list(SearchState(solver).search()) == expected
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_pause_and_split(seed):
+    """测试随机暂停和拆分子树后，所有子树的解合起来不重不漏"""
+    solver = PuzzleSolver(generated_puzzle(3, 4, 1, seed))
+    expected = list(SearchState(solver).search())
+    rng = random.Random(seed)
+    work = [SearchState(solver)]
+    found = []
+    while work:
+        state = rng.choice(work)
+        found.extend(state.search(max_nodes=rng.randint(1, 10)))
+        if state.finished:
+            work.remove(state)
+        elif rng.random() < 0.5:
+            item = state.split()
+            if item is not None:
+                work.append(SearchState(solver, *item))
+    assert len(found) == len(expected)
+    assert sorted(found) == sorted(expected)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_exclude_split_tails(seed):
+    """测试去掉被分出的子树后从头重新搜索，按相同顺序得到被拆分的搜索自己找到的解"""
+    solver = PuzzleSolver(generated_puzzle(3, 4, 1, seed))
+    rng = random.Random(seed)
+    state = SearchState(solver)
+    found, stolen = [], []
+    while not state.finished:
+        found.extend(state.search(max_nodes=rng.randint(1, 10)))
+        item = state.split()
+        if item is not None:
+            stolen.append((item[0], item[1]))
+    assert stolen
+    assert list(SearchState(solver, exclude=stolen).search()) == found
+
+
+def test_count_with_budget():
+    """测试计数可以按节点预算暂停并继续"""
+    solver = PuzzleSolver(generated_puzzle(3, 4, 1, 0))
+    expected = SearchState(solver).count()
+    state = SearchState(solver)
+    state.count(max_nodes=5)
+    assert not state.finished
+    assert state.count() == expected and state.finished
+
+
+def test_push_pop_and_key():
+    """测试手动逐层放置与撤销: 置换表的键只取决于子问题，撤销后恢复原来的键"""
+    solver = PuzzleSolver(generated_puzzle(3, 4, 1, 0))
+    state = SearchState(solver, table=TranspositionTable())
+    root = state.key()
+    first = state.candidates(0)[0]
+    state.push(first)
+    assert state.placements == [(first[0], 0, 0, first[1])]
+    child = state.key()
+    assert child != root
+    state.pop()
+    assert state.placements == [] and state.key() == root
+    prefixed = SearchState(solver, [(first[0], 0, 0, first[1])], table=state.table)
+    assert prefixed.key() == child
+    assert SearchState(solver).key() is None
@@ -0,0 +1,129 @@
+import http.client
+import json
+import threading
+import time
+import pytest
+from src.serialization.puzzle_codec import encode_puzzle, puzzle_to_dict
+from src.server.solve_server import SolveServer
+from src.server.worker_pool import SolverWorkerPool
+from tests.helpers import generated_puzzle
+
+
+@pytest.fixture(scope="module")
+def server():
+    """在本地随机端口上启动求解服务"""
+    with SolverWorkerPool(processes=2) as pool:
+        httpd = SolveServer(('127.0.0.1', 0), pool)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        yield httpd
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def _request(server, method, path, body=None, headers=None):
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=30)
+    conn.request(method, path, body=body, headers=headers or {})
+    response = conn.getresponse()
+    data = response.read()
+    conn.close()
+    return response.status, data
+
+
+def _lines(data):
+    return [json.loads(line) for line in data.decode('utf-8').splitlines()]
+
+
+def test_solve_json(server, simple_2x2_puzzle):
+    """测试提交JSON格式的拼图"""
+    body = json.dumps(puzzle_to_dict(simple_2x2_puzzle))
+    status, data = _request(server, 'POST', '/solve?max_solutions=2', body)
+    assert status == 200
+    lines = _lines(data)
+    solutions = [line['solution'] for line in lines if 'solution' in line]
+    assert 0 < len(solutions) <= 2
+    assert lines[-1] == {'puzzle': 0, 'done': True, 'count': len(solutions), 'error': None,
+                         'timed_out': False}
+    assert all(len(solution) == 4 for solution in solutions)
+
+
+def test_solve_binary_batch(server, simple_2x2_puzzle):
+    """测试一次提交多个二进制格式的拼图"""
+    body = encode_puzzle(simple_2x2_puzzle) * 3
+    status, data = _request(server, 'POST', '/solve?max_solutions=1', body,
+                            {'Content-Type': 'application/octet-stream'})
+    assert status == 200
+    done = [line for line in _lines(data) if line.get('done')]
+    assert sorted(line['puzzle'] for line in done) == [0, 1, 2]
+    assert all(line['count'] == 1 for line in done)
+
+
+def test_invalid_body(server):
+    """测试无效的请求体"""
+    status, data = _request(server, 'POST', '/solve', '{"rows": 2}')
+    assert status == 400
+    assert 'error' in json.loads(data)
+
+
+def test_stats(server, simple_2x2_puzzle):
+    """测试统计信息"""
+    _request(server, 'POST', '/solve', json.dumps(puzzle_to_dict(simple_2x2_puzzle)))
+    status, data = _request(server, 'GET', '/stats')
+    assert status == 200
+    stats = json.loads(data)
+    assert stats['workers'] == 2
+    assert stats['queue_depth'] == 0
+    assert stats['completed'] >= 1
+    assert stats['latency_ms']['p50'] is not None
+    assert stats['latency_ms']['p50'] <= stats['latency_ms']['p99']
+    assert stats['throughput_per_s'] > 0
+
+
+def test_worker_dies_mid_job():
+    """测试求解进程在任务中途退出时请求以错误结束，进程池换上新进程继续服务"""
+    # 解非常多的拼图，足够在求解中途终止进程
+    body = json.dumps(puzzle_to_dict(generated_puzzle(4, 5, 1, 2)))
+    with SolverWorkerPool(processes=1) as pool:
+        httpd = SolveServer(('127.0.0.1', 0), pool, poll_interval=0.1)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        try:
+            result = {}
+            request = threading.Thread(target=lambda: result.update(
+                response=_request(httpd, 'POST', '/solve?max_solutions=100000000', body)))
+            request.start()
+            deadline = time.monotonic() + 30
+            while pool.stats()['running'] == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            pool._workers[0].kill()
+            request.join(timeout=30)
+            assert not request.is_alive()
+            status, data = result['response']
+            assert status == 200
+            done = _lines(data)[-1]
+            assert done['done'] and '意外退出' in done['error']
+            assert pool.stats()['running'] == 0
+            status, data = _request(httpd, 'POST', '/solve?max_solutions=1', body)
+            assert _lines(data)[-1]['count'] == 1
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+
+
+@pytest.mark.parametrize("check_first", [True, False])
+def test_idle_workers_killed(check_first):
+    """测试空闲的求解进程被杀死后，新提交的任务由换上的进程完成"""
+    puzzle_data = puzzle_to_dict(generated_puzzle(3, 3, 2, 0))
+    with SolverWorkerPool(processes=2) as pool:
+        for process in pool._workers:
+            process.kill()
+            process.join()
+        if check_first:
+            pool.check_workers()
+        _, listener = pool.submit(puzzle_data, max_solutions=1)
+        kind, _, payload = listener.get(timeout=30)
+        while kind != 'done':
+            kind, _, payload = listener.get(timeout=30)
+        assert payload == {'count': 1, 'error': None, 'timed_out': False}
+        stats = pool.stats()
+        assert stats['queue_depth'] == 0 and stats['running'] == 0
+        assert pool.processes == 2
@@ -0,0 +1,46 @@
+import pytest
+from src.solvers.puzzle_solver import PuzzleSolver
+from src.solvers.shape_inference import (
+    candidate_shapes, classify_edges, infer_shapes, solve_any_shape
+)
+from tests.helpers import create_puzzle, generated_puzzle
+
+
+def _strip_flags(pieces):
+    flags = [(piece.is_corner, piece.is_edge) for piece in pieces]
+    for piece in pieces:
+        piece.is_corner = piece.is_edge = False
+    return flags
+
+
+@pytest.mark.parametrize("rows,cols", [(1, 1), (1, 2), (1, 5), (4, 1), (2, 2), (3, 5)])
+def test_classes_match_generated_flags(rows, cols, use_numpy):
+    """测试推断出的类型与构造时的标记一致"""
+    pieces = create_puzzle(rows, cols).pieces
+    flags = _strip_flags(pieces)
+    assert (rows, cols) in candidate_shapes(pieces)
+    assert [(piece.is_corner, piece.is_edge) for piece in pieces] == flags
+
+
+def test_classify_edges():
+    corner, edge = classify_edges([(0, 1, 2, 0), (0, 1, 0, -1), (0, 3, 4, 5), (1, 2, 3, 4), (0, 0, 0, 2)])
+    assert corner == [True, False, False, False, True]
+    assert edge == [False, True, True, False, False]
+
+
+def test_infer_shapes():
+    assert infer_shapes(12, 4, 6) == [(3, 4), (4, 3)]
+    assert infer_shapes(16, 4, 8) == [(4, 4)]
+    assert infer_shapes(16, 4, 6) == []
+    assert infer_shapes(6, 2, 4) == [(1, 6), (6, 1)]
+    assert infer_shapes(1, 1, 0) == [(1, 1)]
+
+
+def test_solve_any_shape():
+    """测试不知道大小时求解，结果与已知大小时一致"""
+    puzzle = generated_puzzle(3, 4, 2, 0)
+    expected = list(PuzzleSolver(puzzle).find_all_solutions(max_solutions=50))
+    _strip_flags(puzzle.pieces)
+    results = list(solve_any_shape(puzzle.pieces, max_solutions=50))
+    assert {shape for shape, _ in results} == {(3, 4)}
+    assert [solution for _, solution in results] == expected
@@ -0,0 +1,119 @@
+import random
+import pytest
+from src.generators.puzzle_generator import PuzzleGenerator
+from src.models.direction import Direction
+from src.models.piece import JigsawPiece
+from src.models.puzzle import JigsawPuzzle
+from src.solvers.puzzle_solver import PuzzleSolver
+from src.solvers.solution_cache import SolutionCache, canonical_key
+
+
+def _generated_puzzle(rows: int, cols: int, seed: int) -> JigsawPuzzle:
+    random.seed(seed)
+    puzzle = JigsawPuzzle(rows, cols)
+    for piece in PuzzleGenerator().generate_solvable_puzzle(rows, cols, edge_types=2):
+        puzzle.add_piece(piece)
+    return puzzle
+
+
+def _relabelled(puzzle: JigsawPuzzle, offset: int) -> JigsawPuzzle:
+    """返回拼图片id改变、顺序和旋转被打乱的等价拼图"""
+    copy = JigsawPuzzle(puzzle.rows, puzzle.cols)
+    for piece in puzzle.pieces:
+        edges = dict(zip(Direction, piece.edges_at(0)))
+        copy.add_piece(JigsawPiece(piece.id + offset, edges, piece.is_corner, piece.is_edge))
+    copy.shuffle()
+    return copy
+
+
+def _solution_set(solutions):
+    return {tuple(sorted(solution)) for solution in solutions}
+
+
+def test_key_invariance():
+    """测试哈希与拼图片顺序、旋转和id无关"""
+    puzzle = _generated_puzzle(3, 3, seed=1)
+    assert canonical_key(puzzle) == canonical_key(_relabelled(puzzle, 100))
+    assert canonical_key(puzzle) != canonical_key(_generated_puzzle(3, 3, seed=2))
+
+
+def test_cached_solutions_translate_to_caller():
+    """测试缓存的解决方案被转换为调用方的拼图片id和旋转"""
+    cache = SolutionCache()
+    puzzle = _generated_puzzle(3, 3, seed=3)
+    first = list(cache.find_all_solutions(PuzzleSolver(puzzle)))
+
+    other = _relabelled(puzzle, 100)
+    solver = PuzzleSolver(other)
+    cached = list(cache.find_all_solutions(solver))
+    assert cache.stats()['hits'] == 1
+    assert len(cached) == len(first)
+    assert _solution_set(cached) == _solution_set(solver.find_all_solutions())
+    for solution in cached:
+        assert solver.apply_solution(solution)
+        assert other.is_complete()
+
+
+def test_insufficient_entry_is_a_miss(simple_2x2_puzzle):
+    """测试缓存的解决方案不足时重新搜索"""
+    cache = SolutionCache()
+    solver = PuzzleSolver(simple_2x2_puzzle)
+    assert len(list(cache.find_all_solutions(solver, max_solutions=1))) == 1
+    assert len(list(cache.find_all_solutions(solver, max_solutions=1))) == 1
+    assert len(list(cache.find_all_solutions(solver, max_solutions=3))) == 3
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 2
+
+
+class _CountingSolver(PuzzleSolver):
+    """记录已经产生了多少个解的求解器"""
+
+    produced = 0
+
+    def find_all_solutions(self, *args, **kwargs):
+        for solution in super().find_all_solutions(*args, **kwargs):
+            self.produced += 1
+            yield solution
+
+
+def test_miss_streams_solutions(simple_2x2_puzzle):
+    """测试未命中时边求解边交出，提前停止的结果不写入缓存"""
+    cache = SolutionCache()
+    solver = _CountingSolver(simple_2x2_puzzle)
+    stream = cache.find_all_solutions(solver, max_solutions=3)
+    next(stream)
+    assert solver.produced == 1
+    stream.close()
+    assert cache.stats()['size'] == 0
+    assert len(list(cache.find_all_solutions(solver, max_solutions=3))) == 3
+    assert cache.stats()['size'] == 1
+
+
+def test_lru_eviction():
+    """测试超出容量时淘汰最久未使用的条目"""
+    cache = SolutionCache(maxsize=2)
+    puzzles = [_generated_puzzle(2, 3, seed=seed) for seed in range(3)]
+    for puzzle in puzzles:
+        list(cache.find_all_solutions(PuzzleSolver(puzzle), max_solutions=1))
+    assert cache.stats()['size'] == 2
+    list(cache.find_all_solutions(PuzzleSolver(puzzles[0]), max_solutions=1))
+    assert cache.stats()['misses'] == 4
+
+
+def test_disk_persistence(tmp_path):
+    """测试磁盘缓存可以被新的缓存实例读取"""
+    puzzle = _generated_puzzle(3, 3, seed=4)
+    list(SolutionCache(directory=str(tmp_path)).find_all_solutions(PuzzleSolver(puzzle)))
+
+    cache = SolutionCache(directory=str(tmp_path))
+    solver = PuzzleSolver(_relabelled(puzzle, 50))
+    solutions = list(cache.find_all_solutions(solver))
+    assert cache.stats()['disk_hits'] == 1
+    assert solutions
+    assert all(solver.apply_solution(solution) for solution in solutions)
+
+
+def test_invalid_size():
+    """测试无效的缓存容量"""
+    with pytest.raises(ValueError):
+        SolutionCache(maxsize=0)
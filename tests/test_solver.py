@@ -208,9 +208,9 @@ def multi_solution_puzzle():
 def test_solver_initialization(simple_puzzle):
     """测试求解器初始化"""
     solver = PuzzleSolver(simple_puzzle)
-    assert len(solver._corner_pieces) == 4
-    assert len(solver._edge_pieces) == 0
-    assert len(solver._inner_pieces) == 0
+    assert solver.puzzle is simple_puzzle
+    # 2x2拼图的每个位置都是角落，四个拼图片都是角落片
+    assert all(solver._check_edge_compatibility(piece, 0, 0, []) for piece in simple_puzzle.pieces)
 
 
 def test_check_edge_compatibility(edge_test_puzzle):
@@ -324,9 +324,13 @@ def test_simple_puzzle_validity(simple_puzzle):
 def test_solver_piece_classification(complex_puzzle):
     """测试求解器对拼图片的分类"""
     solver = PuzzleSolver(complex_puzzle)
-    assert len(solver._corner_pieces) == 4
-    assert len(solver._edge_pieces) == 4
-    assert len(solver._inner_pieces) == 1
+
+    def accepted(row, col):
+        return sum(solver._check_edge_compatibility(piece, row, col, []) for piece in complex_puzzle.pieces)
+
+    assert accepted(0, 0) == 4  # 角落片
+    assert accepted(0, 1) == 4  # 边缘片
+    assert accepted(1, 1) == 1  # 内部片
 
 
 
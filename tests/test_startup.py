@@ -0,0 +1,27 @@
+import pytest
+import src
+import src.solvers
+from benchmarks.bench_startup import cold_start, heavy_modules
+
+
+def test_lazy_attributes():
+    assert 'PuzzleSolver' in dir(src)
+    from src import JigsawPuzzle, PuzzleSolver
+    from src.solvers import TileSolver, canonical_key
+    assert PuzzleSolver.__module__ == 'src.solvers.puzzle_solver'
+    assert JigsawPuzzle.__module__ == 'src.models.puzzle'
+    assert TileSolver.__module__ == 'src.solvers.tile_solver'
+    assert callable(canonical_key)
+    with pytest.raises(AttributeError):
+        src.NoSuchSolver
+    with pytest.raises(ImportError):
+        from src.solvers import NoSuchSolver  # noqa: F401
+
+
+def test_cold_start_imports():
+    """测试新进程中 import src 加3x3求解不导入只有其他求解器才需要的模块
+
+    耗时预算由 benchmarks/bench_startup.py 检查，单元测试中的墙钟时间受机器负载影响太大
+    """
+    _, modules = cold_start(repeat=1)
+    assert heavy_modules(modules) == []
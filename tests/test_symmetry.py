@@ -0,0 +1,74 @@
+import inspect
+import sys
+import pytest
+from src.solvers.puzzle_solver import PuzzleSolver
+from src.solvers.symmetry import SymmetryReducedSolver
+from src.solvers.transposition import TranspositionTable
+from src.solvers.verification import verify_solutions
+from tests.helpers import generated_puzzle
+
+
+@pytest.mark.parametrize("rows,cols,edge_types,seed", [
+    (2, 2, 1, 0), (3, 3, 1, 0), (3, 3, 1, 1), (3, 4, 1, 0), (3, 3, 2, 0), (4, 4, 2, 0),
+])
+def test_same_solutions_as_backtracking(rows, cols, edge_types, seed):
+    """测试展开后的解集合与逐个拼图片回溯的结果相同"""
+    puzzle = generated_puzzle(rows, cols, edge_types, seed)
+    expected = sorted(PuzzleSolver(puzzle).find_all_solutions(max_solutions=10 ** 6, greedy=False))
+    solver = SymmetryReducedSolver(puzzle)
+    found = list(solver.find_all_solutions(max_solutions=10 ** 6))
+    assert sorted(found) == expected
+    assert len(set(map(tuple, found))) == len(found)
+    assert solver.count_solutions() == len(expected)
+
+
+def test_classes_merge_identical_pieces():
+    """测试类解比具体解少，且重数之和等于解的总数"""
+    puzzle = generated_puzzle(3, 4, 1, 0)
+    solver = SymmetryReducedSolver(puzzle)
+    assert len(solver.classes) < len(puzzle.pieces)
+    classes = list(solver.find_solution_classes(max_classes=10 ** 6))
+    assert len(classes) < solver.count_solutions()
+    assert sum(multiplicity for _, multiplicity in classes) == solver.count_solutions()
+    valid, _ = verify_solutions(puzzle, [solution for solution, _ in classes])
+    assert all(valid)
+
+
+def test_max_solutions():
+    """测试解的数量上限"""
+    solver = SymmetryReducedSolver(generated_puzzle(3, 4, 1, 0))
+    assert len(list(solver.find_all_solutions(max_solutions=5))) == 5
+    assert len(list(solver.find_solution_classes(max_classes=3))) == 3
+    assert list(solver.find_all_solutions(max_solutions=0)) == []
+
+
+def test_unsolvable():
+    """测试无解的拼图"""
+    puzzle = generated_puzzle(3, 3, 5, 6)
+    puzzle.pieces.pop()
+    solver = SymmetryReducedSolver(puzzle)
+    assert list(solver.find_all_solutions()) == []
+    assert solver.count_solutions() == 0
+
+
+def test_deep_search_without_recursion():
+    """测试搜索深度不受递归深度限制: 在只剩很少递归余量时求解64个位置的拼图"""
+    solver = SymmetryReducedSolver(generated_puzzle(8, 8, 200, 1))
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(len(inspect.stack(0)) + 30)
+    try:
+        solution = next(solver.find_all_solutions(max_solutions=1, greedy=False))
+    finally:
+        sys.setrecursionlimit(limit)
+    assert solver.apply_solution(solution)
+
+
+def test_base_keywords():
+    """测试接受 PuzzleSolver 的关键字参数"""
+    puzzle = generated_puzzle(3, 4, 1, 0)
+    solver = SymmetryReducedSolver(puzzle)
+    table = TranspositionTable()
+    assert solver.count_solutions(transposition=table) == 88
+    assert len(list(solver.find_all_solutions(max_solutions=10 ** 6, timeout=10, greedy=False))) == 88
+    with pytest.raises(TimeoutError):
+        list(SymmetryReducedSolver(generated_puzzle(4, 5, 1, 2)).find_all_solutions(10 ** 8, timeout=0.2))
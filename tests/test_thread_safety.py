@@ -0,0 +1,43 @@
+from concurrent.futures import ThreadPoolExecutor
+from src.solvers.puzzle_solver import PuzzleSolver
+from tests.helpers import generated_puzzle
+
+
+def test_search_does_not_touch_pieces():
+    """测试搜索过程不修改拼图片的旋转角度，也不在求解器上留下状态"""
+    puzzle = generated_puzzle(3, 4, 2, 0)
+    rotations = [piece.rotation for piece in puzzle.pieces]
+    solver = PuzzleSolver(puzzle)
+    attributes = set(vars(solver))
+    solutions = solver.find_all_solutions(max_solutions=10**6, greedy=False)
+    next(solutions)
+    assert [piece.rotation for piece in puzzle.pieces] == rotations
+    list(solutions)
+    assert [piece.rotation for piece in puzzle.pieces] == rotations
+    assert set(vars(solver)) == attributes
+
+
+def test_concurrent_solves_share_puzzle():
+    """测试多个线程同时求解同一个拼图(以及共享同一个求解器)得到相同的结果"""
+    puzzle = generated_puzzle(3, 4, 1, 2)
+    solver = PuzzleSolver(puzzle)
+    expected = list(solver.find_all_solutions(max_solutions=100, greedy=False))
+
+    def solve(i):
+        target = solver if i % 2 else PuzzleSolver(puzzle)
+        return list(target.find_all_solutions(max_solutions=100, greedy=False))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(solve, range(16)))
+    assert all(result == expected for result in results)
+
+
+def test_interleaved_generators():
+    """测试同一个求解器上交替推进的两次求解互不干扰"""
+    solver = PuzzleSolver(generated_puzzle(3, 4, 1, 1))
+    expected = list(solver.find_all_solutions(max_solutions=10**6, greedy=False))
+    first = solver.find_all_solutions(max_solutions=10**6, greedy=False)
+    second = solver.find_all_solutions(max_solutions=10**6, greedy=False)
+    merged = [pair for pair in zip(first, second)]
+    assert [a for a, _ in merged] == expected
+    assert [b for _, b in merged] == expected
@@ -0,0 +1,73 @@
+import pytest
+from src.solvers.puzzle_solver import PuzzleSolver
+from src.solvers.tile_solver import TileSolver
+from src.solvers.transposition import TranspositionTable
+from tests.helpers import generated_puzzle, unique_seam_puzzle, unsolvable_puzzle
+
+
+def _assert_valid(solver, solution):
+    assert solver.apply_solution(solution)
+    assert solver.puzzle.is_complete()
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_unique_seams(processes):
+    """测试接缝值唯一时分块拼接的结果与贪心拼接一致"""
+    puzzle = unique_seam_puzzle(20, 17, seed=3)
+    solver = TileSolver(puzzle, tile_size=(6, 5), processes=processes)
+    assert len(solver.tiles()) == 16
+    solutions = list(solver.find_all_solutions())
+    assert solutions == list(PuzzleSolver(puzzle).find_all_solutions(max_solutions=1))
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_duplicate_seams_repaired(seed):
+    """测试接缝值重复时子区域之间的冲突通过局部搜索修复"""
+    puzzle = generated_puzzle(6, 6, 3, seed)
+    solver = TileSolver(puzzle, tile_size=(3, 3), processes=1)
+    solutions = list(solver.find_all_solutions())
+    assert len(solutions) == 1
+    _assert_valid(solver, solutions[0])
+
+
+def test_single_tile_uses_full_solver(simple_2x2_puzzle):
+    """测试拼图不大于一个子区域时直接完整求解"""
+    solver = TileSolver(simple_2x2_puzzle)
+    assert len(solver.tiles()) == 1
+    _assert_valid(solver, next(solver.find_all_solutions()))
+
+
+def test_invalid_tile_size(simple_2x2_puzzle):
+    with pytest.raises(ValueError):
+        TileSolver(simple_2x2_puzzle, tile_size=(0, 4))
+
+
+def test_repair_budget_falls_back(monkeypatch):
+    """测试局部修复超过节点上限时退回到完整求解"""
+    calls = []
+    repair = PuzzleSolver._repair_layout
+
+    def counting_repair(self, *args, **kwargs):
+        calls.append(args)
+        return repair(self, *args, **kwargs)
+
+    monkeypatch.setattr(PuzzleSolver, '_repair_layout', counting_repair)
+    monkeypatch.setattr(TileSolver, 'REPAIR_NODE_LIMIT', 0)
+    puzzle = generated_puzzle(6, 6, 3, 0)
+    solver = TileSolver(puzzle, tile_size=(3, 3), processes=1)
+    solutions = list(solver.find_all_solutions())
+    assert calls and len(solutions) == 1
+    _assert_valid(solver, solutions[0])
+
+
+def test_base_keywords(tmp_path):
+    """测试接受 PuzzleSolver 的关键字参数，最多只产生一个解"""
+    puzzle = generated_puzzle(6, 6, 3, 1)
+    solver = TileSolver(puzzle, tile_size=(3, 3), processes=1)
+    assert len(list(solver.find_all_solutions(timeout=30, greedy=False))) == 1
+    assert len(list(solver.find_all_solutions(transposition=TranspositionTable()))) == 1
+    path = str(tmp_path / "search.ckpt")
+    assert len(list(solver.find_all_solutions(checkpoint=path))) == 1
+    slow = TileSolver(unsolvable_puzzle(8, 8), tile_size=(4, 4), processes=1)
+    with pytest.raises(TimeoutError):
+        list(slow.find_all_solutions(timeout=0.2))
@@ -0,0 +1,67 @@
+import pytest
+from src.solvers.puzzle_solver import PuzzleSolver
+from src.solvers.search_state import SearchState
+from src.solvers.transposition import TranspositionTable
+from tests.helpers import generated_puzzle
+
+
+def test_lru_eviction_and_stats():
+    table = TranspositionTable(capacity=2)
+    table.store(1, 0)
+    table.store(2, 5)
+    assert table.get(1) == 0       # 1 变为最近使用
+    table.store(3, 7)              # 淘汰最久未使用的 2
+    assert table.get(2) is None
+    assert table.get(3) == 7
+    assert len(table) == 2
+    assert table.stats == {'size': 2, 'capacity': 2, 'hits': 2, 'misses': 1,
+                           'hit_rate': pytest.approx(2 / 3), 'stores': 3, 'evictions': 1}
+    assert table.zobrist('cell', 1) == TranspositionTable(seed=0).zobrist('cell', 1)
+    with pytest.raises(ValueError):
+        TranspositionTable(capacity=0)
+
+
+@pytest.mark.parametrize("rows,cols,edge_types,seed", [(3, 4, 1, 0), (4, 4, 2, 3), (3, 5, 1, 2)])
+@pytest.mark.parametrize("capacity", [16, 1 << 20])
+def test_same_solutions_with_table(rows, cols, edge_types, seed, capacity):
+    """测试使用置换表(包括频繁淘汰的小容量表)时解的集合和顺序不变"""
+    solver = PuzzleSolver(generated_puzzle(rows, cols, edge_types, seed))
+    expected = list(solver.find_all_solutions(max_solutions=10**6, greedy=False))
+    table = TranspositionTable(capacity=capacity)
+    actual = list(solver.find_all_solutions(max_solutions=10**6, greedy=False, transposition=table))
+    assert actual == expected
+    assert table.hits > 0
+    assert solver.count_solutions(TranspositionTable(capacity=capacity)) == len(expected)
+
+
+def test_count_reuses_subproblems():
+    """测试同一个子问题在不同前缀下只搜索一次"""
+    solver = PuzzleSolver(generated_puzzle(4, 4, 1, 0))
+    expected = len(list(solver.find_all_solutions(max_solutions=10**6, greedy=False)))
+    plain = SearchState(solver)
+    list(plain.search())
+    table = TranspositionTable()
+    cached = SearchState(solver, table=table)
+    assert cached.count() == expected
+    assert cached.nodes * 5 < plain.nodes
+    # 再次计数时第一个位置之后的子问题都已记录在表中
+    again = SearchState(solver, table=table)
+    assert again.count() == expected
+    assert again.nodes == len(again.candidates(0))
+
+
+def test_split_with_shared_table():
+    """测试分出的子树与原搜索共享置换表时解不重不漏"""
+    solver = PuzzleSolver(generated_puzzle(3, 4, 1, 0))
+    expected = {tuple(s) for s in solver.find_all_solutions(max_solutions=10**6, greedy=False)}
+    table = TranspositionTable()
+    states = [SearchState(solver, table=table)]
+    found = []
+    while any(not state.finished for state in states):
+        for state in list(states):
+            found.extend(state.search(max_nodes=7))
+            item = state.split()
+            if item is not None:
+                states.append(SearchState(solver, *item, table=table))
+    assert sorted(map(tuple, found)) == sorted(expected)
+    assert len(found) == len(expected)
@@ -0,0 +1,93 @@
+import random
+import pytest
+from src.models.direction import Direction
+from src.solvers import verification
+from src.solvers.puzzle_solver import PuzzleSolver
+from src.solvers.verification import verify_solutions
+from tests.helpers import generated_puzzle
+
+
+def _solved(rows, cols, edge_types=2, seed=0):
+    puzzle = generated_puzzle(rows, cols, edge_types, seed)
+    solutions = list(PuzzleSolver(puzzle).find_all_solutions(max_solutions=50))
+    return puzzle, solutions
+
+
+def _replace(solution, index, **changes):
+    fields = dict(zip(('piece_id', 'row', 'col', 'rotation'), solution[index]))
+    fields.update(changes)
+    result = list(solution)
+    result[index] = (fields['piece_id'], fields['row'], fields['col'], fields['rotation'])
+    return result
+
+
+def test_valid_solutions(use_numpy):
+    """测试求解器找到的解全部有效"""
+    puzzle, solutions = _solved(3, 4, edge_types=1)
+    valid, failures = verify_solutions(puzzle, solutions)
+    assert len(solutions) > 1
+    assert valid == [True] * len(solutions)
+    assert failures == [None] * len(solutions)
+
+
+def test_first_failure(use_numpy):
+    """测试每类错误报告的原因和位置"""
+    puzzle, solutions = _solved(3, 3, seed=1)
+    solution = solutions[0]
+    (first_id, _, _, first_rotation), (second_id, _, _, _) = solution[0], solution[1]
+    cases = [
+        (solution[:-1], ('cell', 2, 2, None)),
+        (_replace(solution, 3, row=0, col=0), ('cell', 0, 0, None)),
+        (_replace(solution, 3, row=3), ('cell', 3, 0, None)),
+        (_replace(solution, 4, piece_id=999), ('piece', 1, 1, None)),
+        (_replace(solution, 4, rotation=45), ('piece', 1, 1, None)),
+        (_replace(solution, 5, piece_id=second_id), ('duplicate', 1, 2, None)),
+        (_replace(solution, 0, rotation=first_rotation + 90), ('border', 0, 0, Direction.LEFT)),
+        (_replace(solution, 4, rotation=solution[4][3] + 180), ('seam', 0, 1, Direction.DOWN)),
+    ]
+    valid, failures = verify_solutions(puzzle, [case for case, _ in cases])
+    assert valid == [False] * len(cases)
+    assert failures == [expected for _, expected in cases]
+    assert first_id != second_id
+
+
+def test_matches_apply_solution(use_numpy):
+    """测试随机打乱位置和旋转后的结果与 apply_solution 一致"""
+    puzzle, solutions = _solved(4, 4, seed=3)
+    rng = random.Random(0)
+    candidates = []
+    for _ in range(200):
+        solution = list(rng.choice(solutions))
+        for _ in range(rng.randrange(3)):
+            i, j = rng.randrange(len(solution)), rng.randrange(len(solution))
+            (a, row_a, col_a, rot_a), (b, row_b, col_b, rot_b) = solution[i], solution[j]
+            solution[i], solution[j] = (b, row_a, col_a, rot_b), (a, row_b, col_b, rot_a)
+        if rng.random() < 0.5:
+            i = rng.randrange(len(solution))
+            solution = _replace(solution, i, rotation=rng.choice((0, 90, 180, 270)))
+        candidates.append(solution)
+
+    valid, _ = verify_solutions(puzzle, iter(candidates), chunk_size=7)
+    expected = [PuzzleSolver(puzzle).apply_solution(solution) for solution in candidates]
+    assert valid == expected
+    assert any(valid) and not all(valid)
+
+
+def test_backends_agree(monkeypatch):
+    """测试 numpy 实现与纯Python实现的结果相同"""
+    if verification.np is None:
+        pytest.skip("未安装 numpy")
+    puzzle, solutions = _solved(3, 3, seed=4)
+    rng = random.Random(1)
+    candidates = [[(rng.choice([p[0], 0]), p[1], p[2], rng.choice((p[3], 90, 270))) for p in solution]
+                  for solution in solutions * 20]
+    expected = verify_solutions(puzzle, candidates)
+    monkeypatch.setattr(verification, 'np', None)
+    assert verify_solutions(puzzle, candidates) == expected
+
+
+def test_chunk_size():
+    puzzle, _ = _solved(2, 2)
+    with pytest.raises(ValueError):
+        verify_solutions(puzzle, [], chunk_size=0)
+    assert verify_solutions(puzzle, []) == ([], [])